@@ -65,7 +65,6 @@ import warnings as _warnings
 from pathlib import Path as _Path
 
 import CoolProp.CoolProp as _CP
-from ctREFPROP.ctREFPROP import REFPROPFunctionLibrary as _REFPROPFunctionLibrary
 
 # use _ to avoid polluting the namespace when importing
 
@@ -79,11 +78,20 @@ except KeyError:
         _path = _Path.cwd()
 
 _CP.set_config_string(_CP.ALTERNATIVE_REFPROP_PATH, str(_path))
-try:
-    _RP = _REFPROPFunctionLibrary(_path)
-    _RP.SETPATHdll(str(_path))
-except TypeError:
-    _RP = _REFPROPFunctionLibrary
+
+
+def _load_refprop():
+    """Load the REFPROP library used for direct calls (ccp._RP)."""
+    from ctREFPROP.ctREFPROP import REFPROPFunctionLibrary
+
+    try:
+        refprop = REFPROPFunctionLibrary(_path)
+        refprop.SETPATHdll(str(_path))
+    except TypeError:
+        refprop = REFPROPFunctionLibrary
+
+    return refprop
+
 
 if _os.name == "posix":
     _shared_library = "librefprop.so"
@@ -97,26 +105,33 @@ if not _library_path.is_file():
 
 __version__ = "0.3.6"
 
-__version__full = (
-    f"ccp: {__version__} | "
-    + f'CP : {_CP.get_global_param_string("version")} | '
-    + f'REFPROP : {_CP.get_global_param_string("REFPROP_version")}'
-)
+
+def __getattr__(name):
+    # the REFPROP library, the full version (which loads REFPROP in CoolProp) and
+    # Evaluation (sklearn, tqdm, pandas) are only loaded when first used
+    if name == "_RP":
+        value = _load_refprop()
+    elif name == "__version__full":
+        value = (
+            f"ccp: {__version__} | "
+            + f'CP : {_CP.get_global_param_string("version")} | '
+            + f'REFPROP : {_CP.get_global_param_string("REFPROP_version")}'
+        )
+    elif name == "Evaluation":
+        from .evaluation import Evaluation as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
 
 ###############################################################################
 # pint
 ###############################################################################
-import pint as _pint
-
-_new_units = _Path(__file__).parent / "config/new_units.txt"
-ureg = _pint.get_application_registry()
-if isinstance(ureg.get(), _pint.registry.LazyRegistry):
-    ureg = _pint.UnitRegistry()
-    ureg.load_definitions(str(_new_units))
-    # set ureg to make pickle possible
-    _pint.set_application_registry(ureg)
+# the unit registry is created in ccp.config.units
+from .config.units import ureg, Q_
 
-Q_ = ureg.Quantity
 _warnings.filterwarnings("ignore", message="The unit of the quantity is stripped")
 
 ###############################################################################
@@ -133,21 +148,24 @@ _pio.templates.default = "ccp"
 ###############################################################################
 
 from .config.fluids import fluid_list
-from .state import State
-from .point import Point
+from .mixture import Mixture
+from .state import State, StateArray
+from .point import Point, PointArray
 from .curve import Curve
 from .impeller import Impeller, impeller_example
 from .fo import FlowOrifice
 from .similarity import check_similarity
-from .evaluation import Evaluation
 
 __all__ = [
     "State",
+    "StateArray",
     "Point",
+    "PointArray",
     "Curve",
     "Impeller",
     "FlowOrifice",
     "fluid_list",
+    "Mixture",
     "check_similarity",
     "impeller_example",
     "Evaluation",
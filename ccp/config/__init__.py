@@ -1,2 +1,32 @@
 POLYTROPIC_METHOD = "schultz"
 EOS = "REFPROP"
+# source EOS used to build property tables when EOS="TABLE". The table for each
+# fluid composition is built on the first TABLE state, with about 4400 flashes
+# of the source EOS (63 x 63 nodes and the error samples), which can take
+# minutes for multicomponent mixtures (see also TABLE_DIR)
+TABLE_EOS = "REFPROP"
+# directory where property tables are saved (None to keep them only in memory,
+# e.g. Path.home() / ".ccp" / "tables" to reuse them in other processes)
+TABLE_DIR = None
+# use the previous state as initial guess for p-T flashes of nearby states (HEOS).
+# The phase envelope of each fluid composition is built on the first warm started
+# flash, to check that the states are in the gas region.
+WARM_START = False
+# EOS used for transport properties (viscosity, conductivity) of cubic EOS
+TRANSPORT_EOS = "REFPROP"
+# directory where phase envelopes are saved (None to keep them only in memory)
+PHASE_ENVELOPE_DIR = None
+# cheap EOS used to converge nested solvers before polishing on the state EOS
+# (e.g. "PR"), None to solve only on the state EOS. Used by the discharge state
+# solvers (e.g. disch_from_suc_head_eff) and by head_reference and
+# head_reference_2017 with a fixed number of segments. The adaptive reference
+# integration (rtol) is not tiered, since each level already starts from the
+# efficiency of the previous one.
+TIERED_EOS = None
+# "pint" to calculate points with pint quantities, "si-fast" to calculate with
+# floats in SI units and convert to quantities only for the results.
+# "si-fast" applies only to Point objects calculated from suction, discharge,
+# flow and speed (and to their reynolds and mach numbers). Points calculated
+# with solvers (e.g. from head and efficiency), curves, impellers and
+# compressors are always calculated with pint quantities.
+UNITS_MODE = "pint"
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import List, Tuple
 from warnings import warn
 import CoolProp.CoolProp as CP
@@ -14,10 +15,6 @@ class Fluid:
         return f"{type(self).__name__}({self.name})"
 
 
-fluid_list = {
-    name: Fluid(name) for name in CP.get_global_param_string("fluids_list").split(",")
-}
-
 # Define possible names for each fluid
 fluid_aliases = {
     "n-Propane": ["propane", "n-propane", "npropane"],
@@ -48,17 +45,103 @@ fluid_aliases = {
     "EthylBenzene": ["ethylbenzene", "e-benzene", "ebenzene"],
 }
 
-for fluid, aliases in fluid_aliases.items():
-    fluid_list[fluid].possible_names.extend(aliases)
+
+class _FluidList(Mapping):
+    """Mapping from CoolProp fluid names to Fluid objects.
+
+    The fluids, their possible names and the case-insensitive index used by
+    get_fluid_name are only created on the first access.
+    """
+
+    def __init__(self):
+        self._fluids = None
+        self._index = None
+        self._refprop_names = None
+
+    def _load(self):
+        fluids = {
+            name: Fluid(name)
+            for name in CP.get_global_param_string("fluids_list").split(",")
+        }
+        refprop_names = {}
+        for fluid in fluids.values():
+            fluid.possible_names.append(fluid.name.lower())
+            refprop_name = CP.get_fluid_param_string(fluid.name, "REFPROP_name")
+            refprop_names[fluid.name] = refprop_name
+            if (
+                refprop_name != "N/A"
+                and refprop_name.lower() not in fluid.possible_names
+            ):
+                fluid.possible_names.append(refprop_name.lower())
+
+        for fluid, aliases in fluid_aliases.items():
+            fluids[fluid].possible_names.extend(aliases)
+
+        # the first fluid with a possible name wins, as in a search in order
+        index = {}
+        for fluid in fluids.values():
+            for possible_name in fluid.possible_names:
+                index.setdefault(possible_name, fluid.name)
+
+        self._index = index
+        self._refprop_names = refprop_names
+        self._fluids = fluids
+
+    @property
+    def fluids(self):
+        if self._fluids is None:
+            self._load()
+        return self._fluids
+
+    @property
+    def index(self):
+        """Possible names (lower case) mapped to the CoolProp fluid name."""
+        if self._fluids is None:
+            self._load()
+        return self._index
+
+    @property
+    def refprop_names(self):
+        """CoolProp fluid names mapped to the REFPROP name ('N/A' if none)."""
+        if self._fluids is None:
+            self._load()
+        return self._refprop_names
+
+    def __getitem__(self, name):
+        return self.fluids[name]
+
+    def __iter__(self):
+        return iter(self.fluids)
+
+    def __len__(self):
+        return len(self.fluids)
+
+    def __repr__(self):
+        return repr(self.fluids)
+
+
+fluid_list = _FluidList()
 
 
 def get_fluid_name(name: str) -> str:
     """Search for a compatible fluid name."""
-    for fluid in fluid_list.values():
-        if name.lower() in fluid.possible_names:
-            return fluid.name
+    try:
+        return fluid_list.index[name.lower()]
+    except KeyError:
+        raise ValueError(f"Fluid {name} not available. See ccp.fluid_list.") from None
 
-    raise ValueError(f"Fluid {name} not available. See ccp.fluid_list.")
+
+def get_name(name: str) -> str:
+    """Get the name used to create the CoolProp/REFPROP state for a fluid.
+
+    REFPROP names are used when available (e.g. 'methane' -> 'METHANE'), since
+    they are accepted by all the backends.
+    """
+    fluid_name = get_fluid_name(name)
+    refprop_name = fluid_list.refprop_names[fluid_name]
+    if refprop_name == "N/A":
+        return fluid_name
+    return refprop_name
 
 
 def normalize_mix(molar_fractions: List[float]) -> List[float]:
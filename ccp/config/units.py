@@ -1,7 +1,8 @@
 """This module deals with units conversion in the ccp library."""
 import inspect
+import os
 import warnings
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 
 import pint
@@ -9,7 +10,9 @@ import pint
 new_units_path = Path(__file__).parent / "new_units.txt"
 ureg = pint.get_application_registry()
 if isinstance(ureg.get(), pint.registry.LazyRegistry):
-    ureg = pint.UnitRegistry()
+    # parsed definitions can be cached on disk to speed up the next imports by
+    # setting CCP_PINT_CACHE to a directory (":auto:" for the user cache directory)
+    ureg = pint.UnitRegistry(cache_folder=os.environ.get("CCP_PINT_CACHE"))
     ureg.load_definitions(str(new_units_path))
     # set ureg to make pickle possible
     pint.set_application_registry(ureg)
@@ -90,6 +93,58 @@ for i, unit in zip(["k", "c"], ["N/m", "N*s/m"]):
             units["".join([i, j, k])] = unit
 
 
+@lru_cache(maxsize=None)
+def _base_unit(arg_name):
+    """Base unit for an argument name, None if the argument is not converted.
+
+    The argument name is checked first, then 'flow_v'/'flow_m' and then each
+    part of the name split on '_'. Arguments with 'units' in the name are not
+    converted.
+    """
+    names = arg_name.split("_")
+    if "units" in names:
+        return None
+
+    # treat flow_v and flow_m separately
+    if "flow_v" in arg_name:
+        names.insert(0, "flow_v")
+    if "flow_m" in arg_name:
+        names.insert(0, "flow_m")
+
+    if arg_name not in names:
+        # check first for arg_name in units
+        names.insert(0, arg_name)
+    for name in names:
+        if name in units:
+            return ureg.Unit(units[name])
+
+    return None
+
+
+def _to_base_unit(value, unit):
+    """Convert value to unit.
+
+    Floats and arrays are returned as a pint.Quantity in unit and quantities
+    that are already in unit are returned without conversion.
+    """
+    if value is None:
+        return value
+    try:
+        value_units = value._units
+    except AttributeError:
+        try:
+            return Q_(value, unit)
+        except TypeError:
+            # Handle errors that we get with bool for example
+            return value
+    if value_units == unit._units:
+        return value
+    # For now, we only return the magnitude for the converted Quantity
+    # If pint is fully adopted by ross in the future, and we have all Quantities
+    # using it, we could remove this, which would allows us to use pint in its full capability
+    return value.to(unit)
+
+
 def check_units(func):
     """Wrapper to check and convert units to base_units.
     If we use the check_units decorator in a function the arguments are checked,
@@ -100,6 +155,7 @@ def check_units(func):
     will be split into ['inlet', 'pressure'], and since we have the name 'pressure'
     in the dictionary mapped to 'Pa', we will automatically convert the value to
     this default unit.
+    The unit of each argument is resolved once, when the function is decorated.
     For example:
     >>> units = {
     ... "L": "meter",
@@ -117,72 +173,29 @@ def check_units(func):
     0.0127
     """
 
+    spec = inspect.getfullargspec(func)
+    # base unit for each positional argument and for each argument name
+    args_units = [_base_unit(name) for name in spec.args]
+    kwargs_units = dict(zip(spec.args, args_units))
+    kwargs_units.update({name: _base_unit(name) for name in spec.kwonlyargs})
+    n_args = len(args_units)
+
     @wraps(func)
     def inner(*args, **kwargs):
-        base_unit_args = []
-        args_names = inspect.getfullargspec(func)[0]
-
-        for arg_name, arg_value in zip(args_names, args):
-            names = arg_name.split("_")
-            if "units" in names:
-                base_unit_args.append(arg_value)
-                continue
-
-            # treat flow_v and flow_m separately
-            if "flow_v" in arg_name:
-                names.insert(0, "flow_v")
-            if "flow_m" in arg_name:
-                names.insert(0, "flow_m")
-
-            if arg_name not in names:
-                # check first for arg_name in units
-                names.insert(0, arg_name)
-            for name in names:
-                if name in units and arg_value is not None:
-                    # For now, we only return the magnitude for the converted Quantity
-                    # If pint is fully adopted by ross in the future, and we have all Quantities
-                    # using it, we could remove this, which would allows us to use pint in its full capability
-                    try:
-                        base_unit_args.append(arg_value.to(units[name]))
-                    except AttributeError:
-                        try:
-                            base_unit_args.append(Q_(arg_value, units[name]))
-                        except TypeError:
-                            # Handle erros that we get with bool for example
-                            base_unit_args.append(arg_value)
-                    break
-            else:
-                base_unit_args.append(arg_value)
+        base_unit_args = [
+            arg if unit is None else _to_base_unit(arg, unit)
+            for arg, unit in zip(args, args_units)
+        ]
+        base_unit_args.extend(args[n_args:])
 
         base_unit_kwargs = {}
         for k, v in kwargs.items():
-            names = k.split("_")
-            if "units" in names:
-                base_unit_kwargs[k] = v
-                continue
-
-            # treat flow_v and flow_m separately
-            if "flow_v" in k:
-                names.insert(0, "flow_v")
-            if "flow_m" in k:
-                names.insert(0, "flow_m")
-
-            if k not in names:
-                # check first for arg_name in units
-                names.insert(0, k)
-            for name in names:
-                if name in units and v is not None:
-                    try:
-                        base_unit_kwargs[k] = v.to(units[name])
-                    except AttributeError:
-                        try:
-                            base_unit_kwargs[k] = Q_(v, units[name])
-                        except TypeError:
-                            # Handle errors that we get with bool for example
-                            base_unit_kwargs[k] = v
-                    break
-            else:
-                base_unit_kwargs[k] = v
+            try:
+                unit = kwargs_units[k]
+            except KeyError:
+                # keyword collected by **kwargs
+                unit = _base_unit(k)
+            base_unit_kwargs[k] = v if unit is None else _to_base_unit(v, unit)
 
         return func(*base_unit_args, **base_unit_kwargs)
 
@@ -16,3 +16,45 @@ def r_getattr(obj, attr, *args):
         return getattr(obj, attr, *args)
 
     return reduce(_getattr, [obj] + attr.split("."))
+
+
+class BindOnAccess:
+    """Class attribute that creates a function bound to the instance on access.
+
+    Used instead of setting a function for each instance, e.g.:
+    head_plot = BindOnAccess(plot_func, "head") returns plot_func(point, "head")
+    for point.head_plot, and only the class holds the descriptor.
+    Functions set in the instance (e.g. loaded from an old pickle) take precedence.
+    """
+
+    def __init__(self, factory, attr):
+        self.factory = factory
+        self.attr = attr
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self.factory(obj, self.attr)
+
+
+class cached_property:
+    """Property calculated on the first access and stored in the instance.
+
+    Same as functools.cached_property, which is only available in Python >= 3.8.
+    The value is stored in the instance __dict__, so the next accesses do not
+    call the descriptor and the attribute can be set or deleted as usual.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attr = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attr = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.attr] = self.func(obj)
+        return value
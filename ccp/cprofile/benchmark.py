@@ -0,0 +1,694 @@
+"""Benchmarks for main ccp operations.
+
+To use it:
+$ python benchmark.py <benchmark name>
+
+Run without arguments to execute all benchmarks.
+Results are printed as the mean time for each operation.
+"""
+import sys
+import time
+
+import ccp
+from ccp import Q_, State
+
+fluid_2 = {"methane": 0.5, "ethane": 0.5}
+
+fluid_10 = dict(
+    methane=0.69945,
+    ethane=0.09729,
+    propane=0.0557,
+    nbutane=0.0178,
+    ibutane=0.0102,
+    npentane=0.0039,
+    ipentane=0.0036,
+    n2=0.0149,
+    co2=0.09259,
+    h2s=0.00017,
+)
+
+
+def timeit(func, number=10):
+    """Mean time in ms for each call of func."""
+    t0 = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - t0) / number * 1e3
+
+
+def mixture_interning(number=10):
+    """Time to create a state (without flash) for a fluid composition that was
+    not seen before (cold) and for a composition already interned as a
+    ccp.Mixture (warm).
+
+    Only the resolution of the fluid names is reused. CoolProp cannot clone or
+    reset a backend, so a backend is created for each state in both cases
+    (temporary states reuse their backends with State.scratch, see
+    scratch_states). The time for a full state (construction and flash) is
+    also shown.
+    """
+    from ccp import Mixture
+
+    for name, fluid in [("2 components", fluid_2), ("10 components", fluid_10)]:
+
+        def cold():
+            Mixture._instances.clear()
+            State.__new__(State, fluid=fluid)
+
+        def warm():
+            State.__new__(State, fluid=fluid)
+
+        def full():
+            State(p=Q_(10, "bar"), T=Q_(40, "degC"), fluid=fluid)
+
+        print(
+            f"{name} ({ccp.config.EOS}): "
+            f"cold {timeit(cold, number):.3f} ms, "
+            f"warm {timeit(warm, number):.3f} ms, "
+            f"full state {timeit(full, number):.3f} ms"
+        )
+
+
+def property_cache(number=3):
+    """Time to calculate a point and hits/misses of the state property cache."""
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2)
+
+    State.cache_info_clear()
+    t = timeit(
+        lambda: ccp.Point(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1), number
+    )
+    print(f"point ({ccp.config.EOS}): {t:.3f} ms, cache: {State.cache_info()}")
+
+
+def polytropic_methods(number=3):
+    """Time to calculate head and efficiency with each polytropic method, using
+    the public functions (pint quantities) and the internal functions (floats),
+    and time to create a point with each method."""
+    from ccp import point
+
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2)
+
+    for method in ["schultz", "mallen_saville", "sandberg_colby", "huntington"]:
+        head = getattr(point, f"head_pol_{method}")
+        eff = getattr(point, f"eff_pol_{method}")
+        _head = getattr(point, f"_head_pol_{method}")
+        _eff = getattr(point, f"_eff_pol_{method}")
+        t_quantity = timeit(lambda: (head(suc, disch), eff(suc, disch)), number)
+        t_float = timeit(lambda: (_head(suc, disch), _eff(suc, disch)), number)
+        t_point = timeit(
+            lambda: ccp.Point(
+                suc=suc,
+                disch=disch,
+                flow_v=1,
+                speed=1,
+                b=1,
+                D=1,
+                polytropic_method=method,
+            ),
+            number,
+        )
+        print(
+            f"{method} ({ccp.config.EOS}): quantity {t_quantity:.3f} ms, "
+            f"float {t_float:.3f} ms, point {t_point:.3f} ms"
+        )
+
+
+def warm_start(number=50):
+    """Time to calculate a sequence of nearby states (e.g. time ordered data)
+    with and without the previous state as initial guess."""
+    import numpy as np
+
+    p = Q_(np.linspace(1.8, 2.0, number), "MPa")
+    T = Q_(np.linspace(310, 315, number), "K")
+
+    warm_start = ccp.config.WARM_START
+    for warm in [False, True]:
+        ccp.config.WARM_START = warm
+        State.flash_info_clear()
+        t0 = time.perf_counter()
+        ccp.StateArray(p=p, T=T, fluid=fluid_10)
+        t = (time.perf_counter() - t0) / number * 1e3
+        print(
+            f"warm start {warm} ({ccp.config.EOS}): {t:.3f} ms per state, "
+            f"flashes: {State.flash_info()}"
+        )
+    ccp.config.WARM_START = warm_start
+
+
+def ps_update(number=5):
+    """Time of a p-s update (isentropic compression) with the previous
+    implementation (scipy newton over p-T flashes) and the bracketed solver,
+    with and without warm start."""
+    import CoolProp.CoolProp as CP
+    from scipy.optimize import newton
+
+    fluid_3 = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    EOS = ccp.config.EOS
+    if EOS == "REFPROP":
+        # REFPROP uses the backend p-s flash
+        EOS = "HEOS"
+
+    for name, fluid in [
+        ("3 components", fluid_3),
+        ("2 components", fluid_2),
+        ("10 components", fluid_10),
+    ]:
+        suc = State(p=Q_(20, "bar"), T=Q_(30, "degC"), fluid=fluid, EOS=EOS)
+        p, s = 3 * suc.p().m, suc.s().m
+
+        def previous():
+            state = State(p=suc.p(), T=suc.T(), fluid=fluid, EOS=EOS)
+
+            def objective(T):
+                CP.AbstractState.update(state, CP.PT_INPUTS, p, T)
+                return state.smass() - s
+
+            newton(objective, x0=suc.T().m)
+
+        def bracketed():
+            state = State(p=suc.p(), T=suc.T(), fluid=fluid, EOS=EOS)
+            state.update(p=p, s=s)
+
+        results = []
+        warm_start = ccp.config.WARM_START
+        for warm in [False, True]:
+            ccp.config.WARM_START = warm
+            # discount the state creation
+            create = timeit(
+                lambda: State(p=suc.p(), T=suc.T(), fluid=fluid, EOS=EOS), number
+            )
+            results.append(
+                (timeit(previous, number) - create, timeit(bracketed, number) - create)
+            )
+        ccp.config.WARM_START = warm_start
+
+        print(
+            f"{name} ({EOS}): newton {results[0][0]:.3f} ms, "
+            f"bracketed {results[0][1]:.3f} ms, "
+            f"bracketed + warm start {results[1][1]:.3f} ms"
+        )
+
+
+def scratch_states(number=3):
+    """Number of states allocated and time to calculate a point and the Schultz
+    factor, with scratch states for the temporary calculations."""
+    from ccp import point
+
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2)
+
+    allocated = 0
+    state_new = State.__new__
+
+    def counting_new(cls, *args, **kwargs):
+        nonlocal allocated
+        allocated += 1
+        return state_new(cls, *args, **kwargs)
+
+    State.__new__ = counting_new
+    try:
+        for name, func in [
+            (
+                "point",
+                lambda: ccp.Point(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1),
+            ),
+            ("f_schultz", lambda: point._f_schultz(suc, disch)),
+        ]:
+            allocated = 0
+            State.scratch_info_clear()
+            t = timeit(func, number)
+            print(
+                f"{name} ({ccp.config.EOS}): {t:.3f} ms, "
+                f"states allocated per call: {allocated / number:.1f}, "
+                f"scratch: {State.scratch_info()}"
+            )
+    finally:
+        State.__new__ = state_new
+
+
+def cubic_eos_point(number=3):
+    """Time to calculate a point with a cubic EOS, where the viscosity used for
+    the Reynolds number is calculated with ccp.config.TRANSPORT_EOS."""
+    for EOS in ["PR", "SRK"]:
+        suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2, EOS=EOS)
+        disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2, EOS=EOS)
+
+        t = timeit(
+            lambda: ccp.Point(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1),
+            number,
+        )
+        print(f"point ({EOS}, transport {ccp.config.TRANSPORT_EOS}): {t:.3f} ms")
+
+
+def lazy_states(number=20):
+    """Time to create and pickle states that are not queried (e.g. inputs sent
+    to worker processes), with and without lazy construction."""
+    import pickle
+
+    for lazy in [False, True]:
+
+        def create():
+            state = State(p=Q_(10, "bar"), T=Q_(40, "degC"), fluid=fluid_10, lazy=lazy)
+            pickle.loads(pickle.dumps(state))
+
+        print(f"lazy {lazy} ({ccp.config.EOS}): {timeit(create, number):.3f} ms")
+
+
+def pickle_roundtrip(number=5):
+    """Pickle round trip time and payload size for a state, a point and an
+    impeller with 50 points."""
+    import pickle
+
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2)
+    point = ccp.Point(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1)
+
+    points = []
+    for speed in [800, 900, 1000, 1100, 1200]:
+        for i in range(10):
+            disch = State(
+                p=Q_(5 + 0.1 * i + speed / 1000, "bar"), T=400 + i, fluid=fluid_2
+            )
+            points.append(
+                ccp.Point(
+                    suc=suc, disch=disch, flow_v=1 + 0.1 * i, speed=speed, b=1, D=1
+                )
+            )
+    impeller = ccp.Impeller(points)
+
+    for name, obj, n in [
+        ("state", suc, number),
+        ("point", point, number),
+        ("impeller (50 points)", impeller, 1),
+    ]:
+        size = len(pickle.dumps(obj))
+        t = timeit(lambda: pickle.loads(pickle.dumps(obj)), n)
+        print(f"{name} ({ccp.config.EOS}): {t:.3f} ms, {size} bytes")
+
+
+def dew_point_margin(number=1000):
+    """Time to calculate the dew point margin for a series of conditions, with a
+    phase envelope built for each condition and with the cached envelope."""
+    import numpy as np
+    import CoolProp.CoolProp as CP
+    from ccp import phase_envelope
+
+    p = np.linspace(2e6, 4e6, number)
+    T = np.linspace(290, 310, number)
+    state = State(p=p[0], T=T[0], fluid=fluid_10)
+    backend = CP.AbstractState(state.EOS or ccp.config.EOS, state._fluid)
+    backend.set_mole_fractions(state.mixture.fractions)
+
+    def each_row():
+        for p_i, T_i in zip(p[:10], T[:10]):
+            backend.build_phase_envelope("dummy")
+            data = backend.get_phase_envelope_data()
+            envelope = phase_envelope.PhaseEnvelope(state.fluid, "", data.T, data.p)
+            envelope.dew_point_margin(p_i, T_i)
+
+    def cached():
+        state.dew_point_margin(p=p, T=T)
+
+    phase_envelope._envelopes.clear()
+    t_first = timeit(cached, 1)
+    print(
+        f"{number} conditions ({ccp.config.EOS}): "
+        f"envelope for each condition {timeit(each_row, 1) / 10 * number:.3f} ms, "
+        f"first call {t_first:.3f} ms, cached {timeit(cached, 10):.3f} ms"
+    )
+
+
+def tiered_eos(number=1, cheap_EOS="PR"):
+    """Time and residual evaluations for each EOS of the nested solvers, solving
+    only on the state EOS and converging first on a cheap EOS."""
+    from ccp import point
+
+    suc = State(p=Q_(20, "bar"), T=Q_(30, "degC"), fluid=fluid_10)
+    disch = State(p=Q_(50, "bar"), T=Q_(120, "degC"), fluid=fluid_10)
+    head = point.head_pol_schultz(suc, disch)
+    eff = point.eff_pol_schultz(suc, disch)
+
+    solvers = [
+        (
+            "disch_from_suc_head_eff",
+            lambda: point.disch_from_suc_head_eff(suc, head, eff),
+        ),
+        (
+            "disch_from_suc_disch_T_head",
+            lambda: point.disch_from_suc_disch_T_head(suc, disch.T(), head),
+        ),
+        (
+            "point from eff, phi, psi, volume ratio",
+            lambda: ccp.Point(
+                suc=suc,
+                eff=eff,
+                phi=0.1,
+                psi=0.8,
+                volume_ratio=suc.rho() / disch.rho(),
+                b=0.03,
+                D=0.4,
+            ),
+        ),
+        ("head_reference", lambda: point.head_reference(suc, disch, num_steps=20)),
+    ]
+    for name, func in solvers:
+        results = []
+        for tiered in [None, cheap_EOS]:
+            ccp.config.TIERED_EOS = tiered
+            point.solver_info_clear()
+            results.append((timeit(func, number), point.solver_info()))
+        ccp.config.TIERED_EOS = None
+
+        print(
+            f"{name} ({ccp.config.EOS}): {results[0][0]:.3f} ms, "
+            f"iterations {results[0][1]} | tiered on {cheap_EOS}: "
+            f"{results[1][0]:.3f} ms, iterations {results[1][1]}"
+        )
+
+
+def refprop_fallback(number=3, size=100):
+    """Time for the REFPROP cp fallback of a CO2 rich gas near the critical
+    point, calling REFPROP for one state at a time (fluid string and mole
+    fractions for each call) and for all states with a single setup."""
+    import numpy as np
+    from ccp import _RP
+    from ccp.state import refprop_flash
+
+    fluid = {"co2": 0.9, "methane": 0.1}
+    p = np.linspace(7e6, 9e6, size)
+    T = np.linspace(300, 310, size)
+    z = list(ccp.Mixture(fluid).fractions)
+
+    def single():
+        for p_i, T_i in zip(p, T):
+            fluids = ccp.Mixture(fluid).backend_string.replace("&", "*")
+            _RP.REFPROPdll(
+                fluids, "PTV", "Cp", _RP.MASS_BASE_SI, 0, 0, p_i, T_i, list(z)
+            )
+
+    def batch():
+        refprop_flash(fluid, "PTV", "Cp", p, T)
+
+    print(
+        f"{size} states: single {timeit(single, number):.3f} ms, "
+        f"batch {timeit(batch, number):.3f} ms"
+    )
+
+
+def check_units(number=1000):
+    """Overhead of the check_units wrapper for State.update and Point
+    construction, with floats and quantities as arguments, compared with a
+    call to the unwrapped function with quantities in base units."""
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2)
+    p = Q_(183900, "Pa")
+    T = Q_(291.5, "degK")
+    update = State.update.__wrapped__
+
+    t_float = timeit(lambda: suc.update(p=183900, T=291.5), number)
+    t_quantity = timeit(lambda: suc.update(p=Q_(1.839, "bar"), T=T), number)
+    t_unwrapped = timeit(lambda: update(suc, p=p, T=T), number)
+    print(
+        f"State.update: float {t_float * 1e3:.1f} us, "
+        f"quantity {t_quantity * 1e3:.1f} us, unwrapped {t_unwrapped * 1e3:.1f} us"
+    )
+
+    kwargs = dict(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1)
+    base_kwargs = dict(
+        suc=suc,
+        disch=disch,
+        flow_v=Q_(1, "m**3/s"),
+        speed=Q_(1, "rad/s"),
+        b=Q_(1, "m"),
+        D=Q_(1, "m"),
+    )
+    init = ccp.Point.__init__.__wrapped__
+
+    number = number // 10
+    t_float = timeit(lambda: ccp.Point(**kwargs), number)
+    t_quantity = timeit(lambda: ccp.Point(**base_kwargs), number)
+    t_unwrapped = timeit(
+        lambda: init(ccp.Point.__new__(ccp.Point), **base_kwargs), number
+    )
+    print(
+        f"Point: float {t_float * 1e3:.1f} us, "
+        f"quantity {t_quantity * 1e3:.1f} us, unwrapped {t_unwrapped * 1e3:.1f} us"
+    )
+
+
+def units_mode(number=50):
+    """Time to create points from suction and discharge states (e.g. a bulk
+    performance evaluation) with pint quantities and with floats in SI units
+    (ccp.config.UNITS_MODE = "si-fast")."""
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid_2)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid_2)
+
+    def point():
+        ccp.Point(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1)
+
+    results = {}
+    for mode in ["pint", "si-fast"]:
+        ccp.config.UNITS_MODE = mode
+        results[mode] = timeit(point, number)
+    ccp.config.UNITS_MODE = "pint"
+
+    print(
+        f"point ({ccp.config.EOS}): pint {results['pint']:.3f} ms, "
+        f"si-fast {results['si-fast']:.3f} ms"
+    )
+
+
+def fluid_names(number=1000):
+    """Time to build the fluid list on first access and to resolve fluid names
+    (e.g. the names of each component when creating a mixture)."""
+    from ccp.config.fluids import _FluidList, get_name
+
+    t_load = timeit(lambda: _FluidList()._load(), 3)
+    names = list(fluid_10) + ["METHANE", "Isobutane", "carbon dioxide"]
+    t_lookup = timeit(lambda: [get_name(name) for name in names], number)
+    print(
+        f"fluid list load {t_load:.3f} ms, "
+        f"get_name {t_lookup / len(names) * 1e3:.2f} us per name"
+    )
+
+
+def point_array(number=3, size=100):
+    """Time to calculate points for arrays of suction and discharge conditions
+    (e.g. the rows of a test data evaluation) with ccp.PointArray compared with
+    one ccp.Point per element."""
+    import numpy as np
+
+    suc_p = np.full(size, 183900.0)
+    suc_T = np.linspace(290, 300, size)
+    disch_p = np.linspace(550000, 600000, size)
+    disch_T = np.linspace(395, 410, size)
+    flow_v = np.linspace(0.8, 1.2, size)
+    kwargs = dict(speed=Q_(7941, "RPM"), b=Q_(28.5, "mm"), D=Q_(365, "mm"))
+
+    for method in ["schultz", "huntington"]:
+
+        def point_array():
+            ccp.PointArray(
+                suc_p=suc_p,
+                suc_T=suc_T,
+                disch_p=disch_p,
+                disch_T=disch_T,
+                fluid=fluid_2,
+                flow_v=flow_v,
+                polytropic_method=method,
+                **kwargs,
+            )
+
+        def points():
+            for i in range(size):
+                ccp.Point(
+                    suc=State(p=suc_p[i], T=suc_T[i], fluid=fluid_2),
+                    disch=State(p=disch_p[i], T=disch_T[i], fluid=fluid_2),
+                    flow_v=flow_v[i],
+                    polytropic_method=method,
+                    **kwargs,
+                )
+
+        t_array = timeit(point_array, number)
+        t_points = timeit(points, number)
+        print(
+            f"{size} points {method} ({ccp.config.EOS}): "
+            f"PointArray {t_array:.1f} ms, Point {t_points:.1f} ms"
+        )
+
+
+def point_memory(size=10000):
+    """Memory and pickle size/time of a list of points (e.g. an evaluation with
+    one point per row of test data)."""
+    import pickle
+    import tracemalloc
+
+    import numpy as np
+
+    suc_states = ccp.StateArray(
+        p=Q_(1.839, "bar"), T=Q_([291.5] * size, "degK"), fluid=fluid_2
+    )
+    disch_T = Q_(405.7 + np.arange(size) * 1e-3, "degK")
+    disch_states = ccp.StateArray(p=Q_(5.902, "bar"), T=disch_T, fluid=fluid_2)
+    sucs = [suc_states[i] for i in range(size)]
+    dischs = [disch_states[i] for i in range(size)]
+
+    tracemalloc.start()
+    points = [
+        ccp.Point(suc=suc, disch=disch, flow_v=1, speed=1, b=1, D=1)
+        for suc, disch in zip(sucs, dischs)
+    ]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    data = pickle.dumps(points)
+    t_dumps = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    pickle.loads(data)
+    t_loads = time.perf_counter() - t0
+    print(
+        f"{len(points)} points: {memory / 2**20:.1f} MiB, "
+        f"pickle {len(data) / 2**20:.1f} MiB, "
+        f"dumps {t_dumps * 1e3:.0f} ms, loads {t_loads * 1e3:.0f} ms"
+    )
+
+
+def similarity_parameters(number=5, imp=None):
+    """Time to interpolate a curve in an impeller map and to calculate the
+    operation and expected points for data rows (as in ccp.Evaluation), where
+    the reynolds and mach numbers are not used."""
+    if imp is None:
+        imp = ccp.impeller_example()
+    p0 = imp.points[0]
+    speed = (imp.curves[0].speed + imp.curves[1].speed) / 2
+    flow_v = imp.curves[0].flow_v.mean()
+
+    t_curve = timeit(lambda: imp.curve(speed=speed), number)
+
+    disch = imp.point(flow_v=flow_v, speed=speed).disch
+    fluid = p0.suc.fluid
+    T = p0.suc.T().m
+
+    def rows():
+        for i in range(10):
+            # new suction state for each row
+            suc = State(p=p0.suc.p(), T=T + 0.1 * i, fluid=fluid)
+            flow_m = flow_v * suc.rho()
+            ccp.Point(
+                suc=suc,
+                disch=State(p=disch.p(), T=disch.T(), fluid=fluid),
+                flow_m=flow_m,
+                speed=speed,
+                b=p0.b,
+                D=p0.D,
+            )
+            imp.point(flow_m=flow_m, speed=speed)
+
+    t_rows = timeit(rows, number) / 10
+    print(
+        f"Impeller.curve {t_curve:.1f} ms, "
+        f"evaluation row (point + expected point) {t_rows:.1f} ms"
+    )
+
+
+def reference_head(number=1, rtol=1e-6):
+    """Time and flashes for the reference head methods integrating the path
+    with 100 segments and with the adaptive number of segments for rtol."""
+    from ccp import point
+
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid)
+
+    for func in [point.head_reference, point.head_reference_2017]:
+        fixed = []
+        adaptive = []
+        t_fixed = timeit(
+            lambda: fixed.append(func(suc, disch, full_output=True)), number
+        )
+        t = timeit(
+            lambda: adaptive.append(func(suc, disch, rtol=rtol, full_output=True)),
+            number,
+        )
+        head_fixed, _, info_fixed = fixed[-1]
+        head, _, info = adaptive[-1]
+        print(
+            f"{func.__name__} ({ccp.config.EOS}): 100 segments {t_fixed:.1f} ms, "
+            f"{info_fixed['flashes']} flashes | rtol={rtol}: {t:.1f} ms, "
+            f"{info['flashes']} flashes, {info['num_steps']} segments, "
+            f"estimated error {info['error']:.1e}, "
+            f"difference {abs((head - head_fixed) / head_fixed).m:.1e}"
+        )
+
+
+def import_time(number=3, top=10):
+    """Time to import ccp in a new process, from python -X importtime.
+
+    Shows the best total time, the packages with the largest cumulative import
+    time and the optional dependencies that were loaded (should be none).
+    """
+    import subprocess
+
+    optional = ["sklearn", "tqdm", "openpyxl", "pandas", "ctREFPROP"]
+    code = f"import sys, ccp; print([m for m in {optional} if m in sys.modules])"
+    best = None
+    for _ in range(number):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+        )
+        # lines: "import time: self [us] | cumulative | imported package"
+        times = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "cumulative" not in line:
+                _, cumulative, name = line[len("import time:") :].split("|")
+                times[name.rstrip()] = int(cumulative)
+        if best is None or times[" ccp"] < best[" ccp"]:
+            best = times
+        loaded = result.stdout.strip().splitlines()[-1]
+
+    print(f"import ccp: {best[' ccp'] / 1e3:.0f} ms, optional loaded: {loaded}")
+    # modules imported directly by ccp (one level of indentation below ccp)
+    modules = {
+        k.strip(): v
+        for k, v in best.items()
+        if k.startswith("   ") and not k.startswith("    ")
+    }
+    for name, t in sorted(modules.items(), key=lambda x: -x[1])[:top]:
+        print(f"    {name}: {t / 1e3:.0f} ms")
+
+
+benchmarks = [
+    mixture_interning,
+    property_cache,
+    polytropic_methods,
+    warm_start,
+    ps_update,
+    scratch_states,
+    cubic_eos_point,
+    lazy_states,
+    pickle_roundtrip,
+    dew_point_margin,
+    tiered_eos,
+    refprop_fallback,
+    check_units,
+    units_mode,
+    fluid_names,
+    point_array,
+    point_memory,
+    similarity_parameters,
+    reference_head,
+    import_time,
+]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmarks = [globals()[name] for name in sys.argv[1:]]
+    for benchmark in benchmarks:
+        print(f"--- {benchmark.__name__}")
+        benchmark()
@@ -6,6 +6,7 @@ from scipy.interpolate import interp1d
 import plotly.graph_objects as go
 
 from ccp import Q_, ureg, Point
+from ccp.config.utilities import BindOnAccess
 
 
 class StateParameter:
@@ -14,14 +15,7 @@ class StateParameter:
         self.attr = attr
 
     def __call__(self, *args, **kwargs):
-        values = []
-
-        for point in self.curve_state_object:
-            values.append(getattr(getattr(point, self.attr)(), "magnitude"))
-
-        units = getattr(getattr(point, self.attr)(), "units")
-
-        return Q_(values, units)
+        return self.curve_state_object.properties([self.attr])[self.attr]
 
 
 def state_parameter(curve_state_object, attr):
@@ -197,24 +191,57 @@ class _CurveState:
 
     """
 
+    # methods for each state attribute, created when accessed
+    p = BindOnAccess(state_parameter, "p")
+    p_interpolated = BindOnAccess(interpolated_function, "p")
+    p_plot = BindOnAccess(plot_func, "p")
+    T = BindOnAccess(state_parameter, "T")
+    T_interpolated = BindOnAccess(interpolated_function, "T")
+    T_plot = BindOnAccess(plot_func, "T")
+    h = BindOnAccess(state_parameter, "h")
+    h_interpolated = BindOnAccess(interpolated_function, "h")
+    h_plot = BindOnAccess(plot_func, "h")
+    s = BindOnAccess(state_parameter, "s")
+    s_interpolated = BindOnAccess(interpolated_function, "s")
+    s_plot = BindOnAccess(plot_func, "s")
+    rho = BindOnAccess(state_parameter, "rho")
+    rho_interpolated = BindOnAccess(interpolated_function, "rho")
+    rho_plot = BindOnAccess(plot_func, "rho")
+
     def __init__(self, points, flow_v, speed):
         self.flow_v = flow_v
         self.points = points
         self.speed = speed
 
-        # set a method for each suction attribute in the list
-        for attr in ["p", "T", "h", "s", "rho"]:
-            func = state_parameter(self, attr)
-            setattr(self, attr, func)
+    def __getitem__(self, item):
+        return self.points.__getitem__(item)
 
-            interpol_func = interpolated_function(self, attr)
-            setattr(self, f"{attr}_interpolated", interpol_func)
+    def properties(self, names, units=None):
+        """Calculate several properties for all the states in one call.
 
-            plot = plot_func(self, attr)
-            setattr(self, f"{attr}_plot", plot)
+        Parameters
+        ----------
+        names : list
+            Names of the properties.
+        units : dict, optional
+            Dictionary with the units for each property (e.g. {"p": "bar"}).
+
+        Returns
+        -------
+        properties : dict
+            Dictionary with the properties as pint.Quantity arrays.
+        """
+        states_properties = [state.properties(names) for state in self.points]
 
-    def __getitem__(self, item):
-        return self.points.__getitem__(item)
+        properties = {}
+        for name in names:
+            values = [props[name] for props in states_properties]
+            value = Q_([v.magnitude for v in values], values[0].units)
+            if units and name in units:
+                value = value.to(units[name])
+            properties[name] = value
+
+        return properties
 
 
 class Curve:
@@ -230,6 +257,24 @@ class Curve:
         List with the points
     """
 
+    # interpolation and plot methods for each parameter, created when accessed
+    head_interpolated = BindOnAccess(interpolated_function, "head")
+    head_plot = BindOnAccess(plot_func, "head")
+    eff_interpolated = BindOnAccess(interpolated_function, "eff")
+    eff_plot = BindOnAccess(plot_func, "eff")
+    power_interpolated = BindOnAccess(interpolated_function, "power")
+    power_plot = BindOnAccess(plot_func, "power")
+    power_shaft_interpolated = BindOnAccess(interpolated_function, "power_shaft")
+    power_shaft_plot = BindOnAccess(plot_func, "power_shaft")
+    torque_interpolated = BindOnAccess(interpolated_function, "torque")
+    torque_plot = BindOnAccess(plot_func, "torque")
+    phi_interpolated = BindOnAccess(interpolated_function, "phi")
+    phi_plot = BindOnAccess(plot_func, "phi")
+    psi_interpolated = BindOnAccess(interpolated_function, "psi")
+    psi_plot = BindOnAccess(plot_func, "psi")
+    flow_m_interpolated = BindOnAccess(interpolated_function, "flow_m")
+    flow_m_plot = BindOnAccess(plot_func, "flow_m")
+
     def __init__(self, points):
         if len(points) < 2:
             raise TypeError("At least 2 points should be given.")
@@ -273,12 +318,6 @@ class Curve:
 
             setattr(self, param, Q_(values, units))
 
-            interpol_func = interpolated_function(self, param)
-            setattr(self, f"{param}_interpolated", interpol_func)
-
-            plot = plot_func(self, param)
-            setattr(self, param + "_plot", plot)
-
     def __getitem__(self, item):
         return self.points.__getitem__(item)
 
@@ -1,6 +1,7 @@
 """Data processing functions for ccp.
+
+pandas is imported by the functions, since these are called with dataframes.
 """
-import pandas as pd
 
 
 def fluctuation(x):
@@ -64,6 +65,8 @@ def fluctuation_data(df, window=3):
     1  1000.0  0.0
     2  1000.0  0.0
     """
+    import pandas as pd
+
     fluctuation_df = (
         df.apply(pd.to_numeric)
         .rolling(
@@ -110,6 +113,8 @@ def mean_data(df, window=3):
     1  1000.0  0.0
     2  1000.0  0.0
     """
+    import pandas as pd
+
     mean_df = (
         df.apply(pd.to_numeric)
         .rolling(
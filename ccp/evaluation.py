@@ -5,8 +5,10 @@ import toml
 import pandas as pd
 import io
 import pickle
+import numpy as np
+from warnings import warn
 from .data_io import filter_data
-from .state import State
+from .state import State, StateArray
 from .point import Point
 from .impeller import Impeller
 from . import Q_
@@ -104,17 +106,22 @@ class Evaluation:
         )
 
         # create density column
-        df["v_s"] = 0
-        df["speed_sound"] = 0
-        for i, row in df.iterrows():
-            # create state
-            state = State(
-                p=Q_(row.ps, self.data_units["ps"]),
-                T=Q_(row.Ts, self.data_units["Ts"]),
-                fluid=self.operation_fluid,
+        suc_states = StateArray(
+            p=Q_(df["ps"].to_numpy(), self.data_units["ps"]),
+            T=Q_(df["Ts"].to_numpy(), self.data_units["Ts"]),
+            fluid=self.operation_fluid,
+        )
+        df["v_s"] = suc_states.v().m
+        df["speed_sound"] = suc_states.speed_sound().m
+        # margin to the dew line, phase envelope is calculated once for the fluid
+        try:
+            df["dew_point_margin"] = suc_states.dew_point_margin().m
+        except (ValueError, RuntimeError) as e:
+            warn(
+                f"Could not calculate the phase envelope for {self.operation_fluid}, "
+                f"dew_point_margin is set to nan. {e}"
             )
-            df.loc[i, "v_s"] = state.v().m
-            df.loc[i, "speed_sound"] = state.speed_sound().m
+            df["dew_point_margin"] = np.nan
 
         # check if flow_v or flow_m is in the DataFrame
         if "flow_v" in df.columns:
@@ -176,7 +183,7 @@ class Evaluation:
 
         args_list = []
         for i, row in df.iterrows():
-            # calculate point
+            # calculate point (states are flashed by the workers)
             arg_dict = {
                 "flow_m": row.flow_m,
                 "speed": Q_(row.speed, self.data_units["speed"]),
@@ -184,11 +191,13 @@ class Evaluation:
                     p=Q_(row.ps, self.data_units["ps"]),
                     T=Q_(row.Ts, self.data_units["Ts"]),
                     fluid=self.operation_fluid,
+                    lazy=True,
                 ),
                 "disch": State(
                     p=Q_(row.pd, self.data_units["pd"]),
                     T=Q_(row.Td, self.data_units["Td"]),
                     fluid=self.operation_fluid,
+                    lazy=True,
                 ),
                 "imp_new": self.impellers_new[int(row.cluster)],
             }
@@ -260,7 +269,7 @@ class Evaluation:
                     pickle.dump(imp, pickle_file)
             # create dict with arguments and save to toml
             args_dict = {
-                "operation_fluid": self.operation_fluid,
+                "operation_fluid": dict(self.operation_fluid),
                 "data_units": self.data_units,
                 "window": self.window,
                 "temperature_fluctuation": self.temperature_fluctuation,
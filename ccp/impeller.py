@@ -11,13 +11,12 @@ from pathlib import Path
 
 import numpy as np
 import plotly.graph_objects as go
-from openpyxl import Workbook
 from scipy.interpolate import interp1d, UnivariateSpline, PchipInterpolator
 from scipy.optimize import fsolve
 
 from ccp import Q_, State, Point, Curve
 from ccp.config.units import check_units
-from ccp.config.utilities import r_getattr, r_setattr
+from ccp.config.utilities import BindOnAccess, r_getattr, r_setattr
 from ccp.data_io.read_csv import read_data_from_engauge_csv
 from ccp.plotly_theme import tableau_colors
 
@@ -45,13 +44,16 @@ def impeller_state_parameter(impeller_state_object, attr):
 
 
 class ImpellerState:
+    # methods for each state attribute, created when accessed
+    p = BindOnAccess(impeller_state_parameter, "p")
+    T = BindOnAccess(impeller_state_parameter, "T")
+    h = BindOnAccess(impeller_state_parameter, "h")
+    s = BindOnAccess(impeller_state_parameter, "s")
+    rho = BindOnAccess(impeller_state_parameter, "rho")
+
     def __init__(self, curves_state):
         self.curves_state = curves_state
 
-        for attr in ["p", "T", "h", "s", "rho"]:
-            func = impeller_state_parameter(self, attr)
-            setattr(self, attr, func)
-
     def __getitem__(self, item):
         return self.curves_state.__getitem__(item)
 
@@ -339,7 +341,7 @@ class Impeller:
         max_losses = max(losses_dict.keys())
         max_losses_speed = losses_dict[max_losses]
 
-        curves = []
+        curves_points = []
         for speed, grouped_points in groupby(
             sorted(self.points, key=lambda point: point.speed),
             key=lambda point: point.speed,
@@ -363,28 +365,58 @@ class Impeller:
                     points.append(p_new)
             else:
                 points = [point for point in grouped_points]
+            curves_points.append(points)
+
+        self._add_curves(curves_points)
+
+    _curves_attributes = [
+        "disch.p",
+        "disch.T",
+        "disch.h",
+        "disch.s",
+        "disch.rho",
+        "head",
+        "eff",
+        "power",
+        "power_shaft",
+        "torque",
+        "psi",
+        "phi",
+        "flow_v",
+        "flow_m",
+    ]
+
+    # plot methods for the impeller attributes, created when accessed
+    head_plot = BindOnAccess(impeller_plot_function, "head")
+    head_compare = BindOnAccess(compare_impeller_plot_function, "head")
+    eff_plot = BindOnAccess(impeller_plot_function, "eff")
+    eff_compare = BindOnAccess(compare_impeller_plot_function, "eff")
+    power_plot = BindOnAccess(impeller_plot_function, "power")
+    power_compare = BindOnAccess(compare_impeller_plot_function, "power")
+    power_shaft_plot = BindOnAccess(impeller_plot_function, "power_shaft")
+    power_shaft_compare = BindOnAccess(compare_impeller_plot_function, "power_shaft")
+    torque_plot = BindOnAccess(impeller_plot_function, "torque")
+    torque_compare = BindOnAccess(compare_impeller_plot_function, "torque")
+    psi_plot = BindOnAccess(impeller_plot_function, "psi")
+    psi_compare = BindOnAccess(compare_impeller_plot_function, "psi")
+    phi_plot = BindOnAccess(impeller_plot_function, "phi")
+    phi_compare = BindOnAccess(compare_impeller_plot_function, "phi")
+    flow_v_plot = BindOnAccess(impeller_plot_function, "flow_v")
+    flow_v_compare = BindOnAccess(compare_impeller_plot_function, "flow_v")
+    flow_m_plot = BindOnAccess(impeller_plot_function, "flow_m")
+    flow_m_compare = BindOnAccess(compare_impeller_plot_function, "flow_m")
+
+    def _add_curves(self, curves_points):
+        """Create the curves and the impeller attributes from the curve points."""
+        curves = []
+        for points in curves_points:
             curve = Curve(points)
             curves.append(curve)
             setattr(self, f"curve_{int(curve.speed.magnitude)}", curve)
         self.curves = curves
         self.disch = ImpellerState([c.disch for c in self.curves])
 
-        for attr in [
-            "disch.p",
-            "disch.T",
-            "disch.h",
-            "disch.s",
-            "disch.rho",
-            "head",
-            "eff",
-            "power",
-            "power_shaft",
-            "torque",
-            "psi",
-            "phi",
-            "flow_v",
-            "flow_m",
-        ]:
+        for attr in self._curves_attributes:
             values = []
             # for disch.p etc values are defined in _Impeller_State
             if "." not in attr:
@@ -394,11 +426,37 @@ class Impeller:
                 units = param.units
                 r_setattr(self, attr, Q_(values, units))
 
+                continue
+
+            # plot methods for disch.p etc. are set in the ImpellerState, which
+            # is not bound to the impeller
             r_setattr(self, f"{attr}_plot", impeller_plot_function(self, attr))
             r_setattr(
                 self, f"{attr}_compare", compare_impeller_plot_function(self, attr)
             )
 
+    def __getstate__(self):
+        # curves, curve attributes and plot functions are derived from the curve
+        # points and are created again when loaded
+        derived = {"curves", "disch", *self._curves_attributes}
+        state = {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in derived
+            and not k.startswith("curve_")
+            and not k.endswith(("_plot", "_compare"))
+        }
+        state["_curves_points"] = [curve.points for curve in self.curves]
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        # impellers pickled with all their attributes have no curve points
+        curves_points = state.pop("_curves_points", None)
+        self.__dict__.update(state)
+        if curves_points is not None:
+            self._add_curves(curves_points)
+
     def __getitem__(self, item):
         return self.points.__getitem__(item)
 
@@ -694,6 +752,8 @@ class Impeller:
 
     def export_to_excel(self, path_name=None):
         """Export curves to excel file."""
+        from openpyxl import Workbook
+
         wb = Workbook()
         for curve in self.curves:
             sheet_name = f'{curve.speed.to("RPM"):.0f~P}'
@@ -0,0 +1,145 @@
+"""Fluid composition used to create states."""
+from collections import OrderedDict
+from collections.abc import Mapping
+from weakref import WeakValueDictionary
+
+from .config.fluids import get_name, normalize_mix
+
+__all__ = ["Mixture"]
+
+# number of entries kept by the caches of values for each fluid composition
+_MIXTURE_CACHE_SIZE = 64
+
+
+class Mixture(Mapping):
+    """A fluid composition.
+
+    Constituent names are resolved to the names used to create the
+    CoolProp/REFPROP backend and molar fractions are normalized once, when the
+    composition is first seen. Mixtures are interned: the same composition
+    (given with any of the fluid aliases and in any order) returns the same
+    instance, which can be used as a key for caches. The constituents keep the
+    order in which the composition was first given.
+
+    A mixture is a read only mapping from the constituent names to the molar
+    fractions, and can be used wherever a fluid dict is accepted.
+
+    Parameters
+    ----------
+    fluid : dict, str, ccp.Mixture
+        Dictionary with constituent and composition (mole fraction), or the name
+        of a pure fluid.
+        (e.g.: fluid={'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092})
+
+    Attributes
+    ----------
+    constituents : tuple
+        Constituent names used to create the backend (e.g. 'METHANE').
+    fractions : tuple
+        Normalized molar fractions.
+    backend_string : str
+        Fluid string used to create the backend (e.g. 'METHANE&ETHANE').
+
+    Examples
+    --------
+    >>> import ccp
+    >>> mix = ccp.Mixture({'methane': 0.9, 'ethane': 0.1})
+    >>> mix is ccp.Mixture({'METHANE': 0.9, 'ETHANE': 0.1})
+    True
+    >>> s = ccp.State(p=101008, T=273, fluid=mix)
+    """
+
+    # instances keyed by the compositions already seen (names as given), an
+    # instance is released when it is no longer used
+    _instances = WeakValueDictionary()
+
+    def __new__(cls, fluid):
+        if isinstance(fluid, Mixture):
+            return fluid
+        if isinstance(fluid, str):
+            fluid = {fluid: 1.0}
+
+        key = tuple(fluid.items())
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+
+        constituents = tuple(get_name(name) for name in fluid)
+        if len(set(constituents)) < len(constituents):
+            raise ValueError(
+                "You might have repeated components in the fluid dictionary."
+            )
+        fractions = tuple(normalize_mix(list(fluid.values())))
+
+        # the resolved composition identifies the mixture
+        resolved_key = tuple(sorted(zip(constituents, fractions)))
+        mixture = cls._instances.get(resolved_key)
+        if mixture is None:
+            mixture = super().__new__(cls)
+            mixture.constituents = constituents
+            mixture.fractions = fractions
+            mixture.backend_string = "&".join(constituents)
+            mixture._fluid = dict(zip(constituents, fractions))
+            mixture._hash = hash(resolved_key)
+            cls._instances[resolved_key] = mixture
+        cls._instances[key] = mixture
+
+        return mixture
+
+    def __getitem__(self, name):
+        return self._fluid[name]
+
+    def __iter__(self):
+        return iter(self._fluid)
+
+    def __len__(self):
+        return len(self._fluid)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._fluid})"
+
+    def __reduce__(self):
+        return self.__class__, (self._fluid,)
+
+
+class _MixtureCache(OrderedDict):
+    """Cache of values for each fluid composition (e.g. keyed by (EOS, mixture)).
+
+    Only the most recently used entries are kept, so the mixtures of the evicted
+    entries (and the values, e.g. states or phase envelopes) can be released.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of entries. Default is 64.
+    """
+
+    def __init__(self, maxsize=_MIXTURE_CACHE_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
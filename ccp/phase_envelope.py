@@ -0,0 +1,177 @@
+"""Phase envelope for a fixed fluid composition.
+
+The phase envelope is built once per composition and EOS with CoolProp and kept
+in memory. It can also be saved to ccp.config.PHASE_ENVELOPE_DIR, so that it is
+loaded by the next process instead of being built again.
+
+The dew line is the part of the envelope up to the cricondentherm, as shown by
+ccp.State.plot_envelope. The dew point margin is the difference between a
+temperature and the dew temperature at the same pressure, calculated for whole
+arrays (e.g. a time series of suction conditions).
+"""
+import json
+from pathlib import Path
+
+import CoolProp.CoolProp as CP
+import numpy as np
+
+import ccp.config
+from .mixture import Mixture, _MixtureCache
+from .property_table import table_key
+
+__all__ = ["PhaseEnvelope", "get_phase_envelope"]
+
+# phase envelopes already built or loaded in this process
+_envelopes = _MixtureCache()
+
+
+class PhaseEnvelope:
+    """Phase envelope of a fluid composition.
+
+    Parameters
+    ----------
+    fluid : dict
+        Dictionary with constituent and composition (mole fraction).
+    EOS : str
+        EOS used to build the envelope.
+    T : np.ndarray
+        Temperature (degK) along the envelope.
+    p : np.ndarray
+        Pressure (Pa) along the envelope.
+
+    Attributes
+    ----------
+    T_dew : np.ndarray
+        Temperature (degK) along the dew line, up to the cricondentherm.
+    p_dew : np.ndarray
+        Pressure (Pa) along the dew line (increasing).
+    """
+
+    def __init__(self, fluid, EOS, T, p):
+        self.fluid = fluid
+        self.EOS = EOS
+        self.T = np.asarray(T, dtype=float)
+        self.p = np.asarray(p, dtype=float)
+
+        i_max = np.argmax(self.T)
+        T_dew = self.T[:i_max]
+        p_dew = self.p[:i_max]
+        # keep the nodes with increasing pressure (envelope has repeated nodes)
+        keep = np.ones(len(p_dew), dtype=bool)
+        keep[1:] = np.diff(np.maximum.accumulate(p_dew)) > 0
+        self.T_dew = T_dew[keep]
+        self.p_dew = p_dew[keep]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(EOS={self.EOS}, fluid={self.fluid})"
+
+    @classmethod
+    def build(cls, fluid, EOS=None):
+        """Build the phase envelope with CoolProp.
+
+        Parameters
+        ----------
+        fluid : dict, ccp.Mixture
+            Dictionary with constituent and composition (mole fraction).
+        EOS : str, optional
+            EOS used to build the envelope. Default is ccp.config.EOS.
+
+        Returns
+        -------
+        phase_envelope : ccp.phase_envelope.PhaseEnvelope
+        """
+        if EOS is None:
+            EOS = ccp.config.EOS
+
+        mixture = Mixture(fluid)
+        backend = CP.AbstractState(EOS, mixture.backend_string)
+        backend.set_mole_fractions(mixture.fractions)
+        backend.build_phase_envelope("dummy")
+        data = backend.get_phase_envelope_data()
+
+        return cls(dict(mixture), EOS, data.T, data.p)
+
+    def T_dew_point(self, p):
+        """Dew temperature (degK) for pressures p (Pa).
+
+        Pressures outside the dew line (e.g. above the cricondentherm) return nan.
+        """
+        if not len(self.p_dew):
+            return np.full(np.shape(p), np.nan)
+        return np.interp(
+            np.log(p), np.log(self.p_dew), self.T_dew, left=np.nan, right=np.nan
+        )
+
+    def dew_point_margin(self, p, T):
+        """Margin (degK) between the temperatures T and the dew temperature.
+
+        Parameters
+        ----------
+        p : float, array_like
+            Pressure (Pa).
+        T : float, array_like
+            Temperature (degK).
+
+        Returns
+        -------
+        margin : float, np.ndarray
+            T minus the dew temperature at p. Negative values are below the dew
+            line and pressures outside the dew line return nan.
+        """
+        return np.asarray(T, dtype=float) - self.T_dew_point(p)
+
+    def save(self, file):
+        """Save phase envelope to a .npz file."""
+        np.savez(file, fluid=json.dumps(self.fluid), EOS=self.EOS, T=self.T, p=self.p)
+
+    @classmethod
+    def load(cls, file):
+        """Load phase envelope from a .npz file."""
+        with np.load(file) as data:
+            return cls(
+                json.loads(str(data["fluid"])), str(data["EOS"]), data["T"], data["p"]
+            )
+
+
+def get_phase_envelope(fluid, EOS=None):
+    """Get the phase envelope for a fluid composition.
+
+    The envelope is retrieved from memory, or loaded from
+    ccp.config.PHASE_ENVELOPE_DIR if it has been saved by a previous process.
+    Otherwise it is built (and saved if the directory is set).
+
+    Parameters
+    ----------
+    fluid : dict, ccp.Mixture
+        Dictionary with constituent and composition (mole fraction).
+    EOS : str, optional
+        EOS used to build the envelope. Default is ccp.config.EOS.
+
+    Returns
+    -------
+    phase_envelope : ccp.phase_envelope.PhaseEnvelope
+    """
+    if EOS is None:
+        EOS = ccp.config.EOS
+
+    mixture = Mixture(fluid)
+    phase_envelope = _envelopes.get((EOS, mixture))
+    if phase_envelope is not None:
+        return phase_envelope
+
+    envelope_dir = ccp.config.PHASE_ENVELOPE_DIR
+    file = None
+    if envelope_dir is not None:
+        file = Path(envelope_dir) / f"{table_key(mixture, EOS)}.npz"
+        if file.is_file():
+            phase_envelope = PhaseEnvelope.load(file)
+
+    if phase_envelope is None:
+        phase_envelope = PhaseEnvelope.build(mixture, EOS=EOS)
+        if file is not None:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            phase_envelope.save(file)
+
+    _envelopes[(EOS, mixture)] = phase_envelope
+
+    return phase_envelope
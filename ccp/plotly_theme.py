@@ -14,7 +14,9 @@ tableau_colors = {
     "olive": "#bcbd22",
     "cyan": "#17becf",
 }
+# the template is not validated (slow) since its values are constant
 pio.templates["ccp"] = go.layout.Template(
+    _validate=False,
     layout={
         "annotationdefaults": {
             "arrowcolor": "#2a3f5f",
@@ -1,4 +1,7 @@
-from copy import copy
+import threading
+from contextlib import contextmanager
+from itertools import cycle
+from warnings import warn
 
 import numpy as np
 import toml
@@ -7,9 +10,69 @@ from plotly.subplots import make_subplots
 from scipy.optimize import newton
 
 import ccp.config
-from .state import State
-from ccp.config.units import check_units, Q_
-from ccp.config.utilities import r_getattr
+from .state import State, StateArray, _source_eos, _WARM_START_MAX_STEP
+from ccp.config.units import check_units, Q_, ureg
+from ccp.config.utilities import BindOnAccess, cached_property, r_getattr
+
+
+# units of the point attributes calculated with floats (UNITS_MODE = "si-fast")
+_si_units = {
+    "head": ureg.Unit("joule/kilogram"),
+    "dimensionless": ureg.Unit("dimensionless"),
+    "flow_v": ureg.Unit("meter**3/second"),
+    "flow_m": ureg.Unit("kilogram/second"),
+    "power": ureg.Unit("watt"),
+    "torque": (Q_(1, "watt") / Q_(1, "radian/second")).units,
+}
+
+
+def plot_func(self, attr):
+    def inner(*args, plot_kws=None, **kwargs):
+        """Plot parameter versus volumetric flow.
+
+        You can choose units with the arguments flow_v_units='...' and
+        attr_units='...'.
+        """
+        fig = kwargs.pop("fig", None)
+        color = kwargs.pop("color", None)
+
+        if fig is None:
+            fig = go.Figure()
+
+        if plot_kws is None:
+            plot_kws = {}
+
+        point_attr = r_getattr(self, attr)
+        if callable(point_attr):
+            point_attr = point_attr()
+
+        flow_v_units = kwargs.get("flow_v_units", self.flow_v.units)
+        # Split in '.' for cases such as disch.rho.
+        # In this case the user gives rho_units instead of disch.rho_units
+        attr_units = kwargs.get(f"{attr.split('.')[-1]}_units", point_attr.units)
+
+        if attr_units is not None:
+            point_attr = point_attr.to(attr_units)
+
+        value = getattr(point_attr, "magnitude")
+        units = getattr(point_attr, "units")
+
+        flow_v = self.flow_v
+
+        name = kwargs.get(
+            "name", f"Flow: {flow_v.to(flow_v_units).m:.2f}, {attr}: {value:.2f}"
+        )
+
+        if flow_v_units is not None:
+            flow_v = flow_v.to(flow_v_units)
+
+        fig.add_trace(
+            go.Scatter(x=[flow_v], y=[value], name=name, marker_color=color, **plot_kws)
+        )
+
+        return fig
+
+    return inner
 
 
 class Point:
@@ -135,6 +198,13 @@ class Point:
         Polytropic method used for head and efficiency calculation.
     """
 
+    # plot methods (e.g. point.head_plot()), created when accessed
+    head_plot = BindOnAccess(plot_func, "head")
+    eff_plot = BindOnAccess(plot_func, "eff")
+    power_plot = BindOnAccess(plot_func, "power")
+    power_shaft_plot = BindOnAccess(plot_func, "power_shaft")
+    torque_plot = BindOnAccess(plot_func, "torque")
+
     @check_units
     def __init__(
         self,
@@ -167,6 +237,7 @@ class Point:
         if polytropic_method is None:
             polytropic_method = ccp.config.POLYTROPIC_METHOD
 
+        self.polytropic_method = polytropic_method
         self.head_calc_func = globals()[f"head_pol_{polytropic_method}"]
         self.eff_calc_func = globals()[f"eff_pol_{polytropic_method}"]
 
@@ -199,9 +270,6 @@ class Point:
         self.convection_constant = convection_constant
         self.casing_heat_loss = None
 
-        # dummy state used to avoid copying states
-        self._dummy_state = copy(self.suc)
-
         kwargs_list = []
         kwargs_dict = {}
         reasonable_ranges = {
@@ -262,28 +330,59 @@ class Point:
                 f"The following kwargs seems out of reasonable range: {out_of_range_dict}."
             )
 
-        self.reynolds = reynolds(self.suc, self.speed, self.b, self.D)
-        self.mach = mach(self.suc, self.speed, self.D)
-
         self.phi_ratio = Q_(1.0, "dimensionless")
         self.psi_ratio = Q_(1.0, "dimensionless")
-        self.reynolds_ratio = Q_(1.0, "dimensionless")
-        # mach in the ptc 10 is compared with Mmt - Mmsp
-        self.mach_diff = Q_(0.0, "dimensionless")
         # ratio between specific volume ratios in original and converted conditions
         self.volume_ratio_ratio = Q_(1.0, "dimensionless")
 
         self._add_point_plot()
 
     def _add_point_plot(self):
-        """Add plot to point after point is fully defined."""
-        for state in ["suc", "disch"]:
-            for attr in ["p", "T", "h", "s", "rho"]:
-                plot = plot_func(self, ".".join([state, attr]))
-                setattr(getattr(self, state), attr + "_plot", plot)
-        for attr in ["head", "eff", "power", "power_shaft", "torque"]:
-            plot = plot_func(self, attr)
-            setattr(self, attr + "_plot", plot)
+        """Set the point used by the states plot methods (e.g. point.suc.T_plot)
+        after the point is fully defined."""
+        self.suc._point = self
+        self.disch._point = self
+
+    # The similarity parameters are calculated on the first access, since
+    # reynolds requires the viscosity, which is not needed by most calculations.
+    @cached_property
+    def reynolds(self):
+        """Reynolds number (dimensionless)."""
+        if ccp.config.UNITS_MODE == "si-fast":
+            u = self.speed.m * self.D.m / 2
+            rho, viscosity = self.suc.props_si("rho", "viscosity")
+            return Q_(u * self.b.m * rho / viscosity, _si_units["dimensionless"])
+        return reynolds(self.suc, self.speed, self.b, self.D)
+
+    @cached_property
+    def mach(self):
+        """Mach number (dimensionless)."""
+        if ccp.config.UNITS_MODE == "si-fast":
+            u = self.speed.m * self.D.m / 2
+            (speed_sound,) = self.suc.props_si("speed_sound")
+            return Q_(u / speed_sound, _si_units["dimensionless"])
+        return mach(self.suc, self.speed, self.D)
+
+    @cached_property
+    def reynolds_ratio(self):
+        """Ratio between reynolds for this point and the original point from which
+        it was converted from (1 if the point was not converted)."""
+        original = self.__dict__.get("_original_similarity")
+        if original is None:
+            return Q_(1.0, "dimensionless")
+        suc, speed, b, D = original
+        return self.reynolds / reynolds(suc, speed, b, D)
+
+    @cached_property
+    def mach_diff(self):
+        """Difference between mach for this point and the original point from which
+        it was converted from (0 if the point was not converted)."""
+        # mach in the ptc 10 is compared with Mmt - Mmsp
+        original = self.__dict__.get("_original_similarity")
+        if original is None:
+            return Q_(0.0, "dimensionless")
+        suc, speed, b, D = original
+        return self.mach - mach(suc, speed, D)
 
     def __str__(self):
         return (
@@ -319,11 +418,61 @@ class Point:
             f' power_losses=Q_("{self.power_losses:.0f~P}"))'
         )
 
+    def _calc_si_from_disch_speed_suc(self):
+        """Calculate from discharge state, flow (volume or mass) and speed.
+
+        Used with ccp.config.UNITS_MODE = "si-fast": the calculation is carried
+        out with floats in SI units and the results are converted to pint
+        quantities at the end.
+        """
+        h_suc, rho_suc = self.suc.props_si("h", "rho")
+        h_disch, rho_disch = self.disch.props_si("h", "rho")
+        head_func, eff_func = _FLOAT_METHODS[self.polytropic_method]
+        head = head_func(self.suc, self.disch)
+        eff = eff_func(self.suc, self.disch)
+        if self.flow_v is not None:
+            flow_v = self.flow_v.m
+            flow_m = rho_suc * flow_v
+        else:
+            flow_m = self.flow_m.m
+            flow_v = flow_m / rho_suc
+        if self.casing_temperature is not None:
+            # correct efficiency with casing heat loss
+            casing_heat_loss = (
+                self.convection_constant.m
+                * self.casing_area.m
+                * (self.casing_temperature.m - self.ambient_temperature.m)
+            )
+            self.casing_heat_loss = Q_(casing_heat_loss, _si_units["power"])
+            eff = eff / (1 + casing_heat_loss / ((h_disch - h_suc) * flow_m))
+        speed = self.speed.m
+        u = speed * self.D.m / 2
+        power = flow_m * head / eff
+        power_losses = self.power_losses.m if self.power_losses else 0.0
+        power_shaft = power + power_losses
+
+        dimensionless = _si_units["dimensionless"]
+        self.head = Q_(head, _si_units["head"])
+        self.eff = Q_(eff, dimensionless)
+        self.volume_ratio = Q_(rho_disch / rho_suc, dimensionless)
+        self.flow_v = Q_(flow_v, _si_units["flow_v"])
+        self.flow_m = Q_(flow_m, _si_units["flow_m"])
+        self.phi = Q_(flow_v * 4 / (np.pi * self.D.m**2 * u), dimensionless)
+        self.psi = Q_(head / (u**2 / 2), dimensionless)
+        self.power = Q_(power, _si_units["power"])
+        self.power_losses = Q_(power_losses, _si_units["power"])
+        self.power_shaft = Q_(power_shaft, _si_units["power"])
+        self.torque = Q_(power_shaft / speed, _si_units["torque"])
+
     def _calc_from_disch_flow_v_speed_suc(self):
+        if ccp.config.UNITS_MODE == "si-fast":
+            return self._calc_si_from_disch_speed_suc()
+        suc_props = self.suc.properties(["h", "rho", "v"])
+        disch_props = self.disch.properties(["h", "v"])
         self.head = self.head_calc_func(self.suc, self.disch)
         self.eff = self.eff_calc_func(self.suc, self.disch)
-        self.volume_ratio = self.suc.v() / self.disch.v()
-        self.flow_m = self.suc.rho() * self.flow_v
+        self.volume_ratio = suc_props["v"] / disch_props["v"]
+        self.flow_m = suc_props["rho"] * self.flow_v
         self.phi = phi(self.flow_v, self.speed, self.D)
         self.psi = psi(self.head, self.speed, self.D)
         if self.casing_temperature is not None:
@@ -337,7 +486,7 @@ class Point:
                 1
                 + (
                     self.casing_heat_loss
-                    / ((self.disch.h() - self.suc.h()) * self.flow_m)
+                    / ((disch_props["h"] - suc_props["h"]) * self.flow_m)
                 )
             )
         self.power = power_calc(self.flow_m, self.head, self.eff)
@@ -357,10 +506,14 @@ class Point:
         self.torque = self.power_shaft / self.speed
 
     def _calc_from_disch_flow_m_speed_suc(self):
+        if ccp.config.UNITS_MODE == "si-fast":
+            return self._calc_si_from_disch_speed_suc()
+        suc_props = self.suc.properties(["h", "rho", "v"])
+        disch_props = self.disch.properties(["h", "v"])
         self.head = self.head_calc_func(self.suc, self.disch)
         self.eff = self.eff_calc_func(self.suc, self.disch)
-        self.volume_ratio = self.suc.v() / self.disch.v()
-        self.flow_v = self.flow_m / self.suc.rho()
+        self.volume_ratio = suc_props["v"] / disch_props["v"]
+        self.flow_v = self.flow_m / suc_props["rho"]
         if self.casing_temperature is not None:
             # correct efficiency with casing heat loss
             self.casing_heat_loss = (
@@ -372,7 +525,7 @@ class Point:
                 1
                 + (
                     self.casing_heat_loss
-                    / ((self.disch.h() - self.suc.h()) * self.flow_m)
+                    / ((disch_props["h"] - suc_props["h"]) * self.flow_m)
                 )
             )
         self.power = power_calc(self.flow_m, self.head, self.eff)
@@ -398,30 +551,40 @@ class Point:
         suc = self.suc
         volume_ratio = self.volume_ratio
 
-        disch_v = suc.v() / volume_ratio
-        disch_rho = 1 / disch_v
+        def solve(suc, T0):
+            disch_v = suc.v() / volume_ratio
+            disch_rho = 1 / disch_v
 
-        # consider first an isentropic compression
-        disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
+            if T0 is None:
+                # consider first an isentropic compression
+                disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid, EOS=suc.EOS)
+                T0 = disch.T().magnitude
+            else:
+                disch = State(rho=disch_rho, T=T0, fluid=suc.fluid, EOS=suc.EOS)
 
-        def update_state(x, update_type):
-            if update_type == "pressure":
-                disch.update(rho=disch_rho, p=x)
-            elif update_type == "temperature":
-                disch.update(rho=disch_rho, T=x)
-            new_eff = self.eff_calc_func(self.suc, disch)
-            if not 0.0 < new_eff < 1.1:
-                raise ValueError
+            def update_state(x, update_type):
+                if update_type == "pressure":
+                    disch.update(rho=disch_rho, p=x)
+                elif update_type == "temperature":
+                    disch.update(rho=disch_rho, T=x)
+                _count_iteration(suc)
+                new_eff = self.eff_calc_func(suc, disch)
+                if not 0.0 < new_eff < 1.1:
+                    raise ValueError
 
-            return (new_eff - eff).magnitude
+                return (new_eff - eff).magnitude
 
-        try:
-            newton(update_state, disch.T().magnitude, args=("temperature",), tol=1e-1)
-        except ValueError:
-            # re-instantiate disch, since update with temperature not converging
-            # might break the state
-            disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
-            newton(update_state, disch.p().magnitude, args=("pressure",), tol=1e-1)
+            try:
+                newton(update_state, T0, args=("temperature",), tol=1e-1)
+            except ValueError:
+                # re-instantiate disch, since update with temperature not converging
+                # might break the state
+                disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid, EOS=suc.EOS)
+                newton(update_state, disch.p().magnitude, args=("pressure",), tol=1e-1)
+
+            return disch
+
+        disch = _solve_tiered(solve, suc, seed=lambda disch: disch.T().magnitude)
 
         self.disch = disch
         self.head = self.head_calc_func(suc, disch)
@@ -882,10 +1045,19 @@ class Point:
         converted_point.volume_ratio_ratio = (
             converted_point.volume_ratio / original_point.volume_ratio
         )
-        converted_point.reynolds_ratio = (
-            converted_point.reynolds / original_point.reynolds
+        # used to calculate reynolds_ratio and mach_diff when accessed, with a
+        # lazy copy of the original suction state, so that the original point
+        # is not kept with this point
+        original_suc = original_point.suc
+        p, T = original_suc.props_si("p", "T")
+        converted_point._original_similarity = (
+            State(
+                p=p, T=T, fluid=original_suc.mixture, EOS=original_suc.EOS, lazy=True
+            ),
+            original_point.speed,
+            original_point.b,
+            original_point.D,
         )
-        converted_point.mach_diff = converted_point.mach - original_point.mach
 
         return converted_point
 
@@ -1317,53 +1489,289 @@ class Point:
         return fig
 
 
-def plot_func(self, attr):
-    def inner(*args, plot_kws=None, **kwargs):
-        """Plot parameter versus volumetric flow.
+class PointArray:
+    """Performance points evaluated over arrays.
 
-        You can choose units with the arguments flow_v_units='...' and
-        attr_units='...'.
-        """
-        fig = kwargs.pop("fig", None)
-        color = kwargs.pop("color", None)
+    Calculates the performance parameters column-wise for arrays of suction
+    and discharge conditions, flow and speed. The states are evaluated with
+    ccp.StateArray and the polytropic methods with array operations, avoiding
+    the construction of one ccp.Point per element.
+    Arguments can be floats/arrays (SI units are considered) or pint quantities.
 
-        if fig is None:
-            fig = go.Figure()
+    Parameters
+    ----------
+    suc, disch : ccp.StateArray, optional
+        Suction and discharge states.
+    suc_p, suc_T, disch_p, disch_T : array_like, pint.Quantity, optional
+        Suction and discharge pressure (Pa) and temperature (degK).
+        Used to create the states if suc and disch are not provided.
+    fluid : dict, ccp.Mixture, optional
+        Fluid composition, required with suc_p, suc_T, disch_p and disch_T.
+    EOS : str, optional
+        Equation of state used to create the states.
+        Default is set in ccp.config.EOS
+    flow_v or flow_m : array_like, pint.Quantity
+        Volumetric (m³/s) or mass (kg/s) flow.
+    speed : array_like, pint.Quantity
+        Speed in rad/s.
+    b : float, pint.Quantity
+        Impeller width at the outer blade diameter (m).
+    D : float, pint.Quantity
+        Impeller outer diameter (m).
+    power_losses : array_like, pint.Quantity, optional
+        Mechanical power losses (Watt).
+    casing_area : pint.Quantity, optional
+        Compressor case area used to calculate case heat loss (m²).
+    casing_temperature : pint.Quantity, optional
+        Compressor case temperature used to calculate case heat loss (degK).
+    ambient_temperature : pint.Quantity, optional
+        Ambient temperature used to calculate case heat loss (degK).
+    convection_constant : pint.Quantity, optional
+        Heat transfer (convection) constant (W / m²degK).
+        Default value is 13.6.
+    polytropic_method : str, optional
+        Polytropic method used for head and efficiency calculation.
+        Options are: "mallen_saville", "sandberg_colby", "schultz" and "huntington".
+        The default is set in ccp.config.POLYTROPIC_METHOD.
 
-        if plot_kws is None:
-            plot_kws = {}
+    Attributes
+    ----------
+    head, eff, power, power_losses, power_shaft, torque, flow_v, flow_m, phi,
+    psi, volume_ratio, reynolds, mach : pint.Quantity
+        Arrays with the same definition as the ccp.Point attributes.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> Q_ = ccp.Q_
+    >>> points = ccp.PointArray(
+    ...     suc_p=Q_([1.839, 1.839], "bar"),
+    ...     suc_T=291.5,
+    ...     disch_p=Q_([5.902, 5.5], "bar"),
+    ...     disch_T=[405.7, 395.0],
+    ...     fluid={"methane": 0.5, "ethane": 0.5},
+    ...     flow_v=[1.0, 1.2],
+    ...     speed=Q_(7941, "RPM"),
+    ...     b=Q_(28.5, "mm"),
+    ...     D=Q_(365, "mm"),
+    ... )
+    >>> points.head.units
+    <Unit('joule / kilogram')>
+    """
 
-        point_attr = r_getattr(self, attr)
-        if callable(point_attr):
-            point_attr = point_attr()
+    @check_units
+    def __init__(
+        self,
+        suc=None,
+        disch=None,
+        suc_p=None,
+        suc_T=None,
+        disch_p=None,
+        disch_T=None,
+        fluid=None,
+        EOS=None,
+        flow_v=None,
+        flow_m=None,
+        speed=None,
+        b=Q_(0.005, "m"),
+        D=Q_(0.5, "m"),
+        power_losses=None,
+        casing_area=None,
+        casing_temperature=None,
+        ambient_temperature=None,
+        convection_constant=Q_(13.6, "W/(m²*degK)"),
+        polytropic_method=None,
+    ):
+        if polytropic_method is None:
+            polytropic_method = ccp.config.POLYTROPIC_METHOD
+        try:
+            head_eff = getattr(self, f"_head_eff_{polytropic_method}")
+        except AttributeError:
+            raise ValueError(
+                f"Polytropic method {polytropic_method} not available. Options are "
+                f'"mallen_saville", "sandberg_colby", "schultz" and "huntington".'
+            ) from None
+        self.polytropic_method = polytropic_method
+
+        if suc is None:
+            suc = StateArray(p=suc_p, T=suc_T, fluid=fluid, EOS=EOS)
+        if disch is None:
+            disch = StateArray(p=disch_p, T=disch_T, fluid=fluid, EOS=EOS)
+        if suc.shape != disch.shape:
+            raise ValueError(
+                f"Suction {suc.shape} and discharge {disch.shape} shapes differ."
+            )
+        self.suc = suc
+        self.disch = disch
+        self.shape = suc.shape
+        self.b = b
+        self.D = D
+        self.casing_area = casing_area
+        self.casing_temperature = casing_temperature
+        self.ambient_temperature = ambient_temperature
+        self.convection_constant = convection_constant
+        self.casing_heat_loss = None
 
-        flow_v_units = kwargs.get("flow_v_units", self.flow_v.units)
-        # Split in '.' for cases such as disch.rho.
-        # In this case the user gives rho_units instead of disch.rho_units
-        attr_units = kwargs.get(f"{attr.split('.')[-1]}_units", point_attr.units)
+        rho_suc = suc.rho().m
+        rho_disch = disch.rho().m
+        if flow_v is not None:
+            flow_v = np.broadcast_to(flow_v.m, self.shape)
+            flow_m = rho_suc * flow_v
+        elif flow_m is not None:
+            flow_m = np.broadcast_to(flow_m.m, self.shape)
+            flow_v = flow_m / rho_suc
+        else:
+            raise TypeError("A flow is required. Provide flow_v or flow_m.")
+        speed = np.broadcast_to(speed.m, self.shape)
 
-        if attr_units is not None:
-            point_attr = point_attr.to(attr_units)
+        head, eff = head_eff()
+        if casing_temperature is not None:
+            # correct efficiency with casing heat loss
+            casing_heat_loss = (
+                convection_constant.m
+                * casing_area.m
+                * (casing_temperature.m - ambient_temperature.m)
+            )
+            self.casing_heat_loss = Q_(casing_heat_loss, "W")
+            dh = disch.h().m - suc.h().m
+            eff = eff / (1 + casing_heat_loss / (dh * flow_m))
+
+        u = speed * D.m / 2
+        power = flow_m * head / eff
+        if power_losses is None:
+            power_losses = np.zeros(self.shape)
+        else:
+            power_losses = np.broadcast_to(power_losses.m, self.shape)
+        power_shaft = power + power_losses
+
+        dimensionless = _si_units["dimensionless"]
+        self.head = Q_(head, _si_units["head"])
+        self.eff = Q_(eff, dimensionless)
+        self.volume_ratio = Q_(rho_disch / rho_suc, dimensionless)
+        self.flow_v = Q_(flow_v, _si_units["flow_v"])
+        self.flow_m = Q_(flow_m, _si_units["flow_m"])
+        self.speed = Q_(speed, "rad/s")
+        self.phi = Q_(flow_v * 4 / (np.pi * D.m**2 * u), dimensionless)
+        self.psi = Q_(head / (u**2 / 2), dimensionless)
+        self.power = Q_(power, _si_units["power"])
+        self.power_losses = Q_(power_losses, _si_units["power"])
+        self.power_shaft = Q_(power_shaft, _si_units["power"])
+        self.torque = Q_(power_shaft / speed, _si_units["torque"])
+
+    # calculated on the first access, as in ccp.Point
+    @cached_property
+    def reynolds(self):
+        """Reynolds number (dimensionless)."""
+        u = self.speed.m * self.D.m / 2
+        reynolds = u * self.b.m * self.suc.rho().m / self.suc.viscosity().m
+        return Q_(reynolds, _si_units["dimensionless"])
+
+    @cached_property
+    def mach(self):
+        """Mach number (dimensionless)."""
+        u = self.speed.m * self.D.m / 2
+        return Q_(u / self.suc.speed_sound().m, _si_units["dimensionless"])
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, item):
+        """Return the element as a ccp.Point."""
+
+        def element(value):
+            # casing inputs can be given as scalars or arrays
+            if value is not None and np.ndim(value.m):
+                return value[item]
+            return value
+
+        return Point(
+            suc=self.suc[item],
+            disch=self.disch[item],
+            flow_v=self.flow_v[item],
+            speed=self.speed[item],
+            b=self.b,
+            D=self.D,
+            power_losses=self.power_losses[item],
+            casing_area=element(self.casing_area),
+            casing_temperature=element(self.casing_temperature),
+            ambient_temperature=element(self.ambient_temperature),
+            convection_constant=element(self.convection_constant),
+            polytropic_method=self.polytropic_method,
+        )
 
-        value = getattr(point_attr, "magnitude")
-        units = getattr(point_attr, "units")
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(shape={self.shape}, fluid={self.suc.fluid},"
+            f" polytropic_method={self.polytropic_method!r})"
+        )
 
-        flow_v = self.flow_v
+    def _head_eff_schultz(self):
+        suc, disch = self.suc, self.disch
+        # isentropic discharge states for the schultz factor
+        disch_s = StateArray(p=disch.p(), s=suc.s(), fluid=suc.mixture, EOS=suc.EOS)
+        hs, hd, h2s = suc.h().m, disch.h().m, disch_s.h().m
+        f = (h2s - hs) / _head_pol(suc, disch_s)
+        head = f * _head_pol(suc, disch)
 
-        name = kwargs.get(
-            "name", f"Flow: {flow_v.to(flow_v_units).m:.2f}, {attr}: {value:.2f}"
-        )
+        return head, head / (hd - hs)
 
-        if flow_v_units is not None:
-            flow_v = flow_v.to(flow_v_units)
+    def _head_eff_mallen_saville(self):
+        head = _head_pol_mallen_saville(self.suc, self.disch)
 
-        fig.add_trace(
-            go.Scatter(x=[flow_v], y=[value], name=name, marker_color=color, **plot_kws)
-        )
+        return head, head / (self.disch.h().m - self.suc.h().m)
 
-        return fig
+    def _head_eff_sandberg_colby(self):
+        head = _head_pol_sandberg_colby(self.suc, self.disch)
 
-    return inner
+        return head, head / (self.disch.h().m - self.suc.h().m)
+
+    def _head_eff_huntington(self):
+        suc, disch = self.suc, self.disch
+        p1, s1, z1, T1 = suc.p().m, suc.s().m, suc.z().m, suc.T().m
+        p2, s2, z2, T2 = disch.p().m, disch.s().m, disch.z().m, disch.T().m
+        p3 = np.sqrt(p1 * p2)
+        T3 = np.sqrt(T1 * T2)
+        a, b, c = np.empty((3,) + self.shape)
+
+        # the intermediate states are iterated until each element converges
+        active = np.ones(self.shape, dtype=bool)
+        n = 0
+        while active.any():
+            state3 = StateArray(
+                p=p3[active], T=T3[active], fluid=suc.mixture, EOS=suc.EOS
+            )
+            s3, z3, cp3 = state3.s().m, state3.z().m, state3.cp().m
+            pr = p2[active] / p1[active]
+            b[active] = (z1[active] + z2[active] - 2 * z3) / (np.sqrt(pr) - 1) ** 2
+            a[active] = z1[active] - b[active]
+            c[active] = (z2[active] - a[active] - b[active] * pr) / np.log(pr)
+            aa, bb, cc = a[active], b[active], c[active]
+            s3_ = s1[active] + (s2[active] - s1[active]) * (
+                (
+                    ((aa / 2) * np.log(pr))
+                    + bb * (np.sqrt(pr) - 1)
+                    + (cc / 8) * np.log(pr) ** 2
+                )
+                / (aa * np.log(pr) + bb * (pr - 1) + (cc / 2) * np.log(pr) ** 2)
+            )
+            T3_new = T3[active] * np.exp((s3_ - s3) / cp3)
+            error = abs(T3_new - T3[active])
+            T3[active] = T3_new
+            active[active] = error > 1e-10
+
+            n += 1
+            if n == 100:
+                raise RecursionError("Maximum number of iterations exceeded.")
+
+        R = suc._gas_constant / suc._molar_mass
+        pr = p2 / p1
+        inv_e = 1 + (
+            ((s2 - s1) / R)
+            / (a * np.log(pr) + b * (pr - 1) + (c / 2) * np.log(pr) ** 2)
+        )
+        eff = 1 / inv_e
+
+        return (disch.h().m - suc.h().m) * eff, eff
 
 
 def n_exp(suc, disch):
@@ -1389,10 +1797,15 @@ def n_exp(suc, disch):
     n_exp : float
         Polytropic exponent.
     """
-    ps = suc.p()
-    vs = 1 / suc.rho()
-    pd = disch.p()
-    vd = 1 / disch.rho()
+    return Q_(_n_exp(suc, disch), "dimensionless")
+
+
+def _n_exp(suc, disch):
+    """Polytropic exponent (float)."""
+    ps, rhos = suc.props_si("p", "rho")
+    pd, rhod = disch.props_si("p", "rho")
+    vs = 1 / rhos
+    vd = 1 / rhod
 
     return np.log(pd / ps) / np.log(vs / vd)
 
@@ -1422,15 +1835,19 @@ def head_pol(suc, disch):
     head_pol : pint.Quantity
         Polytropic head (J/kg).
     """
+    return Q_(_head_pol(suc, disch), "joule/kilogram")
+
 
-    n = n_exp(suc, disch)
+def _head_pol(suc, disch):
+    """Polytropic head (float, J/kg)."""
+    n = _n_exp(suc, disch)
 
-    p2 = disch.p()
-    v2 = 1 / disch.rho()
-    p1 = suc.p()
-    v1 = 1 / suc.rho()
+    p2, rho2 = disch.props_si("p", "rho")
+    v2 = 1 / rho2
+    p1, rho1 = suc.props_si("p", "rho")
+    v1 = 1 / rho1
 
-    return (n / (n - 1)) * (p2 * v2 - p1 * v1).to("joule/kilogram")
+    return (n / (n - 1)) * (p2 * v2 - p1 * v1)
 
 
 def eff_pol(suc, disch):
@@ -1449,9 +1866,14 @@ def eff_pol(suc, disch):
         Polytropic efficiency (dimensionless).
 
     """
-    wp = head_pol(suc, disch)
+    return Q_(_eff_pol(suc, disch), "dimensionless")
 
-    dh = disch.h() - suc.h()
+
+def _eff_pol(suc, disch):
+    """Polytropic efficiency (float)."""
+    wp = _head_pol(suc, disch)
+
+    dh = disch.props_si("h")[0] - suc.props_si("h")[0]
 
     return wp / dh
 
@@ -1471,11 +1893,21 @@ def head_isentropic(suc, disch):
     head_isentropic : pint.Quantity
         Isentropic head.
     """
-    # define state to isentropic discharge using dummy state
-    disch_s = copy(disch)
-    disch_s.update(p=disch.p(), s=suc.s())
+    return Q_(_head_isentropic(suc, disch), "joule/kilogram")
+
+
+@contextmanager
+def _disch_isentropic(suc, disch):
+    """Isentropic discharge state at the discharge pressure (scratch state)."""
+    with disch.scratch() as disch_s:
+        disch_s.update(p=disch.p(), s=suc.s())
+        yield disch_s
 
-    return head_pol(suc, disch_s).to("joule/kilogram")
+
+def _head_isentropic(suc, disch):
+    """Isentropic head (float, J/kg)."""
+    with _disch_isentropic(suc, disch) as disch_s:
+        return _head_pol(suc, disch_s)
 
 
 def eff_isentropic(suc, disch):
@@ -1493,10 +1925,10 @@ def eff_isentropic(suc, disch):
     eff_isentropic : pint.Quantity
         Isentropic efficiency.
     """
-    ws = head_isentropic(suc, disch)
-    dh = disch.h() - suc.h()
+    ws = _head_isentropic(suc, disch)
+    dh = disch.props_si("h")[0] - suc.props_si("h")[0]
 
-    return ws / dh
+    return Q_(ws / dh, "dimensionless")
 
 
 def f_schultz(suc, disch):
@@ -1521,13 +1953,14 @@ def f_schultz(suc, disch):
     f_schultz : float
         Schultz polytropic factor.
     """
+    return Q_(_f_schultz(suc, disch), "dimensionless")
 
-    # define state to isentropic discharge using dummy state
-    disch_s = copy(disch)
-    disch_s.update(p=disch.p(), s=suc.s())
 
-    h2s_h1 = disch_s.h() - suc.h()
-    h_isen = head_isentropic(suc, disch)
+def _f_schultz(suc, disch):
+    """Schultz polytropic factor (float)."""
+    with _disch_isentropic(suc, disch) as disch_s:
+        h2s_h1 = disch_s.props_si("h")[0] - suc.props_si("h")[0]
+        h_isen = _head_pol(suc, disch_s)
 
     return h2s_h1 / h_isen
 
@@ -1556,8 +1989,13 @@ def head_pol_schultz(suc, disch):
     head_pol_schultz : pint.Quantity
         Schultz polytropic head (J/kg).
     """
-    f = f_schultz(suc, disch)
-    head = head_pol(suc, disch)
+    return Q_(_head_pol_schultz(suc, disch), "joule/kilogram")
+
+
+def _head_pol_schultz(suc, disch):
+    """Schultz polytropic head (float, J/kg)."""
+    f = _f_schultz(suc, disch)
+    head = _head_pol(suc, disch)
 
     return f * head
 
@@ -1577,10 +2015,15 @@ def eff_pol_schultz(suc, disch):
     eff_pol_schultz : pint.Quantity
         Schultz polytropic efficiency (dimensionless).
     """
-    wp = head_pol_schultz(suc, disch)
-    dh = disch.h() - suc.h()
+    return Q_(_eff_pol_schultz(suc, disch), "dimensionless")
+
 
-    return (wp / dh).to("dimensionless")
+def _eff_pol_schultz(suc, disch):
+    """Schultz polytropic efficiency (float)."""
+    wp = _head_pol_schultz(suc, disch)
+    dh = disch.props_si("h")[0] - suc.props_si("h")[0]
+
+    return wp / dh
 
 
 def head_pol_mallen_saville(suc, disch):
@@ -1604,10 +2047,15 @@ def head_pol_mallen_saville(suc, disch):
     head_pol_mallen_saville : pint.Quantity
         Mallen-Saville polytropic polytropic head (J/kg).
     """
+    return Q_(_head_pol_mallen_saville(suc, disch), "joule/kilogram")
+
+
+def _head_pol_mallen_saville(suc, disch):
+    """Mallen-Saville polytropic head (float, J/kg)."""
+    hs, ss, Ts = suc.props_si("h", "s", "T")
+    hd, sd, Td = disch.props_si("h", "s", "T")
 
-    head = (disch.h() - suc.h()) - (disch.s() - suc.s()) * (
-        disch.T() - suc.T()
-    ) / np.log(disch.T() / suc.T())
+    head = (hd - hs) - (sd - ss) * (Td - Ts) / np.log(Td / Ts)
 
     return head
 
@@ -1627,16 +2075,18 @@ def eff_pol_mallen_saville(suc, disch):
     eff_pol_mallen_saville : pint.Quantity
         Mallen-Saville polytropic efficiency (dimensionless).
     """
-    wp = head_pol_mallen_saville(suc, disch)
-    dh = disch.h() - suc.h()
+    return Q_(_eff_pol_mallen_saville(suc, disch), "dimensionless")
 
-    return (wp / dh).to("dimensionless")
 
+def _eff_pol_mallen_saville(suc, disch):
+    """Mallen-Saville polytropic efficiency (float)."""
+    wp = _head_pol_mallen_saville(suc, disch)
+    dh = disch.props_si("h")[0] - suc.props_si("h")[0]
 
-_ref_H = 0
+    return wp / dh
 
 
-def head_reference(suc, disch, num_steps=100):
+def head_reference(suc, disch, num_steps=100, rtol=None, full_output=False):
     r"""Reference head.
 
     The reference head consists of the integration of :math:`v dp` along the
@@ -1658,12 +2108,27 @@ def head_reference(suc, disch, num_steps=100):
     The other evaluates the efficiency by checking the difference between
     the last :math:`T_1` to the discharge temperature :math:`T_d`.
 
+    If rtol is given, the number of segments is chosen adaptively: the number
+    of segments is doubled until the estimated error is below rtol, and each
+    pair of integrations is improved with Richardson extrapolation, since the
+    error is second order in the segment size.
+
     Parameters
     ----------
     suc : ccp.State
         Suction state.
     disch : ccp.State
         Discharge state.
+    num_steps : int, optional
+        Number of segments of the polytropic path. If rtol is given, this is
+        the maximum number of segments used by the adaptive integration.
+        Default is 100.
+    rtol : float, optional
+        Relative tolerance for the reference head. Default is None, which
+        integrates the path with num_steps segments.
+    full_output : bool, optional
+        If True, a dict with information on the integration is also returned.
+        Default is False.
 
     Returns
     -------
@@ -1671,56 +2136,93 @@ def head_reference(suc, disch, num_steps=100):
        Reference head as described by :cite:`huntington1985`. (J/kg).
     eff_reference : float
         Reference efficiency as described by :cite:`huntington1985` (dimensionless).
+    info : dict
+        Returned if full_output is True, with the number of segments
+        ('num_steps'), the estimated relative error of the head ('error', None
+        for a fixed number of segments) and the number of flashes ('flashes').
     """
+    if rtol is None:
+        head, eff, flashes = _solve_tiered(
+            lambda suc, eff0: _head_reference(suc, disch, num_steps, eff0),
+            suc,
+            seed=lambda result: result[1],
+        )
+        info = {"num_steps": num_steps, "error": None, "flashes": flashes}
+    else:
+        head, eff, info = _adaptive_reference(
+            lambda n, eff0: _head_reference(suc, disch, n, eff0),
+            disch.p().m / suc.p().m,
+            num_steps,
+            rtol,
+        )
 
-    def calc_step_discharge_temp(T1, p1, p0, h0, v0, e):
-        s1 = State(p=p1, T=T1, fluid=suc.fluid)
-        h1 = s1.h()
-
-        vm = (v0 + s1.v()) / 2
-        delta_p = Q_(p1 - p0, "Pa")
-        H0 = vm * delta_p
-        H1 = e * (h1 - h0)
+    if full_output:
+        return head, eff, info
+    return head, eff
 
-        return (H1 - H0).magnitude
 
-    def calc_eff(e, suc, disch):
-        rc = (disch.p().m / suc.p().m) ** (1 / num_steps)
-        p_intervals = [suc.p().m]
-        p = suc.p().m
-        for i in range(num_steps):
-            next_p = p * rc
-            p = next_p
-            p_intervals.append(p)
+def _head_reference(suc, disch, num_steps, eff0=None):
+    """Reference head, efficiency and number of flashes.
 
-        T0 = suc.T().magnitude
+    The head is accumulated in this call and the path is calculated with two
+    scratch states updated in place, so evaluations can run concurrently in
+    threads. Each segment starts from the end state of the previous one, which
+    is the initial guess for the flashes and for the temperature ratio.
+    """
+    p_suc, T_suc = suc.props_si("p", "T")
+    p_disch, T_disch = disch.props_si("p", "T")
+    rc = (p_disch / p_suc) ** (1 / num_steps)
+    # TODO implement p_intervals considering pressure ratio
+    p_intervals = [p_suc * rc**i for i in range(num_steps + 1)]
+    # temperature ratio of the last segment, initial guess for the next one
+    T_ratio = (T_disch / T_suc) ** (1 / num_steps)
+    head = 0
+    flashes = 0
+
+    def calc_step_discharge_temp(T1, p1, p0, h0, v0, e, end):
+        nonlocal flashes
+        flashes += 1
+        end.update(p=p1, T=T1)
+        h1, rho1 = end.props_si("h", "rho")
+
+        vm = (v0 + 1 / rho1) / 2
+        H0 = vm * (p1 - p0)
+        H1 = e * (h1 - h0)
 
-        global _ref_H
+        return H1 - H0
 
-        _ref_H = 0
+    def calc_eff(e, states):
+        nonlocal head, flashes, T_ratio
+        _count_iteration(suc)
+        head = 0
 
-        # TODO implement p_intervals considering pressure ratio
-        for p0, p1 in zip(p_intervals[:-1], p_intervals[1:]):
-            s0 = State(p=p0, T=T0, fluid=suc.fluid)
+        start = suc
+        for p0, p1, end in zip(p_intervals[:-1], p_intervals[1:], cycle(states)):
+            T0, h0, rho0 = start.props_si("T", "h", "rho")
+            end._set_guess_from(start)
             T1 = newton(
-                calc_step_discharge_temp, (T0 + 1e-3), args=(p1, p0, s0.h(), s0.v(), e)
+                calc_step_discharge_temp,
+                T0 * T_ratio,
+                args=(p1, p0, h0, 1 / rho0, e, end),
             )
-            s1 = State(p=p1, T=T1, fluid=suc.fluid)
-            _ref_H += head_pol(s0, s1)
-
-            T0 = T1
+            end.update(p=p1, T=T1)
+            flashes += 1
+            head += _head_pol(start, end)
 
-        return disch.T().magnitude - T1
+            T_ratio = T1 / T0
+            start = end
 
-    _ref_eff = newton(calc_eff, 0.8, args=(suc, disch))
+        return T_disch - T1
 
-    return _ref_H, _ref_eff
+    if eff0 is None:
+        eff0 = 0.8
+    with suc.scratch() as state0, suc.scratch() as state1:
+        eff = newton(calc_eff, eff0, args=((state0, state1),))
 
+    return Q_(head, "joule/kilogram"), eff, flashes
 
-_ref_H_2017 = 0
 
-
-def head_reference_2017(suc, disch, num_steps=100):
+def head_reference_2017(suc, disch, num_steps=100, rtol=None, full_output=False):
     r"""Reference head.
 
     The reference head consists of the integration along the
@@ -1742,6 +2244,8 @@ def head_reference_2017(suc, disch, num_steps=100):
           (s_{i+1} - s_i) = R \frac{(1-e)}{e}(a \ln{(\frac{p_{i+1}}{p_i})} + b(\frac{p_{i+1}}{p_i} - 1))
       \end{equation}
 
+    If rtol is given, the number of segments is chosen adaptively as in
+    :func:`head_reference`.
 
     Parameters
     ----------
@@ -1749,6 +2253,16 @@ def head_reference_2017(suc, disch, num_steps=100):
         Suction state.
     disch : ccp.State
         Discharge state.
+    num_steps : int, optional
+        Number of segments of the polytropic path. If rtol is given, this is
+        the maximum number of segments used by the adaptive integration.
+        Default is 100.
+    rtol : float, optional
+        Relative tolerance for the reference head. Default is None, which
+        integrates the path with num_steps segments.
+    full_output : bool, optional
+        If True, a dict with information on the integration is also returned.
+        Default is False.
 
     Returns
     -------
@@ -1756,49 +2270,130 @@ def head_reference_2017(suc, disch, num_steps=100):
        Reference head as described by :cite:`huntington2017`. (J/kg).
     eff_reference : float
         Reference efficiency as described by :cite:`huntington2017` (dimensionless).
+    info : dict
+        Returned if full_output is True, with the number of segments
+        ('num_steps'), the estimated relative error of the head ('error', None
+        for a fixed number of segments) and the number of flashes ('flashes').
     """
-    R = suc.gas_constant() / suc.molar_mass()
-    rc = (disch.p().m / suc.p().m) ** (1 / num_steps)
-    p_intervals = [suc.p().m]
-    p = suc.p().m
-    for i in range(num_steps):
-        next_p = p * rc
-        p = next_p
-        p_intervals.append(p)
-
-    def calc_step_discharge_z(s1, s0, p1, p0, z0, R, e):
-        state1 = ccp.State(p=p1, s=s1, fluid=suc.fluid)
-        z1 = state1.z()
+    if rtol is None:
+        head, eff, flashes = _solve_tiered(
+            lambda suc, eff0: _head_reference_2017(suc, disch, num_steps, eff0),
+            suc,
+            seed=lambda result: result[1],
+        )
+        info = {"num_steps": num_steps, "error": None, "flashes": flashes}
+    else:
+        head, eff, info = _adaptive_reference(
+            lambda n, eff0: _head_reference_2017(suc, disch, n, eff0),
+            disch.p().m / suc.p().m,
+            num_steps,
+            rtol,
+        )
+
+    if full_output:
+        return head, eff, info
+    return head, eff
+
+
+def _head_reference_2017(suc, disch, num_steps, eff0=None):
+    """Reference head, efficiency and number of flashes as described by
+    :cite:`huntington2017`.
+
+    The path is calculated as in :func:`_head_reference`, with the entropy
+    change of the previous segment as initial guess for each segment.
+    """
+    R = suc.gas_constant().m / suc.molar_mass().m
+    p_suc, s_suc = suc.props_si("p", "s")
+    p_disch, s_disch, T_disch = disch.props_si("p", "s", "T")
+    rc = (p_disch / p_suc) ** (1 / num_steps)
+    p_intervals = [p_suc * rc**i for i in range(num_steps + 1)]
+    # entropy change of the last segment, initial guess for the next one
+    delta_s = (s_disch - s_suc) / num_steps
+    head = 0
+    flashes = 0
+
+    def calc_step_discharge_z(s1, s0, p1, p0, z0, e, end):
+        nonlocal flashes
+        flashes += 1
+        end.update(p=p1, s=s1)
+        z1, s1 = end.props_si("z", "s")
         a = (z0 * (p1 / p0) - z1) / ((p1 / p0) - 1)
         b = (z1 - z0) / ((p1 / p0) - 1)
 
-        return (
-            (R * ((1 - e) / e)) * (a * np.log(p1 / p0) + b * ((p1 / p0) - 1))
-            - (state1.s() - Q_(s0, state1.s().units))
-        ).magnitude
+        return (R * ((1 - e) / e)) * (a * np.log(p1 / p0) + b * ((p1 / p0) - 1)) - (
+            s1 - s0
+        )
 
-    def calc_eff(e, suc, disch, p_intervals):
-        global _ref_H_2017
-        _ref_H_2017 = 0
-        s0 = suc.s().magnitude
+    def calc_eff(e, states):
+        nonlocal head, flashes, delta_s
+        _count_iteration(suc)
+        head = 0
+
+        start = suc
+        for p0, p1, end in zip(p_intervals[:-1], p_intervals[1:], cycle(states)):
+            s0, z0 = start.props_si("s", "z")
+            end._set_guess_from(start)
+            s1 = newton(
+                calc_step_discharge_z, s0 + delta_s, args=(s0, p1, p0, z0, e, end)
+            )
+            end.update(p=p1, s=s1)
+            flashes += 1
+            head += _head_pol(start, end)
 
-        for p0, p1 in zip(p_intervals[:-1], p_intervals[1:]):
-            state0 = ccp.State(p=p0, s=s0, fluid=suc.fluid)
-            z0 = state0.z()
+            delta_s = s1 - s0
+            start = end
 
-            s1 = newton(calc_step_discharge_z, (s0 + 1e-8), args=(s0, p1, p0, z0, R, e))
-            state1 = ccp.State(p=p1, s=s1, fluid=suc.fluid)
-            _ref_H_2017 += ccp.point.head_pol(state0, state1)
+        return T_disch - end.props_si("T")[0]
 
-            s0 = s1
-            T1 = state1.T().magnitude
+    if eff0 is None:
+        eff0 = _eff_pol_huntington(suc, disch)
+    with suc.scratch() as state0, suc.scratch() as state1:
+        eff = newton(calc_eff, eff0, args=((state0, state1),))
 
-        return disch.T().magnitude - T1
+    return Q_(head, "joule/kilogram"), eff, flashes
 
-    eff0 = ccp.point.eff_pol_huntington(suc, disch)
-    _ref_eff = newton(calc_eff, eff0, args=(suc, disch, p_intervals))
 
-    return _ref_H_2017, _ref_eff
+def _adaptive_reference(solve, pressure_ratio, max_steps, rtol):
+    """Integrate the reference path doubling the number of segments.
+
+    solve(num_steps, eff0) returns the head, efficiency and number of flashes
+    with the path split into num_steps segments, starting the efficiency
+    iterations from eff0. The error of both reference methods is second order
+    in the segment size, so each pair of integrations is improved with
+    Richardson extrapolation, and the relative change of the result between
+    two levels is the error estimate. The segments are doubled, warm starting
+    from the last efficiency, until the error is below rtol or max_steps would
+    be exceeded.
+
+    The first integration has the fewest segments (at least 2) with a pressure
+    ratio that allows the flashes along the path to be warm started.
+    """
+    num_steps = 2
+    while (
+        pressure_ratio ** (1 / num_steps) - 1 > _WARM_START_MAX_STEP
+        and 4 * num_steps <= max_steps
+    ):
+        num_steps *= 2
+    head_coarse, eff_coarse, flashes = solve(num_steps, None)
+    head, eff = head_coarse, eff_coarse
+    error = np.inf
+    while error > rtol and 2 * num_steps <= max_steps:
+        num_steps *= 2
+        head_fine, eff_fine, flashes_fine = solve(num_steps, eff)
+        flashes += flashes_fine
+        head_last = head
+        head = head_fine + (head_fine - head_coarse) / 3
+        eff = eff_fine + (eff_fine - eff_coarse) / 3
+        error = abs(float((head - head_last) / head))
+        head_coarse, eff_coarse = head_fine, eff_fine
+
+    if error > rtol:
+        warn(
+            f"Reference head did not reach rtol={rtol} with {num_steps} "
+            f"segments, estimated error is {error:.2e}."
+        )
+
+    return head, eff, {"num_steps": num_steps, "error": error, "flashes": flashes}
 
 
 def f_sandberg_colby(suc, disch):
@@ -1824,22 +2419,21 @@ def f_sandberg_colby(suc, disch):
     f_sandberg_colby : pint.Quantity
        Polytropic head correction factor as described by :cite:`sandberg2013limitations` (dimensionless).
     """
-    Tm = (suc.T() + disch.T()) / 2
-    hd = disch.h()
-    hs = suc.h()
-    sd = disch.s()
-    ss = suc.s()
-    n = n_exp(suc, disch)
-    pd = disch.p()
-    ps = suc.p()
-    vd = disch.v()
-    vs = suc.v()
+    return Q_(_f_sandberg_colby(suc, disch), "dimensionless")
+
+
+def _f_sandberg_colby(suc, disch):
+    """Sandberg-Colby polytropic head correction factor (float)."""
+    ps, vs, hs, ss, Ts = suc.props_si("p", "v", "h", "s", "T")
+    pd, vd, hd, sd, Td = disch.props_si("p", "v", "h", "s", "T")
+    Tm = (Ts + Td) / 2
+    n = _n_exp(suc, disch)
 
     f_sandberg_colby = ((hd - hs) - Tm * (sd - ss)) / (
         (n / (n - 1)) * (pd * vd - ps * vs)
     )
 
-    return f_sandberg_colby.to("dimensionless")
+    return f_sandberg_colby
 
 
 def head_pol_sandberg_colby(suc, disch):
@@ -1866,8 +2460,13 @@ def head_pol_sandberg_colby(suc, disch):
     head_pol_sandberg_colby : pint.Quantity
        Reference head as described by :cite:`sandberg2013limitations` (J/kg).
     """
-    f = f_sandberg_colby(suc, disch)
-    h = f * head_pol(suc, disch)
+    return Q_(_head_pol_sandberg_colby(suc, disch), "joule/kilogram")
+
+
+def _head_pol_sandberg_colby(suc, disch):
+    """Sandberg-Colby polytropic head (float, J/kg)."""
+    f = _f_sandberg_colby(suc, disch)
+    h = f * _head_pol(suc, disch)
     return h
 
 
@@ -1886,10 +2485,15 @@ def eff_pol_sandberg_colby(suc, disch):
     eff_pol_sandberg_colby: pint.Quantity
         Sandberg-Colby polytropic efficiency (dimensionless).
     """
-    wp = head_pol_sandberg_colby(suc, disch)
-    dh = disch.h() - suc.h()
+    return Q_(_eff_pol_sandberg_colby(suc, disch), "dimensionless")
+
 
-    return (wp / dh).to("dimensionless")
+def _eff_pol_sandberg_colby(suc, disch):
+    """Sandberg-Colby polytropic efficiency (float)."""
+    wp = _head_pol_sandberg_colby(suc, disch)
+    dh = disch.props_si("h")[0] - suc.props_si("h")[0]
+
+    return wp / dh
 
 
 def head_pol_huntington(suc, disch):
@@ -1949,8 +2553,13 @@ def head_pol_huntington(suc, disch):
     head_pol_huntington : pint.Quantity
        Polytropic head as described by :cite:`huntington1985` (J/kg).
     """
-    eff = eff_pol_huntington(suc, disch)
-    head = (disch.h() - suc.h()) * eff
+    return Q_(_head_pol_huntington(suc, disch), "joule/kilogram")
+
+
+def _head_pol_huntington(suc, disch):
+    """Huntington polytropic head (float, J/kg)."""
+    eff = _eff_pol_huntington(suc, disch)
+    head = (disch.props_si("h")[0] - suc.props_si("h")[0]) * eff
 
     return head
 
@@ -1970,24 +2579,25 @@ def eff_pol_huntington(suc, disch):
     eff_pol_huntington : pint.Quantity
        Polytropic efficiency as described by :cite:`huntington1985` (dimensionless).
     """
-    p1 = suc.p()
-    p2 = disch.p()
-    s1 = suc.s()
-    s2 = disch.s()
-    z1 = suc.z()
-    z2 = disch.z()
-    T1 = suc.T()
-    T2 = disch.T()
+    return Q_(_eff_pol_huntington(suc, disch), "dimensionless")
+
+
+def _eff_pol_huntington(suc, disch):
+    """Huntington polytropic efficiency (float)."""
+    p1, s1, z1, T1 = suc.props_si("p", "s", "z", "T")
+    p2, s2, z2, T2 = disch.props_si("p", "s", "z", "T")
     p3 = np.sqrt(p1 * p2)
 
     T3 = np.sqrt(T1 * T2)
     error = 1
     n = 0
+    state3 = None
     while error > 1e-10:
-        state3 = State(p=p3, T=T3, fluid=suc.fluid)
-        s3 = state3.s()
-        z3 = state3.z()
-        cp3 = state3.cp()
+        if state3 is None:
+            state3 = State(p=p3, T=T3, fluid=suc.fluid, EOS=suc.EOS)
+        else:
+            state3.update(p=p3, T=T3)
+        s3, z3, cp3 = state3.props_si("s", "z", "cp")
         b = (z1 + z2 - 2 * z3) / (np.sqrt(p2 / p1) - 1) ** 2
         a = z1 - b
         c = (z2 - a - b * (p2 / p1)) / np.log(p2 / p1)
@@ -2004,14 +2614,14 @@ def eff_pol_huntington(suc, disch):
             )
         )
         T3_new = T3 * np.exp((s3_ - s3) / cp3)
-        error = abs(T3_new - T3).m
+        error = abs(T3_new - T3)
         T3 = T3_new
 
         n += 1
         if n == 100:
             raise RecursionError("Maximum number of iterations exceeded.")
 
-    R = suc.gas_constant() / suc.molar_mass()
+    R = suc.gas_constant().m / suc.molar_mass().m
     inv_e = 1 + (
         ((s2 - s1) / R)
         / (a * np.log(p2 / p1) + b * ((p2 / p1) - 1) + (c / 2) * np.log(p2 / p1) ** 2)
@@ -2021,6 +2631,15 @@ def eff_pol_huntington(suc, disch):
     return eff
 
 
+# head and efficiency (floats) for each polytropic method, used by the si-fast mode
+_FLOAT_METHODS = {
+    "schultz": (_head_pol_schultz, _eff_pol_schultz),
+    "mallen_saville": (_head_pol_mallen_saville, _eff_pol_mallen_saville),
+    "sandberg_colby": (_head_pol_sandberg_colby, _eff_pol_sandberg_colby),
+    "huntington": (_head_pol_huntington, _eff_pol_huntington),
+}
+
+
 @check_units
 def power_calc(flow_m, head, eff):
     """Calculate power.
@@ -2235,6 +2854,72 @@ def head_from_psi(D, psi, speed):
     return head.to("J/kg")
 
 
+# residual evaluations of the nested solvers for each EOS, counted for each thread
+_solver_info = threading.local()
+
+
+def _solver_counts():
+    counts = getattr(_solver_info, "counts", None)
+    if counts is None:
+        counts = _solver_info.counts = {}
+    return counts
+
+
+def _count_iteration(suc):
+    counts = _solver_counts()
+    EOS = _source_eos(suc.EOS)
+    counts[EOS] = counts.get(EOS, 0) + 1
+
+
+def solver_info():
+    """Number of residual evaluations of the nested solvers for each EOS.
+
+    The solvers of the discharge state (e.g. disch_from_suc_head_eff) and of the
+    reference efficiency converge first on ccp.config.TIERED_EOS if it is set.
+    The evaluations are counted for the current thread.
+
+    Returns
+    -------
+    solver_info : dict
+        Dictionary with the number of evaluations for each EOS.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> from ccp.point import disch_from_suc_head_eff, solver_info, solver_info_clear
+    >>> Q_ = ccp.Q_
+    >>> solver_info_clear()
+    >>> fluid = {"Methane": 0.9, "Ethane": 0.1}
+    >>> suc = ccp.State(p=2e6, T=300, fluid=fluid, EOS="HEOS")
+    >>> disch = disch_from_suc_head_eff(suc, Q_(80000, "J/kg"), Q_(0.8, ""))
+    >>> evaluations = solver_info()["HEOS"]
+    """
+    return dict(_solver_counts())
+
+
+def solver_info_clear():
+    """Reset the counters of the nested solvers for the current thread."""
+    _solver_counts().clear()
+
+
+def _solve_tiered(solve, suc, seed):
+    """Run a solver on ccp.config.TIERED_EOS first and polish on the state EOS.
+
+    solve(suc, x0) runs the solver for a suction state, starting from x0 (its
+    own initial guess if x0 is None), and returns the result. seed(result)
+    returns the solved variable (e.g. discharge pressure) of a result. The
+    variable converged with the cheap EOS is the initial guess for the solver
+    with the suction state EOS, which then only needs the final iterations.
+    """
+    x0 = None
+    cheap_EOS = ccp.config.TIERED_EOS
+    if cheap_EOS is not None and cheap_EOS != _source_eos(suc.EOS):
+        suc_cheap = State(p=suc.p(), T=suc.T(), fluid=suc.mixture, EOS=cheap_EOS)
+        x0 = seed(solve(suc_cheap, None))
+
+    return solve(suc, x0)
+
+
 def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
     """Calculate discharge state from suction, head and efficiency.
 
@@ -2256,20 +2941,29 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
     head_calc_func = globals()[f"head_pol_{polytropic_method}"]
-    h_disch = head / eff + suc.h()
 
-    #  consider first an isentropic compression
-    disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid)
+    def solve(suc, p0):
+        h_disch = head / eff + suc.h()
+
+        if p0 is None:
+            #  consider first an isentropic compression
+            disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid, EOS=suc.EOS)
+            p0 = disch.p().magnitude
+        else:
+            disch = State(h=h_disch, p=p0, fluid=suc.fluid, EOS=suc.EOS)
 
-    def update_pressure(p):
-        disch.update(h=h_disch, p=p)
-        new_head = head_calc_func(suc, disch)
+        def update_pressure(p):
+            disch.update(h=h_disch, p=p)
+            _count_iteration(suc)
+            new_head = head_calc_func(suc, disch)
 
-        return (new_head - head).magnitude
+            return (new_head - head).magnitude
 
-    newton(update_pressure, disch.p().magnitude, tol=1e-1)
+        newton(update_pressure, p0, tol=1e-1)
 
-    return disch
+        return disch
+
+    return _solve_tiered(solve, suc, seed=lambda disch: disch.p().magnitude)
 
 
 def disch_from_suc_disch_p_eff(suc, disch_p, eff, polytropic_method=None):
@@ -2328,18 +3022,27 @@ def disch_from_suc_disch_T_head(suc, disch_T, head, polytropic_method=None):
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
-    disch = ccp.State(T=disch_T, s=suc.s(), fluid=suc.fluid)
     head_calc_func = globals()[f"head_pol_{polytropic_method}"]
 
-    def update_state(x):
-        disch.update(T=disch_T, p=x)
-        new_head = head_calc_func(suc, disch)
+    def solve(suc, p0):
+        if p0 is None:
+            disch = ccp.State(T=disch_T, s=suc.s(), fluid=suc.fluid, EOS=suc.EOS)
+            p0 = disch.p().magnitude
+        else:
+            disch = ccp.State(T=disch_T, p=p0, fluid=suc.fluid, EOS=suc.EOS)
 
-        return (new_head - head).magnitude
+        def update_state(x):
+            disch.update(T=disch_T, p=x)
+            _count_iteration(suc)
+            new_head = head_calc_func(suc, disch)
 
-    newton(update_state, disch.p().magnitude, tol=1e-7)
+            return (new_head - head).magnitude
 
-    return disch
+        newton(update_state, p0, tol=1e-7)
+
+        return disch
+
+    return _solve_tiered(solve, suc, seed=lambda disch: disch.p().magnitude)
 
 
 @check_units
@@ -2363,7 +3066,8 @@ def reynolds(suc, speed, b, D):
         Reynolds number (dimensionless).
     """
     u = u_calc(D, speed)
-    re = u * b * suc.rho() / suc.viscosity()
+    suc_props = suc.properties(["rho", "viscosity"])
+    re = u * b * suc_props["rho"] / suc_props["viscosity"]
 
     return re.to("dimensionless")
 
@@ -0,0 +1,375 @@
+"""Tabulated thermodynamic properties for a fixed fluid composition.
+
+A property table is built once per composition on a (ln(p), T) grid, using the
+source EOS (e.g. REFPROP). Properties are then calculated by bicubic
+(Catmull-Rom) interpolation, which only uses the 4x4 nodes around the requested
+point. States that are outside the table, or close to nodes that could not be
+calculated (e.g. two phase region), are not answered by the table and should
+be calculated with the source EOS.
+
+The table is used by ccp.State when EOS="TABLE" (source EOS given by
+ccp.config.TABLE_EOS) or EOS="TABLE&<source EOS>" (e.g. "TABLE&HEOS").
+"""
+import hashlib
+import json
+from pathlib import Path
+from warnings import warn
+
+import numpy as np
+
+import ccp.config
+from .mixture import Mixture, _MixtureCache
+
+__all__ = ["PropertyTable", "get_table"]
+
+TABLE_PROPERTIES = ["h", "s", "rho", "z", "cp", "speed_sound"]
+
+# tables already built or loaded in this process
+_tables = _MixtureCache()
+
+
+def _weights(t):
+    """Catmull-Rom weights for the 4 nodes around t in [0, 1]."""
+    t2 = t * t
+    t3 = t2 * t
+    return np.array(
+        [
+            (-t3 + 2 * t2 - t) / 2,
+            (3 * t3 - 5 * t2 + 2) / 2,
+            (-3 * t3 + 4 * t2 + t) / 2,
+            (t3 - t2) / 2,
+        ]
+    )
+
+
+def table_key(fluid, EOS):
+    """Key used to identify a table from the composition and source EOS.
+
+    The composition is resolved as a ccp.Mixture, so fluid aliases (e.g. "n2"
+    and "nitrogen") give the same key.
+    """
+    composition = sorted((k, round(v, 8)) for k, v in Mixture(fluid).items())
+    key = json.dumps([EOS, composition])
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+class PropertyTable:
+    """Table with properties calculated on a (ln(p), T) grid.
+
+    Parameters
+    ----------
+    fluid : dict
+        Dictionary with constituent and composition (mole fraction).
+    EOS : str
+        Source EOS used to build the table.
+    p : np.ndarray
+        Pressure nodes (Pa), equally spaced in ln(p).
+    T : np.ndarray
+        Temperature nodes (degK), equally spaced.
+    values : np.ndarray
+        Array with shape (len(TABLE_PROPERTIES), len(p), len(T)) with the
+        properties at each node. Nodes that could not be calculated are nan.
+    max_error : dict, optional
+        Maximum relative interpolation error for each property, evaluated against
+        the source EOS.
+
+    Attributes
+    ----------
+    p_range : tuple
+        Pressure range (Pa) covered by the table.
+    T_range : tuple
+        Temperature range (degK) covered by the table.
+    max_error : dict
+        Maximum relative interpolation error for each property.
+    """
+
+    def __init__(self, fluid, EOS, p, T, values, max_error=None):
+        self.fluid = fluid
+        self.EOS = EOS
+        self.p = np.asarray(p)
+        self.T = np.asarray(T)
+        self.values = np.asarray(values)
+        self.max_error = max_error
+
+        self._x0 = np.log(self.p[0])
+        self._dx = np.log(self.p[1]) - self._x0
+        self._y0 = self.T[0]
+        self._dy = self.T[1] - self._y0
+        # interpolation requires one node before and two after the cell
+        self.p_range = (float(self.p[1]), float(self.p[-2]))
+        self.T_range = (float(self.T[1]), float(self.T[-2]))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(EOS={self.EOS}, "
+            f"p_range={self.p_range}, T_range={self.T_range}, "
+            f"max_error={self.max_error})"
+        )
+
+    @classmethod
+    def build(
+        cls,
+        fluid,
+        EOS=None,
+        p_range=(1e5, 2e7),
+        T_range=(250, 550),
+        num_p=60,
+        num_T=60,
+        error_samples=20,
+    ):
+        """Build a table with the source EOS.
+
+        Parameters
+        ----------
+        fluid : dict
+            Dictionary with constituent and composition (mole fraction).
+        EOS : str, optional
+            Source EOS. Default is ccp.config.TABLE_EOS.
+        p_range : tuple, optional
+            Pressure range (Pa). Default is (1e5, 2e7).
+        T_range : tuple, optional
+            Temperature range (degK). Default is (250, 550).
+        num_p, num_T : int, optional
+            Number of intervals in pressure and temperature. Default is 60.
+        error_samples : int, optional
+            Number of cells in each direction (at the cell centers) used to
+            evaluate the interpolation error. Default is 20.
+
+        Returns
+        -------
+        table : ccp.property_table.PropertyTable
+        """
+        from ccp.state import State
+
+        if EOS is None:
+            EOS = ccp.config.TABLE_EOS
+
+        # add one node before and two after the range required by the interpolation
+        x_min, x_max = np.log(p_range)
+        dx = (x_max - x_min) / num_p
+        dy = (T_range[1] - T_range[0]) / num_T
+        p = np.exp(x_min + dx * np.arange(-1, num_p + 2))
+        T = T_range[0] + dy * np.arange(-1, num_T + 2)
+
+        state = State(p=p[1], T=T[-2], fluid=fluid, EOS=EOS)
+        values = np.full((len(TABLE_PROPERTIES), len(p), len(T)), np.nan)
+        for i, p_i in enumerate(p):
+            for j, T_j in enumerate(T):
+                values[:, i, j] = _calc_properties(state, p_i, T_j)
+
+        table = cls(state.fluid, EOS, p, T, values)
+
+        # evaluate error at the cell centers
+        i_samples = np.linspace(1, num_p, min(error_samples, num_p), dtype=int)
+        j_samples = np.linspace(1, num_T, min(error_samples, num_T), dtype=int)
+        errors = np.zeros(len(TABLE_PROPERTIES))
+        for i in i_samples:
+            for j in j_samples:
+                p_c = np.sqrt(p[i] * p[i + 1])
+                T_c = (T[j] + T[j + 1]) / 2
+                interpolated = table._interpolate(p_c, T_c)
+                if interpolated is None:
+                    continue
+                exact = _calc_properties(state, p_c, T_c)
+                error = np.abs((interpolated - exact) / exact)
+                errors = np.fmax(errors, error)
+        table.max_error = dict(zip(TABLE_PROPERTIES, errors.tolist()))
+
+        return table
+
+    def _conflicts(self, p_range=None, T_range=None, num_p=None, num_T=None, **kwargs):
+        """Check if the table grid differs from the given build arguments."""
+        if num_p is not None and num_p != len(self.p) - 3:
+            return True
+        if num_T is not None and num_T != len(self.T) - 3:
+            return True
+        if p_range is not None and not np.allclose(p_range, self.p_range, rtol=1e-9):
+            return True
+        if T_range is not None and not np.allclose(T_range, self.T_range, rtol=1e-9):
+            return True
+        return False
+
+    def _interpolate(self, p, T):
+        """Interpolate all properties. Returns None if outside the table."""
+        x = (np.log(p) - self._x0) / self._dx
+        y = (T - self._y0) / self._dy
+        i = int(np.floor(x))
+        j = int(np.floor(y))
+        if not (1 <= i <= len(self.p) - 3 and 1 <= j <= len(self.T) - 3):
+            return None
+
+        block = self.values[:, i - 1 : i + 3, j - 1 : j + 3]
+        result = _weights(x - i) @ block @ _weights(y - j)
+        if np.isnan(result).any():
+            return None
+
+        return result
+
+    def _solve_T(self, p, prop, value):
+        """Find T for a given p and h or s. Returns None if outside the table."""
+        x = (np.log(p) - self._x0) / self._dx
+        i = int(np.floor(x))
+        if not 1 <= i <= len(self.p) - 3:
+            return None
+
+        k = TABLE_PROPERTIES.index(prop)
+        # property interpolated in p for each temperature node
+        column = _weights(x - i) @ self.values[k, i - 1 : i + 3, :]
+        # nodes that could not be calculated are not used to bracket the value
+        nodes = np.flatnonzero(~np.isnan(column))
+        n = int(np.searchsorted(column[nodes], value))
+        if not 1 <= n < len(nodes):
+            return None
+        j = nodes[n - 1]
+        if not 1 <= j <= len(self.T) - 3:
+            return None
+
+        P0, P1, P2, P3 = column[j - 1 : j + 3]
+        if np.isnan([P0, P1, P2, P3]).any():
+            return None
+        coefficients = [
+            -0.5 * P0 + 1.5 * P1 - 1.5 * P2 + 0.5 * P3,
+            P0 - 2.5 * P1 + 2 * P2 - 0.5 * P3,
+            (P2 - P0) / 2,
+            P1 - value,
+        ]
+        for root in np.roots(coefficients):
+            if abs(root.imag) < 1e-12 and -1e-9 <= root.real <= 1 + 1e-9:
+                return self._y0 + (j + root.real) * self._dy
+
+        return None
+
+    def state_values(self, p=None, T=None, h=None, s=None):
+        """Properties for a state defined by (p, T), (p, h) or (p, s).
+
+        Returns
+        -------
+        values : dict, None
+            Dictionary with p, T and the tabulated properties (SI units), or None
+            if the state is not covered by the table.
+        """
+        if p is None:
+            return None
+        if T is None:
+            if h is not None:
+                T = self._solve_T(p, "h", h)
+            elif s is not None:
+                T = self._solve_T(p, "s", s)
+            if T is None:
+                return None
+
+        interpolated = self._interpolate(p, T)
+        if interpolated is None:
+            return None
+
+        values = dict(zip(TABLE_PROPERTIES, interpolated.tolist()))
+        values["p"] = float(p)
+        values["T"] = float(T)
+
+        return values
+
+    def save(self, file):
+        """Save table to a .npz file."""
+        np.savez(
+            file,
+            fluid=json.dumps(self.fluid),
+            EOS=self.EOS,
+            p=self.p,
+            T=self.T,
+            values=self.values,
+            max_error=json.dumps(self.max_error),
+        )
+
+    @classmethod
+    def load(cls, file):
+        """Load table from a .npz file."""
+        with np.load(file) as data:
+            return cls(
+                json.loads(str(data["fluid"])),
+                str(data["EOS"]),
+                data["p"],
+                data["T"],
+                data["values"],
+                max_error=json.loads(str(data["max_error"])),
+            )
+
+
+def _calc_properties(state, p, T):
+    """Calculate tabulated properties with the source EOS."""
+    try:
+        state.update(p=p, T=T)
+        if 0 <= state.Q() <= 1:
+            # two phase region is not tabulated
+            return np.nan
+        return [
+            state.h().m,
+            state.s().m,
+            state.rho().m,
+            state.z().m,
+            state.cp().m,
+            state.speed_sound().m,
+        ]
+    except ValueError:
+        return np.nan
+
+
+def get_table(fluid, EOS=None, **kwargs):
+    """Get the property table for a fluid composition.
+
+    The table is retrieved from memory, or loaded from ccp.config.TABLE_DIR if it
+    has been saved by a previous process. Otherwise it is built (and saved if
+    ccp.config.TABLE_DIR is set).
+
+    Parameters
+    ----------
+    fluid : dict
+        Dictionary with constituent and composition (mole fraction).
+    EOS : str, optional
+        Source EOS. Default is ccp.config.TABLE_EOS.
+    kwargs : optional
+        Arguments passed to PropertyTable.build. A table saved with a different
+        grid is rebuilt. A table already in memory with a different grid raises
+        a ValueError, since it may be in use by existing states.
+
+    Returns
+    -------
+    table : ccp.property_table.PropertyTable
+    """
+    if EOS is None:
+        EOS = ccp.config.TABLE_EOS
+
+    key = table_key(fluid, EOS)
+    table = _tables.get(key)
+    if table is not None:
+        if table._conflicts(**kwargs):
+            raise ValueError(
+                f"A property table with a different grid ({table}) was already "
+                f"built for this fluid. Use PropertyTable.build to build a table "
+                f"with {kwargs}."
+            )
+        return table
+
+    table_dir = ccp.config.TABLE_DIR
+    file = None
+    if table_dir is not None:
+        file = Path(table_dir) / f"{key}.npz"
+        if file.is_file():
+            table = PropertyTable.load(file)
+            if table._conflicts(**kwargs):
+                table = None
+
+    if table is None:
+        warn(
+            f"Building a property table for {dict(Mixture(fluid))} with {EOS}. "
+            f"This requires one flash for each node and error sample (about 4400 "
+            f"flashes with the default grid). Set ccp.config.TABLE_DIR to reuse "
+            f"the table in other processes."
+        )
+        table = PropertyTable.build(fluid, EOS=EOS, **kwargs)
+        if file is not None:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            table.save(file)
+
+    _tables[key] = table
+
+    return table
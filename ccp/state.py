@@ -1,17 +1,214 @@
+import threading
+from contextlib import contextmanager
 from copy import copy
+from functools import wraps
 from warnings import warn
 
 import CoolProp.CoolProp as CP
 import numpy as np
 import ccp.config
-from scipy.optimize import newton
 from plotly import graph_objects as go
 from itertools import combinations
-from . import _RP
 
 from . import Q_
-from .config.fluids import get_name, normalize_mix
 from .config.units import check_units
+from .config.utilities import BindOnAccess
+from .mixture import Mixture, _MixtureCache
+from .phase_envelope import get_phase_envelope
+from .property_table import get_table
+
+
+def _is_table_eos(EOS):
+    if EOS is None:
+        EOS = ccp.config.EOS
+    return EOS.split("&")[0] == "TABLE"
+
+
+def _source_eos(EOS):
+    """EOS used by the CoolProp backend (source EOS for property tables)."""
+    if EOS is None:
+        EOS = ccp.config.EOS
+    if _is_table_eos(EOS):
+        _, _, source = EOS.partition("&")
+        return source or ccp.config.TABLE_EOS
+    return EOS
+
+
+# REFPROP fluid string and mole fractions for each fluid composition
+_refprop_args = _MixtureCache()
+
+
+def refprop_flash(fluid, inputs, outputs, a, b):
+    """Calculate properties for arrays of states directly with REFPROP.
+
+    Used as fallback when the CoolProp backend does not converge (e.g. near the
+    critical point or for CO2 rich gases), forcing the phase with the inputs
+    (e.g. "PTV" for vapor). The REFPROP fluid string and mole fractions are
+    created once for each composition and the fluids are loaded by the first
+    REFPROPdll call, the next elements only flash the loaded mixture.
+
+    Parameters
+    ----------
+    fluid : dict, ccp.Mixture
+        Dictionary with constituent and composition (mole fraction).
+    inputs : str
+        REFPROP inputs (e.g. "PTV" or "DSV").
+    outputs : str
+        Comma separated REFPROP outputs (e.g. "Cp" or "P,T").
+    a, b : float, array_like
+        Values of the inputs (mass base SI units).
+
+    Returns
+    -------
+    values : np.ndarray
+        Array with one row for each output and the shape of the inputs. Elements
+        that REFPROP could not calculate are nan.
+
+    Examples
+    --------
+    >>> from ccp.state import refprop_flash
+    >>> fluid = {"CarbonDioxide": 0.9, "Methane": 0.1}
+    >>> cp, = refprop_flash(fluid, "PTV", "Cp", [7e6, 8e6], 305.0)
+    """
+    mixture = Mixture(fluid)
+    args = _refprop_args.get(mixture)
+    if args is None:
+        fluids = mixture.backend_string.replace("&", "*")
+        args = _refprop_args[mixture] = (fluids, list(mixture.fractions))
+    fluids, z = args
+
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    n_outputs = outputs.count(",") + 1
+    values = np.full((n_outputs, a.size), np.nan)
+    refprop = ccp._RP
+    mass_base_si = refprop.MASS_BASE_SI
+    for i, (a_i, b_i) in enumerate(zip(a.flat, b.flat)):
+        r = refprop.REFPROPdll(fluids, inputs, outputs, mass_base_si, 0, 0, a_i, b_i, z)
+        # an empty fluid string keeps the fluids loaded by the first call
+        fluids = ""
+        if r.ierr <= 0:
+            values[:, i] = r.Output[:n_outputs]
+
+    return values.reshape((n_outputs,) + a.shape)
+
+
+# counters for the states of each thread: hits and misses of the property cache,
+# p-T flashes with (warm) and without (cold) an initial guess and scratch states
+# created and reused
+_state_info = threading.local()
+
+_STATE_COUNTERS = {
+    "cache": ("hits", "misses"),
+    "flash": ("warm", "cold"),
+    "scratch": ("created", "reused"),
+}
+
+
+def _state_counts(name):
+    counts = getattr(_state_info, name, None)
+    if counts is None:
+        counts = {key: 0 for key in _STATE_COUNTERS[name]}
+        setattr(_state_info, name, counts)
+    return counts
+
+
+# maximum relative change in p and T to use the previous state as initial guess
+_WARM_START_MAX_STEP = 0.2
+
+# minimum margin (degK) to the dew line of the initial guess and the new state
+_WARM_START_DEW_MARGIN = 5.0
+
+# dew line (ln(p), T) for each fluid composition, None if it could not be built
+_warm_start_dew_lines = _MixtureCache()
+
+
+def _gas_side(mixture, p, T):
+    """Check if (p, T) is in the gas region, above the dew line with a margin.
+
+    Warm started flashes solve the density from the initial guess and skip the
+    phase stability analysis, so they are only used if the guess and the new
+    state are in the gas region. Pressures outside the dew line are compared
+    with the nearest end of the line (the cricondentherm at high pressures),
+    which is conservative.
+    """
+    try:
+        dew_line = _warm_start_dew_lines[mixture]
+    except KeyError:
+        try:
+            phase_envelope = get_phase_envelope(mixture, "HEOS")
+            dew_line = (np.log(phase_envelope.p_dew), phase_envelope.T_dew)
+            if not len(phase_envelope.T_dew):
+                dew_line = None
+        except (ValueError, RuntimeError):
+            dew_line = None
+        _warm_start_dew_lines[mixture] = dew_line
+
+    if dew_line is None:
+        return False
+    return T > np.interp(np.log(p), *dew_line) + _WARM_START_DEW_MARGIN
+
+
+# p (Pa) and T (degK) of the reference states used to start the p-h and p-s solvers
+_SOLVER_REFERENCE_PT = (1e5, 300.0)
+
+# reference state (p, T, h, s, cp, rho) for each backend and fluid composition
+_solver_references = _MixtureCache()
+
+
+# scratch states available for each thread, keyed by EOS and fluid composition
+_scratch_states = threading.local()
+
+# transport property companion states for each thread, keyed by EOS and fluid
+_transport_states = threading.local()
+
+
+def _cached(func):
+    """Cache a property of the state until the state is updated.
+
+    The value is cached in SI units and converted if units are requested.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self, units=None):
+        try:
+            value = self._cache[name]
+            _state_counts("cache")["hits"] += 1
+        except KeyError:
+            if self._pending is not None:
+                self._flash_pending()
+            value = func(self)
+            self._cache[name] = value
+            _state_counts("cache")["misses"] += 1
+        if units:
+            value = value.to(units)
+        return value
+
+    return wrapper
+
+
+def _point_plot_func(state, attr):
+    """Plot function of the point that uses the state (e.g. point.suc.T_plot)."""
+    point = state.__dict__.get("_point")
+    if point is None:
+        raise AttributeError(f"{attr}_plot is only available for point states")
+    name = "suc" if point.suc is state else "disch"
+    return ccp.point.plot_func(point, f"{name}.{attr}")
+
+
+# properties that are read directly from the backend with keyed_output and
+# their SI units
+_keyed_outputs = {
+    "p": (CP.iP, "pascal"),
+    "T": (CP.iT, "kelvin"),
+    "h": (CP.iHmass, "joule/kilogram"),
+    "s": (CP.iSmass, "joule/(kelvin kilogram)"),
+    "rho": (CP.iDmass, "kilogram/m**3"),
+    "cp": (CP.iCpmass, "joule/(kilogram kelvin)"),
+    "cv": (CP.iCvmass, "joule/(kilogram kelvin)"),
+    "viscosity": (CP.iviscosity, "pascal second"),
+    "conductivity": (CP.iconductivity, "W/m/degK"),
+}
 
 
 class State(CP.AbstractState):
@@ -35,12 +232,21 @@ class State(CP.AbstractState):
         Entropy
     rho : float, pint.Quantity
         Specific mass
-    fluid : dict
+    fluid : dict, ccp.Mixture
         Dictionary with constituent and composition (mole fraction).
         (e.g.: fluid={'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092})
     EOS : str, optional
-        String with REFPROP, HEOS, PR or SRK.
+        String with REFPROP, HEOS, PR, SRK or TABLE.
+        With TABLE, properties are interpolated from a table built with the EOS
+        set in ccp.config.TABLE_EOS ("TABLE&HEOS" can be used to set the source
+        EOS directly). See :py:mod:`ccp.property_table`.
         Default is set in ccp.config.EOS
+    lazy : bool, optional
+        If True, the inputs are recorded and the state is only flashed when the
+        first property is requested (errors in the inputs are also raised at
+        that point). Lazy states are pickled with their inputs, without
+        flashing. CoolProp methods (e.g. state.Q()) are only valid after a
+        property has been requested. Default is False.
 
     Returns
     -------
@@ -60,21 +266,28 @@ class State(CP.AbstractState):
     <Quantity(273291.7, 'joule / kilogram')>
     """
 
+    # plot methods for the states of a ccp.Point, created when accessed
+    p_plot = BindOnAccess(_point_plot_func, "p")
+    T_plot = BindOnAccess(_point_plot_func, "T")
+    h_plot = BindOnAccess(_point_plot_func, "h")
+    s_plot = BindOnAccess(_point_plot_func, "s")
+    rho_plot = BindOnAccess(_point_plot_func, "rho")
+
     def __new__(cls, *args, **kwargs):
         fluid = kwargs.get("fluid")
         if fluid is None:
             raise TypeError("A fluid is required. Provide as fluid=dict(...)")
-        EOS = kwargs.get("EOS")
-        if EOS is None:
-            EOS = ccp.config.EOS
-
-        _fluid = "&".join([get_name(name) for name in fluid.keys()])
+        EOS = _source_eos(kwargs.get("EOS"))
+        mixture = Mixture(fluid)
 
+        # CoolProp cannot clone or reset a backend, so a backend is created for
+        # each state; only the fluid names resolved by the Mixture are reused.
+        # Temporary states in iterative methods reuse backends with scratch().
         try:
-            state = super().__new__(cls, EOS, _fluid)
+            state = super().__new__(cls, EOS, mixture.backend_string)
         except ValueError:
             error_msg = ""
-            constituents = list(fluid.keys())
+            constituents = mixture.constituents
             for fluid1, fluid2 in combinations(constituents, 2):
                 try:
                     fluid_pair = f"{fluid1}&{fluid2}"
@@ -94,37 +307,38 @@ class State(CP.AbstractState):
         rho=None,
         fluid=None,
         EOS=None,
+        lazy=False,
     ):
         # no call to super(). see :
         # http://stackoverflow.com/questions/18260095/
-        self.EOS = EOS
-
-        constituents = []
-        molar_fractions = []
+        self._setup(fluid, EOS)
 
-        for k, v in fluid.items():
-            k = get_name(k)
-            constituents.append(k)
-            molar_fractions.append(v)
-            # create an adequate fluid string to cp.AbstractState
-        _fluid = "&".join(constituents)
-        self._fluid = _fluid
-
-        normalize_mix(molar_fractions)
-        self.set_mole_fractions(molar_fractions)
-        self.fluid = dict(zip(constituents, molar_fractions))
         self.init_args = dict(p=p, T=T, h=h, s=s, rho=rho)
         self.setup_args = copy(self.init_args)
-        if isinstance(fluid, str) and len(self.fluid) == 1:
-            self.fluid[get_name(fluid)] = 1.0
 
-        if isinstance(fluid, dict):
-            if len(self.fluid) < len(fluid):
-                raise ValueError(
-                    "You might have repeated components in the fluid dictionary."
-                )
+        if lazy:
+            # flash when the first property is requested
+            self._pending = self.setup_args
+        else:
+            self.update(**self.setup_args)
+
+    def _setup(self, fluid, EOS):
+        """Set the fluid composition and the attributes used by the state."""
+        self.EOS = EOS
 
-        self.update(**self.setup_args)
+        self.mixture = Mixture(fluid)
+        self._fluid = self.mixture.backend_string
+        self.set_mole_fractions(self.mixture.fractions)
+        self.fluid = dict(self.mixture)
+
+        self._cache = {}
+        self._guess = None
+        self._seed = None
+        self._pending = None
+        self._table = None
+        self._table_values = None
+        if _is_table_eos(EOS):
+            self._table = get_table(self.mixture, _source_eos(EOS))
 
     def __repr__(self):
         args = {k: v for k, v in self.init_args.items() if v is not None}
@@ -158,6 +372,7 @@ class State(CP.AbstractState):
             self.fluid = fluid_dict
         return fluid_dict
 
+    @_cached
     def gas_constant(self, units=None):
         """Gas constant in joule / (mol kelvin).
 
@@ -171,6 +386,7 @@ class State(CP.AbstractState):
             gas_constant = gas_constant.to(units)
         return gas_constant
 
+    @_cached
     def molar_mass(self, units=None):
         """Molar mass in kg/mol.
 
@@ -184,6 +400,7 @@ class State(CP.AbstractState):
             molar_mass = molar_mass.to(units)
         return molar_mass
 
+    @_cached
     def T(self, units=None):
         """Temperature in Kelvin.
 
@@ -192,11 +409,15 @@ class State(CP.AbstractState):
         T : pint.Quantity
             Temperature (Kelvin).
         """
-        T = Q_(super().T(), "kelvin")
+        if self._table_values is not None:
+            T = Q_(self._table_values["T"], "kelvin")
+        else:
+            T = Q_(super().T(), "kelvin")
         if units:
             T = T.to(units)
         return T
 
+    @_cached
     def p(self, units=None):
         """Pressure in Pascal.
 
@@ -205,11 +426,15 @@ class State(CP.AbstractState):
         p : pint.Quantity
             Pressure (pascal).
         """
-        p = Q_(super().p(), "pascal")
+        if self._table_values is not None:
+            p = Q_(self._table_values["p"], "pascal")
+        else:
+            p = Q_(super().p(), "pascal")
         if units:
             p = p.to(units)
         return p
 
+    @_cached
     def cp(self, units=None):
         """Specific heat at constant pressure joule/(kilogram kelvin).
 
@@ -218,27 +443,20 @@ class State(CP.AbstractState):
         cp : pint.Quantity
             Specific heat at constant pressure joule/(kilogram kelvin).
         """
-        cp = Q_(super().cpmass(), "joule/(kilogram kelvin)")
+        if self._table_values is not None:
+            cp = Q_(self._table_values["cp"], "joule/(kilogram kelvin)")
+        else:
+            cp = Q_(super().cpmass(), "joule/(kilogram kelvin)")
         # use REFPROP directly with forced gas condition if cp value does not converge
         if cp < 0:
-            fluids = self._fluid.replace("&", "*")
-            r = _RP.REFPROPdll(
-                fluids,
-                "PTV",
-                "Cp",
-                _RP.MASS_BASE_SI,
-                0,
-                0,
-                self.p("kPa").m,
-                self.T().m,
-                self.get_mole_fractions(),
-            )
-            cp = Q_(r.Output[0], "joule/(kilogram kelvin)")
+            (cp,) = refprop_flash(self.mixture, "PTV", "Cp", self.p().m, self.T().m)
+            cp = Q_(float(cp), "joule/(kilogram kelvin)")
 
         if units:
             cp = cp.to(units)
         return cp
 
+    @_cached
     def cv(self, units=None):
         """Specific heat at constant volume joule/(kilogram kelvin).
 
@@ -247,11 +465,13 @@ class State(CP.AbstractState):
         cv : pint.Quantity
             Specific heat at constant volume joule/(kilogram kelvin).
         """
+        self._flash_table_values()
         cv = Q_(super().cvmass(), "joule/(kilogram kelvin)")
         if units:
             cv = cv.to(units)
         return cv
 
+    @_cached
     def h(self, units=None):
         """Specific Enthalpy (joule/kilogram).
 
@@ -260,11 +480,15 @@ class State(CP.AbstractState):
         h : pint.Quantity
             Enthalpy (joule/kilogram).
         """
-        h = Q_(super().hmass(), "joule/kilogram")
+        if self._table_values is not None:
+            h = Q_(self._table_values["h"], "joule/kilogram")
+        else:
+            h = Q_(super().hmass(), "joule/kilogram")
         if units:
             h = h.to(units)
         return h
 
+    @_cached
     def s(self, units=None):
         """Specific entropy (per unit of mass).
 
@@ -273,7 +497,10 @@ class State(CP.AbstractState):
         s : pint.Quantity
             Entropy (joule/(kelvin kilogram)).
         """
-        s = Q_(super().smass(), "joule/(kelvin kilogram)")
+        if self._table_values is not None:
+            s = Q_(self._table_values["s"], "joule/(kelvin kilogram)")
+        else:
+            s = Q_(super().smass(), "joule/(kelvin kilogram)")
         if units:
             s = s.to(units)
         return s
@@ -304,6 +531,7 @@ class State(CP.AbstractState):
             T_critical.to(units)
         return T_critical
 
+    @_cached
     def rho(self, units=None):
         """Specific mass (kilogram/m**3).
 
@@ -312,11 +540,15 @@ class State(CP.AbstractState):
         rho : pint.Quantity
             Specific mass (kilogram/m**3).
         """
-        rho = Q_(super().rhomass(), "kilogram/m**3")
+        if self._table_values is not None:
+            rho = Q_(self._table_values["rho"], "kilogram/m**3")
+        else:
+            rho = Q_(super().rhomass(), "kilogram/m**3")
         if units:
             rho = rho.to(units)
         return rho
 
+    @_cached
     def v(self, units=None):
         """Specific volume (m**3/kilogram).
 
@@ -330,6 +562,7 @@ class State(CP.AbstractState):
             v = (1 / self.rho()).to(units)
         return v
 
+    @_cached
     def z(self, units=None):
         """Compressibility (dimensionless).
 
@@ -338,9 +571,12 @@ class State(CP.AbstractState):
         z : pint.Quantity
             Compressibility (dimensionless).
         """
+        if self._table_values is not None:
+            return Q_(self._table_values["z"], "dimensionless")
         z = self.p() * self.molar_mass() / (self.rho() * self.gas_constant() * self.T())
         return z.to("dimensionless")
 
+    @_cached
     def speed_sound(self, units=None):
         """Speed of sound - Eq. 8.1 from P. Nederstigt - Real Gas Thermodynamics.
 
@@ -349,19 +585,25 @@ class State(CP.AbstractState):
         speed_sound : pint.Quantity
             Speed of sound (m/s).
         """
+        if self._table_values is not None:
+            speed_sound = Q_(self._table_values["speed_sound"], "m/s")
+            if units:
+                speed_sound = speed_sound.to(units)
+            return speed_sound
+
         try:
             speed_sound = Q_(
                 np.sqrt(self.first_partial_deriv(CP.iP, CP.iDmass, CP.iSmass)), "m/s"
             )
         except ValueError:
             # manually calculate the derivative for REFPROP 9.1
-            dummy_state = copy(self)
             p0 = self.p()
             p1 = p0 + Q_(1e-6, "Pa")
 
-            dummy_state.update(p=p1, s=self.s())
+            with self.scratch() as dummy_state:
+                dummy_state.update(p=p1, s=self.s())
+                rho1 = dummy_state.rho()
             rho0 = self.rho()
-            rho1 = dummy_state.rho()
             delta_p = p1 - p0
             delta_rho = rho1 - rho0
             speed_sound = Q_(np.sqrt(delta_p / delta_rho), "m/s")
@@ -370,6 +612,7 @@ class State(CP.AbstractState):
             speed_sound = speed_sound.to(units)
         return speed_sound
 
+    @_cached
     def viscosity(self, units=None):
         """Viscosity in pascal second.
 
@@ -378,18 +621,18 @@ class State(CP.AbstractState):
         viscosity : pint.Quantity
             Viscosity (pascal second)
         """
+        self._flash_table_values()
         try:
             viscosity = Q_(super().viscosity(), "pascal second")
         except ValueError:
             # handle error for cubic eos such as PR, SRK etc.
-            dummy_state = self.__class__(
-                p=self.p(), T=self.T(), fluid=self.fluid, EOS="REFPROP"
-            )
-            viscosity = Q_(super(State, dummy_state).viscosity(), "pascal second")
+            transport_state = self._transport_state()
+            viscosity = Q_(CP.AbstractState.viscosity(transport_state), "pascal second")
         if units:
             viscosity = viscosity.to(units)
         return viscosity
 
+    @_cached
     def kinematic_viscosity(self, units=None):
         """Kinematic viscosity in m²/s.
 
@@ -403,10 +646,12 @@ class State(CP.AbstractState):
             kinematic_viscosity = kinematic_viscosity.to(units)
         return kinematic_viscosity
 
+    @_cached
     def dpdv_s(self, units=None):
         """
         Partial derivative of pressure to spec. volume with const. entropy.
         """
+        self._flash_table_values()
         try:
             # dp/dv calculated from dp/drho needs to be multiplied by -rho**2
             dpdv_s = Q_(
@@ -416,13 +661,13 @@ class State(CP.AbstractState):
             )
         except ValueError:
             # manually calculate the derivative for REFPROP 9.1
-            dummy_state = copy(self)
             p0 = self.p()
             p1 = p0 + Q_(1e-1, "Pa")
 
-            dummy_state.update(p=p1, s=self.s())
+            with self.scratch() as dummy_state:
+                dummy_state.update(p=p1, s=self.s())
+                v1 = dummy_state.v()
             v0 = self.v()
-            v1 = dummy_state.v()
             dp = p1 - p0
             dv = v1 - v0
             dpdv_s = dp / dv
@@ -430,8 +675,10 @@ class State(CP.AbstractState):
             dpdv_s = dpdv_s.to(units)
         return dpdv_s
 
+    @_cached
     def _X(self):
         """Coeficiente de compressibilidade X de Schultz"""
+        self._flash_table_values()
         T = self.T().to("K").magnitude
         V = self.v().to("m³/kg").magnitude
 
@@ -440,8 +687,10 @@ class State(CP.AbstractState):
             "dimensionless",
         )
 
+    @_cached
     def _Y(self):
         """Coeficiente de compressibilidade X de Schultz"""
+        self._flash_table_values()
         P = self.p().to("Pa").magnitude
         V = self.v().to("m³/kg").magnitude
 
@@ -450,6 +699,7 @@ class State(CP.AbstractState):
             "dimensionless",
         )
 
+    @_cached
     def kv(self):
         """Isentropic volume exponent (dimensionless).
 
@@ -460,24 +710,26 @@ class State(CP.AbstractState):
         """
         return -(self.v() / self.p()) * self.dpdv_s()
 
+    @_cached
     def dTdp_s(self, units=None):
         """(dT / dp)s
 
         First partial derivative of temperature related to pressure with
         constant entropy."""
+        self._flash_table_values()
         try:
             dTdp_s = Q_(
                 super().first_partial_deriv(CP.iT, CP.iP, CP.iSmass), "kelvin / pascal"
             )
         except ValueError:
             # manually calculate the derivative for REFPROP 9.1
-            dummy_state = copy(self)
             p0 = self.p()
             p1 = p0 + Q_(1e-1, "Pa")
 
-            dummy_state.update(p=p1, s=self.s())
+            with self.scratch() as dummy_state:
+                dummy_state.update(p=p1, s=self.s())
+                T1 = dummy_state.T()
             T0 = self.T()
-            T1 = dummy_state.T()
             dp = p1 - p0
             dT = T1 - T0
             dTdp_s = dT / dp
@@ -487,6 +739,7 @@ class State(CP.AbstractState):
 
         return dTdp_s
 
+    @_cached
     def kT(self):
         """Isentropic temperature exponent (dimensionless).
 
@@ -497,6 +750,7 @@ class State(CP.AbstractState):
         """
         return 1 / (1 - (self.p() / self.T()) * self.dTdp_s())
 
+    @_cached
     def conductivity(self, units=None):
         """Thermal conductivity (W/m/K).
 
@@ -505,19 +759,66 @@ class State(CP.AbstractState):
         conductivity : pint.Quantity
             Thermal conductivity (W/m/K).
         """
-        conductivity = Q_(super().conductivity(), "W/m/degK")
+        self._flash_table_values()
+        try:
+            conductivity = Q_(super().conductivity(), "W/m/degK")
+        except ValueError:
+            # handle error for cubic eos such as PR, SRK etc.
+            transport_state = self._transport_state()
+            conductivity = Q_(
+                CP.AbstractState.conductivity(transport_state), "W/m/degK"
+            )
         if units:
             conductivity = conductivity.to(units)
         return conductivity
 
     def __reduce__(self):
-        kwargs = dict(p=self.p(), T=self.T(), fluid=self.fluid)
-        return self._rebuild, (self.__class__, kwargs)
+        if self._pending is not None:
+            # keep the state lazy, without flashing to get p and T
+            kwargs = {k: v for k, v in self._pending.items() if v is not None}
+            kwargs.update(fluid=self.mixture, EOS=self.EOS, lazy=True)
+            return self._rebuild, (self.__class__, kwargs)
+        if self._table is not None:
+            p, T = self.props_si("p", "T")
+            kwargs = dict(p=p, T=T, fluid=self.mixture, EOS=self.EOS)
+            return self._rebuild, (self.__class__, kwargs)
+
+        # compact representation with SI floats, loaded with a density and
+        # temperature flash (faster than p-T, and defined in the two phase region)
+        init_names = tuple(k for k, v in self.init_args.items() if v is not None)
+        args = (
+            self.__class__,
+            self.mixture,
+            self.EOS,
+            super().p(),
+            super().T(),
+            super().rhomolar(),
+            init_names,
+        )
+        return self._rebuild_si, args
 
     @staticmethod
     def _rebuild(cls, kwargs):
         return cls(**kwargs)
 
+    @staticmethod
+    def _rebuild_si(cls, mixture, EOS, p, T, rhomolar, init_names):
+        state = cls.__new__(cls, fluid=mixture, EOS=EOS)
+        state._setup(mixture, EOS)
+        try:
+            CP.AbstractState.update(state, CP.DmolarT_INPUTS, rhomolar, T)
+        except ValueError:
+            state._update_pt(p, T)
+        state._set_guess()
+
+        state.init_args = {
+            k: getattr(state, k)() if k in init_names else None
+            for k in ["p", "T", "h", "s", "rho"]
+        }
+        state.setup_args = copy(state.init_args)
+
+        return state
+
     @classmethod
     @check_units
     def define(
@@ -549,7 +850,7 @@ class State(CP.AbstractState):
         rho : float, pint.Quantity
             Specific mass
 
-        fluid : dict
+        fluid : dict, ccp.Mixture
             Dictionary with constituent and composition.
             (e.g.: fluid={'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092})
             String with REFPROP, HEOS, PR or SRK.
@@ -610,50 +911,60 @@ class State(CP.AbstractState):
         for item in ["kwargs", "self", "__class__"]:
             args.pop(item)
         args = [k for k, v in args.items() if v is not None]
+
+        self._cache.clear()
+        self._pending = None
+
+        if self._table is not None:
+            if rho is None:
+                self._table_values = self._table.state_values(
+                    *[None if x is None else x.magnitude for x in (p, T, h, s)]
+                )
+                if self._table_values is not None:
+                    return
+            # fallback to the source EOS
+            self._table_values = None
+
         try:
             if p is not None and T is not None:
-                super().update(CP.PT_INPUTS, p.magnitude, T.magnitude)
+                self._update_pt(p.magnitude, T.magnitude)
             elif p is not None and rho is not None:
                 super().update(CP.DmassP_INPUTS, rho.magnitude, p.magnitude)
             elif p is not None and h is not None:
-                super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
+                if ccp.config.WARM_START and _source_eos(self.EOS) == "HEOS":
+                    # solve T with p-T flashes (warm started in the gas region),
+                    # which are faster than the p-h flash for mixtures
+                    try:
+                        self._update_p_solve_T(p.magnitude, h.magnitude, "h")
+                    except ValueError:
+                        super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
+                else:
+                    super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
             elif p is not None and s is not None:
-                if ccp.config.EOS == "REFPROP":
+                if _source_eos(self.EOS) == "REFPROP":
                     super().update(CP.PSmass_INPUTS, p.magnitude, s.magnitude)
                 else:
                     # ps update not available for some EOS, this is a workaround based on:
                     # https://github.com/CoolProp/CoolProp/issues/2000
-                    def objective(T):
-                        super(State, self).update(CP.PT_INPUTS, p.magnitude, T)
-                        return self.smass() - s.magnitude
-
-                    T0 = self.T().m
-                    if T0 == float("-inf"):
-                        T0 = 300
-                    newton(objective, x0=T0)
+                    self._update_p_solve_T(p.magnitude, s.magnitude, "s")
             elif rho is not None and s is not None:
                 try:
                     super().update(CP.DmassSmass_INPUTS, rho.magnitude, s.magnitude)
                 except ValueError:
                     # handle convergence error by forcing gas state directly with REFPROP
                     # calculate with p and T and update with their values
-                    fluids = self._fluid.replace("&", "*")
-                    r = _RP.REFPROPdll(
-                        fluids,
-                        "DSV",
-                        "P,T",
-                        _RP.MASS_BASE_SI,
-                        0,
-                        0,
-                        rho.magnitude,
-                        s.magnitude,
-                        self.get_mole_fractions(),
+                    p_rp, T_rp = refprop_flash(
+                        self.mixture, "DSV", "P,T", rho.magnitude, s.magnitude
                     )
-                    super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
+                    super().update(CP.PT_INPUTS, float(p_rp), float(T_rp))
             elif rho is not None and T is not None:
                 super().update(CP.DmassT_INPUTS, rho.magnitude, T.magnitude)
             elif h is not None and s is not None:
-                super().update(CP.HmassSmass_INPUTS, h.magnitude, s.magnitude)
+                if _source_eos(self.EOS) in ("PR", "SRK"):
+                    # hs flash does not converge for cubic EOS
+                    self._update_s_solve_p(h.magnitude, s.magnitude)
+                else:
+                    super().update(CP.HmassSmass_INPUTS, h.magnitude, s.magnitude)
             elif T is not None and s is not None:
                 super().update(CP.SmassT_INPUTS, s.magnitude, T.magnitude)
             else:
@@ -666,12 +977,525 @@ class State(CP.AbstractState):
                 f"Could not define state with {args_dict} and {self.fluid}"
             ) from e
 
+        self._set_guess()
+
+    def _transport_state(self):
+        """Companion state at the same p and T used for transport properties.
+
+        Cubic EOS (e.g. PR, SRK) do not provide viscosity and conductivity, which
+        are calculated with ccp.config.TRANSPORT_EOS. One companion state is kept
+        for each thread and fluid composition and is flashed in place. Only the
+        CoolProp methods of the companion should be used, since its property
+        cache is not cleared.
+        """
+        states = getattr(_transport_states, "states", None)
+        if states is None:
+            states = _transport_states.states = _MixtureCache()
+        EOS = ccp.config.TRANSPORT_EOS
+        key = (EOS, self.mixture)
+        p, T = self.props_si("p", "T")
+
+        state = states.get(key)
+        if state is None:
+            state = states[key] = self.__class__(p=p, T=T, fluid=self.mixture, EOS=EOS)
+        else:
+            state._update_pt(p, T)
+            state._set_guess()
+
+        return state
+
+    def _update_pt(self, p, T):
+        """Flash with p and T (SI units).
+
+        The previous state is used as initial guess if it is close to the new
+        state, skipping the phase stability analysis and density search. This
+        is only done if both states are in the gas region (see _gas_side).
+        """
+        guess = self._guess
+        if (
+            guess is not None
+            and ccp.config.WARM_START
+            and abs(p - guess.p) < _WARM_START_MAX_STEP * guess.p
+            and abs(T - guess.T) < _WARM_START_MAX_STEP * guess.T
+            and _gas_side(self.mixture, guess.p, guess.T)
+            and _gas_side(self.mixture, p, T)
+        ):
+            try:
+                super().update_with_guesses(CP.PT_INPUTS, p, T, guess)
+                _state_counts("flash")["warm"] += 1
+                return
+            except ValueError:
+                pass
+
+        super().update(CP.PT_INPUTS, p, T)
+        _state_counts("flash")["cold"] += 1
+
+    def _update_p_solve_T(self, p, value, prop, tol=1e-8, maxiter=50):
+        """Update with p and h or s, solving T with p-T flashes (SI units).
+
+        Newton iterations use the derivatives at constant pressure
+        dh/dT = cp and ds/dT = cp / T. The root is bracketed by the evaluated
+        temperatures and the iteration falls back to bisection if a step leaves
+        the bracket. The iterations start from the temperature and density
+        estimated with :meth:`_solver_start`, so the result depends only on the
+        inputs and not on the previous state.
+
+        Parameters
+        ----------
+        p : float
+            Pressure (Pa).
+        value : float
+            Enthalpy (J/kg) or entropy (J/(kg*degK)).
+        prop : str
+            "h" or "s".
+        tol : float, optional
+            Absolute tolerance for the temperature (degK). Default is 1e-8.
+        maxiter : int, optional
+            Maximum number of iterations. Default is 50.
+        """
+        calc_value = super().hmass if prop == "h" else super().smass
+
+        T, self._guess = self._solver_start(p, value, prop)
+
+        T_low = 0.0
+        T_high = np.inf
+        for _ in range(maxiter):
+            try:
+                self._update_pt(p, T)
+            except ValueError:
+                # move towards the bracket
+                if T_low > 0 and np.isfinite(T_high):
+                    T = (T_low + T_high) / 2
+                elif T_low > 0:
+                    T = (T + T_low) / 2
+                elif np.isfinite(T_high):
+                    T = (T + T_high) / 2
+                else:
+                    raise
+                continue
+            self._set_guess()
+
+            error = calc_value() - value
+            if error < 0:
+                T_low = T
+            else:
+                T_high = T
+
+            cp = super().cpmass()
+            derivative = cp if prop == "h" else cp / T
+            T_new = T - error / derivative
+            if not T_low < T_new < T_high:
+                T_new = (T_low + T_high) / 2 if np.isfinite(T_high) else 2 * T
+
+            if abs(T_new - T) < tol:
+                return
+            T = T_new
+
+        raise ValueError(f"Update with p and {prop} did not converge.")
+
+    def _update_s_solve_p(self, h, s, tol=1e-6, maxiter=50):
+        """Update with h and s, solving p with p-s updates (SI units).
+
+        Newton iterations along the isentrope use the derivative
+        dh/dp = v at constant entropy. Each iteration is a p-s update, which is
+        solved with p-T flashes. The initial pressure is estimated with the ideal
+        gas relations for h and s from the seed of :meth:`_solver_start`.
+
+        Parameters
+        ----------
+        h : float
+            Enthalpy (J/kg).
+        s : float
+            Entropy (J/(kg*degK)).
+        tol : float, optional
+            Relative tolerance for the pressure. Default is 1e-6.
+        maxiter : int, optional
+            Maximum number of iterations. Default is 50.
+        """
+        p, T, h_seed, s_seed, cp, _ = self._solver_seed()
+        R = super().gas_constant() / super().molar_mass()
+        T_new = max(T + (h - h_seed) / cp, T / 2)
+        p = p * np.exp((cp * np.log(T_new / T) - (s - s_seed)) / R)
+
+        for _ in range(maxiter):
+            self._update_p_solve_T(p, s, "s")
+            error = super().hmass() - h
+            # limit the step to keep the pressure positive
+            p_new = max(p - error * super().rhomass(), p / 10)
+            if abs(p_new - p) < tol * p:
+                return
+            p = p_new
+
+        raise ValueError("Update with h and s did not converge.")
+
+    def _solver_seed(self):
+        """State (p, T, h, s, cp, rho) in SI units used to start the p-h, p-s and
+        h-s solvers.
+
+        This is the state given to :meth:`_set_guess_from` or, if there is none,
+        a reference state at 1 bar and 300 degK, calculated once for each
+        backend and fluid composition.
+        """
+        if self._seed is not None:
+            return self._seed
+
+        key = (self.backend_name(), self.mixture)
+        try:
+            return _solver_references[key]
+        except KeyError:
+            pass
+
+        p, T = _SOLVER_REFERENCE_PT
+        super().update(CP.PT_INPUTS, p, T)
+        _state_counts("flash")["cold"] += 1
+        seed = (p, T, super().hmass(), super().smass(), super().cpmass())
+        seed = _solver_references[key] = seed + (super().rhomass(),)
+        return seed
+
+    def _solver_start(self, p, value, prop):
+        """Initial temperature and guess to solve T with p and h or s (SI units).
+
+        The temperature is estimated from the seed state (see :meth:`_solver_seed`)
+        with the ideal gas relations for h or s, and the density of the guess is
+        the seed density corrected with the ideal gas relation.
+
+        Returns
+        -------
+        T : float
+            Initial temperature (degK).
+        guess : CoolProp.PyGuessesStructure
+            Initial guess for the first p-T flash.
+        """
+        p_seed, T_seed, h_seed, s_seed, cp, rho = self._solver_seed()
+        if prop == "h":
+            T = T_seed + (value - h_seed) / cp
+        else:
+            R = super().gas_constant() / super().molar_mass()
+            T = T_seed * np.exp((value - s_seed + R * np.log(p / p_seed)) / cp)
+        if not (np.isfinite(T) and T > 0):
+            T = T_seed
+
+        guess = CP.PyGuessesStructure()
+        guess.p = p
+        guess.T = T
+        guess.rhomolar = rho * (p / p_seed) * (T_seed / T) / super().molar_mass()
+        return T, guess
+
+    def _set_guess(self):
+        """Keep the current state as initial guess for the next flash.
+
+        Initial guesses are only supported by HEOS. The gas region check (see
+        _gas_side) is done when the guess is used, so that the phase envelope is
+        only built for states that are flashed with a guess.
+        """
+        if (
+            not ccp.config.WARM_START
+            or _source_eos(self.EOS) != "HEOS"
+            or super().phase() == CP.iphase_twophase
+        ):
+            self._guess = None
+            return
+
+        guess = CP.PyGuessesStructure()
+        guess.p = super().p()
+        guess.T = super().T()
+        guess.rhomolar = super().rhomolar()
+        self._guess = guess
+
+    def _set_guess_from(self, state):
+        """Use another state with the same fluid as initial guess for the next
+        flash, e.g. a state close to the new conditions after a large change.
+
+        The state is also kept as seed for the p-h, p-s and h-s solvers (see
+        :meth:`_solver_seed`).
+        """
+        if state._pending is not None:
+            state._flash_pending()
+        self._guess = state._guess
+        self._seed = state.props_si("p", "T", "h", "s", "cp", "rho")
+
+    def props_si(self, *names):
+        """Properties as floats in SI units.
+
+        This avoids the pint arithmetic in internal calculations.
+
+        Parameters
+        ----------
+        names : str
+            Names of the properties (e.g. "p", "h", "rho").
+
+        Returns
+        -------
+        props : tuple
+            Properties in SI units.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> fluid = {'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092}
+        >>> s = ccp.State(p=101008, T=273, fluid=fluid)
+        >>> p, rho = s.props_si("p", "rho")
+        """
+        return tuple(getattr(self, name)().magnitude for name in names)
+
+    def properties(
+        self,
+        names=(
+            "p",
+            "T",
+            "h",
+            "s",
+            "rho",
+            "z",
+            "cp",
+            "speed_sound",
+            "viscosity",
+        ),
+        units=None,
+    ):
+        """Calculate several properties in one call.
+
+        Properties available directly from the backend are read with
+        keyed_output, the others (e.g. z, speed_sound) are calculated with the
+        respective method. Values are stored in the property cache.
+
+        Parameters
+        ----------
+        names : list, optional
+            Names of the properties.
+            Default is ["p", "T", "h", "s", "rho", "z", "cp", "speed_sound",
+            "viscosity"].
+        units : dict, optional
+            Dictionary with the units for each property (e.g. {"p": "bar"}).
+            Properties not in the dictionary are returned in SI units.
+
+        Returns
+        -------
+        properties : dict
+            Dictionary with the properties as pint.Quantity.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> fluid = {'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092}
+        >>> s = ccp.State(p=101008, T=273, fluid=fluid)
+        >>> props = s.properties(["p", "T", "rho"], units={"p": "bar"})
+        """
+        if units is None:
+            units = {}
+        if self._pending is not None:
+            self._flash_pending()
+
+        cache = self._cache
+        properties = {}
+        for name in names:
+            value = cache.get(name)
+            if value is None and self._table_values is None and name in _keyed_outputs:
+                key, base_units = _keyed_outputs[name]
+                try:
+                    magnitude = self.keyed_output(key)
+                except ValueError:
+                    # use the method with its fallback (e.g. viscosity for cubic EOS)
+                    magnitude = None
+                # negative cp is handled by the method
+                if magnitude is not None and not (name == "cp" and magnitude < 0):
+                    value = Q_(magnitude, base_units)
+                    cache[name] = value
+                    _state_counts("cache")["misses"] += 1
+            elif value is not None:
+                _state_counts("cache")["hits"] += 1
+
+            if value is None:
+                value = getattr(self, name)()
+
+            if name in units:
+                value = value.to(units[name])
+            properties[name] = value
+
+        return properties
+
+    @contextmanager
+    def scratch(self):
+        """Temporary state with the same fluid and EOS for intermediate calculations.
+
+        Scratch states are kept in a pool for each thread and fluid composition
+        and are reused, avoiding the creation of a new state (e.g. with
+        copy(state)) for each temporary calculation. A scratch state is at an
+        arbitrary condition (e.g. from its previous use) and should be updated
+        before use. Its initial guess is cleared, so the updates do not depend on
+        its previous use. It is returned to the pool at the end of the with block and
+        should not be kept after that.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> fluid = {'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092}
+        >>> suc = ccp.State(p=101008, T=273, fluid=fluid)
+        >>> with suc.scratch() as disch_s:
+        ...     disch_s.update(p=202016, s=suc.s())
+        ...     h_isentropic = disch_s.h() - suc.h()
+        """
+        pool = getattr(_scratch_states, "pool", None)
+        if pool is None:
+            pool = _scratch_states.pool = _MixtureCache()
+        key = (self.EOS or ccp.config.EOS, self.mixture)
+        states = pool.get(key)
+        if states is None:
+            states = pool[key] = []
+
+        if states:
+            state = states.pop()
+            state._guess = None
+            state._seed = None
+            _state_counts("scratch")["reused"] += 1
+        else:
+            state = self.__class__(
+                p=self.p(), T=self.T(), fluid=self.mixture, EOS=self.EOS
+            )
+            _state_counts("scratch")["created"] += 1
+
+        try:
+            yield state
+        finally:
+            states.append(state)
+
+    @staticmethod
+    def scratch_info():
+        """Number of scratch states created and reused.
+
+        See :py:meth:`scratch`. The states are counted for the current thread.
+
+        Returns
+        -------
+        scratch_info : dict
+            Dictionary with the number of created and reused scratch states.
+        """
+        return dict(_state_counts("scratch"))
+
+    @staticmethod
+    def scratch_info_clear():
+        """Reset the counters of scratch states for the current thread."""
+        _state_counts("scratch").update(created=0, reused=0)
+
+    @staticmethod
+    def cache_info():
+        """Hits and misses of the property cache.
+
+        Properties (e.g. h(), z()) are cached for each state and the cache is
+        cleared when the state is updated. The counters include all states of
+        the current thread.
+
+        Returns
+        -------
+        cache_info : dict
+            Dictionary with the number of hits and misses.
+        """
+        return dict(_state_counts("cache"))
+
+    @staticmethod
+    def cache_info_clear():
+        """Reset the hits and misses counters of the property cache for the
+        current thread."""
+        _state_counts("cache").update(hits=0, misses=0)
+
+    @staticmethod
+    def flash_info():
+        """Number of p-T flashes with and without an initial guess.
+
+        Warm flashes use the previous state as initial guess (see
+        ccp.config.WARM_START), skipping the phase stability analysis and
+        the density search done by cold flashes. The counters include all
+        states of the current thread.
+
+        Returns
+        -------
+        flash_info : dict
+            Dictionary with the number of warm and cold flashes.
+        """
+        return dict(_state_counts("flash"))
+
+    @staticmethod
+    def flash_info_clear():
+        """Reset the counters of p-T flashes for the current thread."""
+        _state_counts("flash").update(warm=0, cold=0)
+
+    def _flash_pending(self):
+        """Flash a lazy state with the inputs given at construction."""
+        pending, self._pending = self._pending, None
+        self.update(**pending)
+
+    def _flash_table_values(self):
+        """Update the backend with the state answered by the property table.
+
+        Needed before calculating properties that are not tabulated.
+        """
+        if self._table_values is not None:
+            super().update(
+                CP.PT_INPUTS, self._table_values["p"], self._table_values["T"]
+            )
+            self._table_values = None
+
     def get_coolprop_state(self):
         """Return a CoolProp state object."""
-        EOS = self.EOS
-        if EOS is None:
-            EOS = ccp.config.EOS
-        return CP.AbstractState(EOS, self._fluid)
+        return CP.AbstractState(_source_eos(self.EOS), self._fluid)
+
+    def phase_envelope(self):
+        """Phase envelope for the fluid composition.
+
+        The envelope is built once for each composition and EOS and then reused.
+        See :py:mod:`ccp.phase_envelope`.
+
+        Returns
+        -------
+        phase_envelope : ccp.phase_envelope.PhaseEnvelope
+        """
+        return get_phase_envelope(self.mixture, _source_eos(self.EOS))
+
+    @check_units
+    def dew_point_margin(self, p=None, T=None, units=None):
+        """Margin between the temperature and the dew temperature.
+
+        Pressures and temperatures can be given to calculate the margin for a
+        series of conditions with the same fluid (e.g. historical data), using
+        the phase envelope calculated once for the composition.
+
+        Parameters
+        ----------
+        p : float, array_like, pint.Quantity, optional
+            Pressure. Default is the state pressure.
+        T : float, array_like, pint.Quantity, optional
+            Temperature. Default is the state temperature.
+        units : str, optional
+            Units for the margin. Default is 'kelvin'.
+
+        Returns
+        -------
+        dew_point_margin : pint.Quantity
+            Temperature minus the dew temperature at the same pressure.
+            Negative values are below the dew line and pressures outside the dew
+            line return nan.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> Q_ = ccp.Q_
+        >>> fluid = {'methane': 0.8, 'ethane': 0.15, 'propane': 0.05}
+        >>> s = ccp.State(p=Q_(30, 'bar'), T=Q_(30, 'degC'), fluid=fluid)
+        >>> margin = s.dew_point_margin(
+        ...     p=Q_([30, 40, 50], 'bar'), T=Q_([10, 20, 30], 'degC')
+        ... )
+        """
+        if p is None:
+            p = self.p()
+        if T is None:
+            T = self.T()
+
+        dew_point_margin = Q_(
+            self.phase_envelope().dew_point_margin(p.m, T.m), "kelvin"
+        )
+        if units:
+            dew_point_margin = dew_point_margin.to(units)
+        return dew_point_margin
 
     def plot_envelope(
         self, T_units="degK", p_units="Pa", dew_point_margin=20, fig=None, **kwargs
@@ -708,10 +1532,9 @@ class State(CP.AbstractState):
                 "See https://github.com/CoolProp/CoolProp/issues/1544"
             )
 
-        self.build_phase_envelope("dummy")
-        phase_envelope = self.get_phase_envelope_data()
-        T = Q_(np.array(phase_envelope.T), "degK").to(T_units).m
-        p = Q_(np.array(phase_envelope.p), "Pa").to(p_units).m
+        phase_envelope = self.phase_envelope()
+        T = Q_(phase_envelope.T, "degK").to(T_units).m
+        p = Q_(phase_envelope.p, "Pa").to(p_units).m
 
         p_lower_bound = Q_(0.1, "atm").to(p_units).m
         T = T[p > p_lower_bound]
@@ -813,3 +1636,231 @@ class State(CP.AbstractState):
         )
 
         return fig
+
+
+class StateArray:
+    """Thermodynamic states evaluated over arrays.
+
+    Creates the states for a fluid composition and two arrays of properties.
+    A single backend is created for the composition and flashed for each
+    element, avoiding the construction of one ccp.State per element.
+    Properties can be floats/arrays (SI units are considered) or pint quantities.
+
+    Parameters
+    ----------
+    p : array_like, pint.Quantity
+        Pressure
+    T : array_like, pint.Quantity
+        Temperature
+    h : array_like, pint.Quantity
+        Enthalpy
+    s : array_like, pint.Quantity
+        Entropy
+    fluid : dict, ccp.Mixture
+        Dictionary with constituent and composition (mole fraction).
+        (e.g.: fluid={'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092})
+    EOS : str, optional
+        String with REFPROP, HEOS, PR or SRK.
+        Default is set in ccp.config.EOS
+        A tabulated EOS ('TABLE&<EOS>') is not interpolated, the states are
+        evaluated with its source EOS.
+
+    Returns
+    -------
+    state_array : ccp.StateArray
+
+    Examples
+    --------
+    >>> import ccp
+    >>> Q_ = ccp.Q_
+    >>> fluid = {'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092}
+    >>> states = ccp.StateArray(p=Q_([1, 2], 'bar'), T=300, fluid=fluid)
+    >>> states.rho()
+    <Quantity([1.16127325 2.32370891], 'kilogram / meter ** 3')>
+    """
+
+    _input_pairs = {
+        ("T", "p"): "PT",
+        ("h", "p"): "ph",
+        ("p", "s"): "ps",
+    }
+
+    @check_units
+    def __init__(self, p=None, T=None, h=None, s=None, fluid=None, EOS=None):
+        if fluid is None:
+            raise TypeError("A fluid is required. Provide as fluid=dict(...)")
+
+        inputs = {
+            k: np.atleast_1d(np.asarray(v.m, dtype=float))
+            for k, v in dict(p=p, T=T, h=h, s=s).items()
+            if v is not None
+        }
+        input_pair = self._input_pairs.get(tuple(sorted(inputs)))
+        if input_pair is None:
+            raise KeyError(f"Update key {list(inputs)} not implemented")
+        inputs = dict(zip(inputs, np.broadcast_arrays(*inputs.values())))
+        if _is_table_eos(EOS):
+            EOS = _source_eos(EOS)
+
+        # a single state is used as backend and flashed for each element
+        if inputs["p"].size:
+            first = {k: v.flat[0] for k, v in inputs.items()}
+            self._state = State(**first, fluid=fluid, EOS=EOS)
+        else:
+            self._state = State.__new__(State, fluid=fluid, EOS=EOS)
+            self._state._setup(fluid, EOS)
+        self.fluid = self._state.fluid
+        self.mixture = self._state.mixture
+        self.EOS = EOS
+        self.shape = inputs["p"].shape
+        self._viscosity = None
+
+        size = inputs["p"].size
+        values = {
+            k: np.empty(size) for k in ["p", "T", "h", "s", "rho", "cp", "speed_sound"]
+        }
+        state = self._state
+        for i in range(size):
+            try:
+                if input_pair == "PT":
+                    # consecutive elements are used as initial guess
+                    state._update_pt(inputs["p"].flat[i], inputs["T"].flat[i])
+                    state._set_guess()
+                elif input_pair == "ph":
+                    state.update(p=inputs["p"].flat[i], h=inputs["h"].flat[i])
+                else:
+                    state.update(p=inputs["p"].flat[i], s=inputs["s"].flat[i])
+            except ValueError as e:
+                element_inputs = {k: v.flat[i] for k, v in inputs.items()}
+                raise ValueError(
+                    f"Could not define state {i} with {element_inputs} and {self.fluid}"
+                ) from e
+
+            values["p"][i] = CP.AbstractState.p(state)
+            values["T"][i] = CP.AbstractState.T(state)
+            values["h"][i] = state.hmass()
+            values["s"][i] = state.smass()
+            values["rho"][i] = state.rhomass()
+            values["cp"][i] = state.cpmass()
+            try:
+                values["speed_sound"][i] = CP.AbstractState.speed_sound(state)
+            except ValueError:
+                # use the State fallback (e.g. REFPROP 9.1)
+                state._cache.clear()
+                values["speed_sound"][i] = state.speed_sound().m
+
+        # cp not converged, use REFPROP with forced gas condition for all at once
+        not_converged = values["cp"] < 0
+        if not_converged.any():
+            (values["cp"][not_converged],) = refprop_flash(
+                self.mixture,
+                "PTV",
+                "Cp",
+                values["p"][not_converged],
+                values["T"][not_converged],
+            )
+
+        self._values = {k: v.reshape(self.shape) for k, v in values.items()}
+        self._molar_mass = CP.AbstractState.molar_mass(state)
+        self._gas_constant = CP.AbstractState.gas_constant(state)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, item):
+        """Return the element as a ccp.State."""
+        return State(
+            p=self._values["p"][item],
+            T=self._values["T"][item],
+            fluid=self.mixture,
+            EOS=self.EOS,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(shape={self.shape}, fluid={self.fluid})"
+
+    def _quantity(self, values, base_units, units):
+        quantity = Q_(values, base_units)
+        if units:
+            quantity = quantity.to(units)
+        return quantity
+
+    def props_si(self, *names):
+        """Properties as arrays in SI units, as :py:meth:`ccp.State.props_si`.
+
+        The float functions of the polytropic methods (e.g.
+        ccp.point._head_pol) can be used with arrays of states.
+        """
+        return tuple(getattr(self, name)().magnitude for name in names)
+
+    def p(self, units=None):
+        """Pressure in Pascal."""
+        return self._quantity(self._values["p"], "pascal", units)
+
+    def T(self, units=None):
+        """Temperature in Kelvin."""
+        return self._quantity(self._values["T"], "kelvin", units)
+
+    def h(self, units=None):
+        """Specific Enthalpy (joule/kilogram)."""
+        return self._quantity(self._values["h"], "joule/kilogram", units)
+
+    def s(self, units=None):
+        """Specific entropy (joule/(kelvin kilogram))."""
+        return self._quantity(self._values["s"], "joule/(kelvin kilogram)", units)
+
+    def rho(self, units=None):
+        """Specific mass (kilogram/m**3)."""
+        return self._quantity(self._values["rho"], "kilogram/m**3", units)
+
+    def v(self, units=None):
+        """Specific volume (m**3/kilogram)."""
+        return self._quantity(1 / self._values["rho"], "m**3/kilogram", units)
+
+    def z(self, units=None):
+        """Compressibility (dimensionless)."""
+        z = (
+            self._values["p"]
+            * self._molar_mass
+            / (self._values["rho"] * self._gas_constant * self._values["T"])
+        )
+        return self._quantity(z, "dimensionless", units)
+
+    def cp(self, units=None):
+        """Specific heat at constant pressure joule/(kilogram kelvin)."""
+        return self._quantity(self._values["cp"], "joule/(kilogram kelvin)", units)
+
+    def speed_sound(self, units=None):
+        """Speed of sound (m/s)."""
+        return self._quantity(self._values["speed_sound"], "m/s", units)
+
+    def dew_point_margin(self, units=None):
+        """Margin between the temperature and the dew temperature (kelvin).
+
+        See :py:meth:`ccp.State.dew_point_margin`.
+        """
+        phase_envelope = get_phase_envelope(self.mixture, _source_eos(self.EOS))
+        margin = phase_envelope.dew_point_margin(self._values["p"], self._values["T"])
+        return self._quantity(margin, "kelvin", units)
+
+    def viscosity(self, units=None):
+        """Viscosity in pascal second.
+
+        Viscosity is calculated in a second pass on the first call, since it is
+        not needed by most callers and requires a REFPROP fallback for cubic EOS.
+        """
+        if self._viscosity is None:
+            state = self._state
+            viscosity = np.empty(self._values["p"].size)
+            for i, (p, T) in enumerate(
+                zip(self._values["p"].flat, self._values["T"].flat)
+            ):
+                CP.AbstractState.update(state, CP.PT_INPUTS, p, T)
+                try:
+                    viscosity[i] = CP.AbstractState.viscosity(state)
+                except ValueError:
+                    state._cache.clear()
+                    viscosity[i] = state.viscosity().m
+            self._viscosity = viscosity.reshape(self.shape)
+
+        return self._quantity(self._viscosity, "pascal second", units)
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -373,6 +374,18 @@ def test_save_and_load_straight(straight_through):
     assert straight_through == straight_through_loaded
 
 
+def test_pickle_straight(straight_through):
+    loaded = pickle.loads(pickle.dumps(straight_through))
+
+    assert loaded == straight_through
+    assert loaded.guarantee_point == straight_through.guarantee_point
+    assert loaded.test_points == straight_through.test_points
+    assert loaded.points_flange_sp == straight_through.points_flange_sp
+    assert loaded.speed == straight_through.speed
+    assert_allclose(loaded.head, straight_through.head)
+    assert hasattr(loaded, "head_plot")
+
+
 def test_point2sec():
     p = PointFirstSection(
         flow_m=Q_(4.325, "kg/s"),
@@ -1052,3 +1065,17 @@ def test_save_and_load(back_to_back):
     back_to_back_loaded = BackToBack.load(file)
 
     assert back_to_back == back_to_back_loaded
+
+
+def test_pickle_back_to_back(back_to_back):
+    back_to_back = BackToBack(**back_to_back, reynolds_correction=True)
+    loaded = pickle.loads(pickle.dumps(back_to_back))
+
+    assert loaded == back_to_back
+    assert loaded.guarantee_point_sec1 == back_to_back.guarantee_point_sec1
+    assert loaded.guarantee_point_sec2 == back_to_back.guarantee_point_sec2
+    assert loaded.test_points_sec1 == back_to_back.test_points_sec1
+    assert loaded.speed == back_to_back.speed
+    assert_allclose(loaded.k_end_seal, back_to_back.k_end_seal)
+    assert_allclose(loaded.k_div_wall, back_to_back.k_div_wall)
+    assert loaded.reynolds_correction
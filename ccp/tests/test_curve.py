@@ -38,6 +38,14 @@ def test_curve_disch_parameters(curve0):
     assert_allclose(curve0.disch.T(), np.array([370.0, 375.0]))
 
 
+def test_curve_state_properties(curve0):
+    props = curve0.disch.properties(["p", "T", "h"], units={"p": "bar"})
+    assert props["p"].units == "bar"
+    assert_allclose(props["p"], np.array([2.0, 2.5]))
+    assert_allclose(props["T"], curve0.disch.T())
+    assert_allclose(props["h"], curve0.disch.h())
+
+
 def test_curve_performance_parameters(curve0):
     assert curve0.head.units == "joule/kilogram"
     assert curve0.eff.units == ureg.dimensionless
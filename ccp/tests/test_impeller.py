@@ -846,7 +846,13 @@ def test_load_from_dict_isis():
 
 
 def test_pickle(imp0):
+    imp0.tag = "A"
     pickled_imp0 = pickle.loads(pickle.dumps(imp0))
+    assert pickled_imp0.tag == "A"
+    assert "curves" not in imp0.__getstate__()
     assert pickled_imp0 == imp0
     assert hasattr(imp0, "head_plot") is True
     assert hasattr(pickled_imp0, "head_plot") is True
+    assert_allclose(pickled_imp0.head, imp0.head)
+    assert_allclose(pickled_imp0.disch.p(), imp0.disch.p())
+    assert len(pickled_imp0.curves) == len(imp0.curves)
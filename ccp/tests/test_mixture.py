@@ -0,0 +1,72 @@
+import gc
+import pickle
+
+import pytest
+from numpy.testing import assert_allclose
+
+from ccp.mixture import Mixture, _MixtureCache
+
+
+def test_mixture_interned():
+    mix = Mixture({"methane": 0.9, "ethane": 0.1})
+    assert mix is Mixture({"METHANE": 0.9, "ETHANE": 0.1})
+    assert mix is Mixture(mix)
+    assert mix is not Mixture({"methane": 0.8, "ethane": 0.2})
+    assert hash(mix) == hash(Mixture({"Methane": 0.9, "Ethane": 0.1}))
+
+
+def test_mixture_order():
+    mix = Mixture({"methane": 0.9, "ethane": 0.1})
+    assert mix is Mixture({"ethane": 0.1, "methane": 0.9})
+    assert hash(mix) == hash(Mixture({"ETHANE": 0.1, "Methane": 0.9}))
+    # the constituents keep the order in which the mixture was first created
+    assert mix.constituents == ("METHANE", "ETHANE")
+
+
+def test_mixture_released():
+    fluid = {"methane": 0.123, "ethane": 0.877}
+    mix = Mixture(fluid)
+    key = tuple(fluid.items())
+    assert Mixture._instances[key] is mix
+    del mix
+    gc.collect()
+    assert key not in Mixture._instances
+
+
+def test_mixture_cache():
+    cache = _MixtureCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    # the least recently used entry is evicted
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_mixture_attributes():
+    mix = Mixture({"n2": 0.7812, "o2": 0.2096, "argon": 0.0092})
+    assert mix.constituents == ("NITROGEN", "OXYGEN", "ARGON")
+    assert mix.backend_string == "NITROGEN&OXYGEN&ARGON"
+    assert dict(mix) == dict(zip(mix.constituents, mix.fractions))
+    assert mix == {"NITROGEN": 0.7812, "OXYGEN": 0.2096, "ARGON": 0.0092}
+
+
+def test_mixture_normalized():
+    mix = Mixture({"methane": 49, "ethane": 49})
+    assert_allclose(mix.fractions, [0.5, 0.5])
+    assert_allclose(sum(mix.values()), 1)
+
+
+def test_mixture_pure_fluid():
+    assert dict(Mixture("methane")) == {"METHANE": 1.0}
+
+
+def test_mixture_repeated_components():
+    with pytest.raises(ValueError, match="repeated components"):
+        Mixture({"methane": 0.5, "METHANE": 0.5})
+
+
+def test_mixture_pickle():
+    mix = Mixture({"methane": 0.9, "ethane": 0.1})
+    assert pickle.loads(pickle.dumps(mix)) is mix
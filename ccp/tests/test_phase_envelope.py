@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import ccp
+from numpy.testing import assert_allclose
+from ccp.phase_envelope import PhaseEnvelope, get_phase_envelope, _envelopes
+from ccp.state import State, StateArray
+
+Q_ = ccp.Q_
+
+
+@pytest.fixture
+def fluid():
+    return {"METHANE": 0.8, "ETHANE": 0.15, "PROPANE": 0.05}
+
+
+def test_phase_envelope_dew_line(fluid):
+    phase_envelope = PhaseEnvelope.build(fluid, EOS="HEOS")
+    assert (phase_envelope.p_dew[1:] > phase_envelope.p_dew[:-1]).all()
+    # dew temperatures calculated with p-Q flashes
+    assert_allclose(
+        phase_envelope.T_dew_point([5e5, 2e6, 4e6]),
+        [207.061828, 233.650319, 246.440056],
+        rtol=1e-3,
+    )
+    # pressures outside the dew line
+    p_max = phase_envelope.p_dew[-1]
+    T_dew = phase_envelope.T_dew_point([1.1 * p_max, p_max, 1])
+    assert np.isnan(T_dew[[0, 2]]).all()
+    assert_allclose(T_dew[1], phase_envelope.T_dew[-1])
+
+
+def test_get_phase_envelope(fluid, tmp_path, monkeypatch):
+    monkeypatch.setattr(ccp.config, "PHASE_ENVELOPE_DIR", tmp_path)
+    _envelopes.clear()
+
+    phase_envelope = get_phase_envelope(fluid, EOS="HEOS")
+    assert get_phase_envelope(ccp.Mixture(fluid), EOS="HEOS") is phase_envelope
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    # loaded from disk in a new process
+    _envelopes.clear()
+    loaded = get_phase_envelope(fluid, EOS="HEOS")
+    assert loaded is not phase_envelope
+    assert_allclose(loaded.T_dew, phase_envelope.T_dew)
+    assert_allclose(loaded.p_dew, phase_envelope.p_dew)
+
+
+def test_dew_point_margin(fluid):
+    state = State(p=Q_(30, "bar"), T=Q_(30, "degC"), fluid=fluid, EOS="HEOS")
+    margin = state.dew_point_margin(
+        p=Q_([30, 40, 50], "bar"), T=Q_([10, 20, 30], "degC"), units="delta_degC"
+    )
+    assert margin.units == Q_(1, "delta_degC").units
+    assert_allclose(margin[0].m, state.dew_point_margin().m - 20)
+    assert_allclose(margin.m, [41.645429, 46.727497, 53.847063], rtol=1e-6)
+
+    states = StateArray(
+        p=Q_([30, 40, 50], "bar"), T=Q_([10, 20, 30], "degC"), fluid=fluid, EOS="HEOS"
+    )
+    assert_allclose(states.dew_point_margin(), margin.to("kelvin"))
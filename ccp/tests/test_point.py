@@ -1,10 +1,12 @@
 import pytest
+import numpy as np
 import ccp
 from numpy.testing import assert_allclose
 from ccp.point import *
 from pathlib import Path
 from tempfile import tempdir
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 skip = False  # skip slow tests
 
@@ -277,12 +279,271 @@ def test_head_reference_2017(suc_0, disch_0):
     assert_allclose(h, 82951.388465, rtol=1e-8)
 
 
+@pytest.mark.parametrize(
+    "func, expected",
+    [(head_reference, 82951.386575), (head_reference_2017, 82951.388465)],
+)
+def test_head_reference_adaptive(suc_0, disch_0, func, expected):
+    h, eff, info = func(suc_0, disch_0, rtol=1e-6, full_output=True)
+    assert h.units == "joule/kilogram"
+    assert_allclose(h, expected, rtol=1e-6)
+    assert info["error"] < 1e-6
+    assert info["num_steps"] < 100
+
+
+def test_head_reference_threads():
+    fluid = {"Methane": 1.0}
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid, EOS="HEOS")
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid, EOS="HEOS")
+    funcs = [head_reference, head_reference_2017] * 4
+    expected = [func(suc, disch, num_steps=10) for func in funcs]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda f: f(suc, disch, num_steps=10), funcs))
+
+    for (h, eff), (h_expected, eff_expected) in zip(results, expected):
+        assert_allclose(h, h_expected, rtol=1e-8)
+        assert_allclose(eff, eff_expected, rtol=1e-8)
+
+
 def test_head_pol_huntington(suc_0, disch_0):
     h = head_pol_huntington(suc_0, disch_0)
     assert h.units == "joule/kilogram"
     assert_allclose(h, 82951.470027, rtol=1e-6)
 
 
+@pytest.mark.parametrize(
+    "method", ["schultz", "mallen_saville", "sandberg_colby", "huntington"]
+)
+def test_polytropic_methods_float(suc_0, disch_0, method):
+    from ccp import point
+
+    head = getattr(point, f"head_pol_{method}")(suc_0, disch_0)
+    eff = getattr(point, f"eff_pol_{method}")(suc_0, disch_0)
+    assert head.units == "joule/kilogram"
+    assert eff.dimensionless
+    assert_allclose(
+        getattr(point, f"_head_pol_{method}")(suc_0, disch_0), head.m, rtol=1e-9
+    )
+    assert_allclose(
+        getattr(point, f"_eff_pol_{method}")(suc_0, disch_0), eff.m, rtol=1e-9
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(flow_v=1),
+        dict(flow_m=Q_(10, "kg/h"), power_losses=Q_(1, "kW")),
+        dict(
+            flow_v=1,
+            casing_area=5.5,
+            casing_temperature=Q_(20, "degC"),
+            ambient_temperature=Q_(5, "degC"),
+        ),
+        dict(flow_v=1, torque=3000),
+    ],
+)
+def test_units_mode_si_fast(monkeypatch, kwargs):
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid)
+    point_kws = dict(suc=suc, disch=disch, speed=Q_(7941, "RPM"), b=0.0285, D=0.365)
+    point = Point(**point_kws, **kwargs)
+    monkeypatch.setattr(ccp.config, "UNITS_MODE", "si-fast")
+    point_si = Point(**point_kws, **kwargs)
+
+    for attr in [
+        "head",
+        "eff",
+        "volume_ratio",
+        "flow_v",
+        "flow_m",
+        "phi",
+        "psi",
+        "power",
+        "power_losses",
+        "power_shaft",
+        "torque",
+        "reynolds",
+        "mach",
+    ]:
+        expected = getattr(point, attr)
+        actual = getattr(point_si, attr)
+        assert actual.units == expected.units
+        assert_allclose(actual.m, expected.m, rtol=1e-9)
+    if "casing_area" in kwargs:
+        assert_allclose(point_si.casing_heat_loss, point.casing_heat_loss)
+
+
+@pytest.mark.parametrize(
+    "polytropic_method", ["schultz", "mallen_saville", "sandberg_colby", "huntington"]
+)
+def test_units_mode_si_fast_methods(monkeypatch, polytropic_method):
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid)
+    point_kws = dict(
+        suc=suc,
+        disch=disch,
+        flow_v=1,
+        speed=Q_(7941, "RPM"),
+        b=0.0285,
+        D=0.365,
+        polytropic_method=polytropic_method,
+    )
+    point = Point(**point_kws)
+    monkeypatch.setattr(ccp.config, "UNITS_MODE", "si-fast")
+    point_si = Point(**point_kws)
+
+    assert_allclose(point_si.head.m, point.head.m, rtol=1e-9)
+    assert_allclose(point_si.eff.m, point.eff.m, rtol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "polytropic_method, kwargs",
+    [
+        ("schultz", dict(flow_v=Q_([1.0, 1.2], "m³/s"))),
+        ("mallen_saville", dict(flow_m=[8.0, 9.0], power_losses=Q_(1, "kW"))),
+        ("sandberg_colby", dict(flow_v=1)),
+        (
+            "huntington",
+            dict(
+                flow_v=1,
+                casing_area=5.5,
+                casing_temperature=Q_(20, "degC"),
+                ambient_temperature=Q_(5, "degC"),
+            ),
+        ),
+    ],
+)
+def test_point_array(polytropic_method, kwargs):
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    suc_p = Q_([1.839, 2.0], "bar")
+    suc_T = Q_([291.5, 300.0], "degK")
+    disch_p = Q_([5.902, 6.0], "bar")
+    disch_T = Q_([405.7, 410.0], "degK")
+    point_kws = dict(speed=Q_(7941, "RPM"), b=0.0285, D=0.365)
+    points = PointArray(
+        suc_p=suc_p,
+        suc_T=suc_T,
+        disch_p=disch_p,
+        disch_T=disch_T,
+        fluid=fluid,
+        polytropic_method=polytropic_method,
+        **point_kws,
+        **kwargs,
+    )
+    assert len(points) == 2
+
+    for i in range(len(points)):
+        point_kws.update(
+            {k: v[i] if np.ndim(getattr(v, "m", v)) else v for k, v in kwargs.items()}
+        )
+        point = Point(
+            suc=State(p=suc_p[i], T=suc_T[i], fluid=fluid),
+            disch=State(p=disch_p[i], T=disch_T[i], fluid=fluid),
+            polytropic_method=polytropic_method,
+            **point_kws,
+        )
+        for attr in [
+            "head",
+            "eff",
+            "volume_ratio",
+            "flow_v",
+            "flow_m",
+            "phi",
+            "psi",
+            "power",
+            "power_losses",
+            "power_shaft",
+            "torque",
+            "reynolds",
+            "mach",
+        ]:
+            expected = getattr(point, attr)
+            actual = getattr(points, attr)
+            assert actual.units == expected.units
+            assert_allclose(actual.m[i], expected.m, rtol=1e-9)
+
+    assert_allclose(points[1].head.m, points.head.m[1], rtol=1e-9)
+    # casing heat loss is also applied to the elements
+    assert_allclose(points[1].eff.m, points.eff.m[1], rtol=1e-9)
+
+    with pytest.raises(ValueError) as exc:
+        PointArray(
+            suc=points.suc,
+            disch=points.disch,
+            flow_v=1,
+            speed=1,
+            polytropic_method="foo",
+        )
+    assert "Polytropic method foo not available" in str(exc.value)
+
+
+def test_tiered_eos(monkeypatch):
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=Q_(20, "bar"), T=Q_(30, "degC"), fluid=fluid, EOS="HEOS")
+    head = Q_(80000, "J/kg")
+    eff = Q_(0.8, "dimensionless")
+    disch = disch_from_suc_head_eff(suc, head, eff)
+
+    monkeypatch.setattr(ccp.config, "TIERED_EOS", "PR")
+    solver_info_clear()
+    disch_tiered = disch_from_suc_head_eff(suc, head, eff)
+    assert disch_tiered.EOS == "HEOS"
+    info = solver_info()
+    assert info["PR"] > 0
+    assert info["HEOS"] < info["PR"]
+    # evaluations in other threads are counted separately
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(disch_from_suc_head_eff, suc, head, eff).result()
+    assert solver_info() == info
+    assert_allclose(disch_tiered.p(), disch.p(), rtol=1e-6)
+    assert_allclose(disch_tiered.T(), disch.T(), rtol=1e-6)
+
+
+def test_disch_from_suc_disch_T_head(monkeypatch):
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=Q_(20, "bar"), T=Q_(30, "degC"), fluid=fluid, EOS="HEOS")
+    disch_T = Q_(120, "degC")
+    head = Q_(80000, "J/kg")
+    disch = disch_from_suc_disch_T_head(suc, disch_T, head)
+
+    # baseline solver: newton over the pressure from an isentropic compression
+    expected = State(T=disch_T, s=suc.s(), fluid=fluid, EOS="HEOS")
+
+    def update_state(x):
+        expected.update(T=disch_T, p=x)
+        return (head_pol_schultz(suc, expected) - head).magnitude
+
+    newton(update_state, expected.p().magnitude, tol=1e-7)
+    assert_allclose(disch.p(), expected.p(), rtol=1e-9)
+    assert_allclose(disch.T(), disch_T.to("degK"))
+    assert_allclose(head_pol_schultz(suc, disch), head, rtol=1e-9)
+
+    monkeypatch.setattr(ccp.config, "TIERED_EOS", "PR")
+    disch_tiered = disch_from_suc_disch_T_head(suc, disch_T, head)
+    assert_allclose(disch_tiered.p(), expected.p(), rtol=1e-9)
+
+
+@pytest.mark.parametrize("func", [head_reference, head_reference_2017])
+def test_tiered_eos_reference(monkeypatch, func):
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=Q_(20, "bar"), T=Q_(30, "degC"), fluid=fluid, EOS="HEOS")
+    disch = State(p=Q_(50, "bar"), T=Q_(120, "degC"), fluid=fluid, EOS="HEOS")
+    head, eff = func(suc, disch, num_steps=10)
+
+    monkeypatch.setattr(ccp.config, "TIERED_EOS", "PR")
+    solver_info_clear()
+    head_tiered, eff_tiered = func(suc, disch, num_steps=10)
+    info = solver_info()
+    assert info["PR"] > 0
+    assert info["HEOS"] < info["PR"]
+    assert_allclose(head_tiered, head, rtol=1e-6)
+    assert_allclose(eff_tiered, eff, rtol=1e-6)
+
+
 def test_point_eff_polytropic(suc_0, disch_0):
     assert_allclose(eff_pol(suc_0, disch_0), 0.796499, rtol=1e-5)
 
@@ -519,6 +780,50 @@ def test_pickle(point_disch_flow_v_speed_suc):
     assert pickled_point == point_disch_flow_v_speed_suc
     assert hasattr(point_disch_flow_v_speed_suc, "head_plot") is True
     assert hasattr(pickled_point, "head_plot") is True
+    assert_allclose(pickled_point.disch.T_plot().data[0].y, pickled_point.disch.T().m)
+
+
+def test_plot_methods(point_disch_flow_v_speed_suc):
+    point = point_disch_flow_v_speed_suc
+    # plot methods are provided by the class and bound when accessed
+    assert "head_plot" not in point.__dict__
+    assert "T_plot" not in point.suc.__dict__
+    assert_allclose(point.head_plot().data[0].y, point.head.m)
+    assert_allclose(point.suc.T_plot().data[0].y, point.suc.T().m)
+    assert_allclose(point.disch.rho_plot().data[0].y, point.disch.rho().m)
+    assert hasattr(State(p=100000, T=300, fluid="methane"), "T_plot") is False
+
+
+def test_lazy_similarity_parameters():
+    fluid = {"Methane": 1.0}
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid)
+    point = Point(
+        suc=suc, disch=disch, flow_v=1, speed=Q_(7941, "RPM"), b=0.0285, D=0.365
+    )
+    assert "reynolds" not in point.__dict__
+    assert "mach" not in point.__dict__
+    assert_allclose(point.reynolds, reynolds(suc, point.speed, point.b, point.D))
+    assert_allclose(point.mach, mach(suc, point.speed, point.D))
+    assert point.reynolds_ratio.m == 1.0
+    assert point.mach_diff.m == 0.0
+
+    converted = Point.convert_from(
+        point,
+        suc=State(p=Q_(2, "bar"), T=300, fluid=fluid),
+        find="volume_ratio",
+        speed=Q_(8000, "RPM"),
+    )
+    assert "reynolds" not in converted.__dict__
+    pickled = pickle.loads(pickle.dumps(converted))
+    # pickling keeps the similarity parameters lazy
+    for attr in ["reynolds", "mach", "reynolds_ratio", "mach_diff"]:
+        assert attr not in converted.__dict__
+        assert attr not in pickled.__dict__
+    assert not any(isinstance(v, Point) for v in converted.__dict__.values())
+    for p in [converted, pickled]:
+        assert_allclose(p.reynolds_ratio, converted.reynolds / point.reynolds)
+        assert_allclose(p.mach_diff, converted.mach - point.mach)
 
 
 def test_global_polytropic_method(suc_0, disch_0):
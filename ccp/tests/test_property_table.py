@@ -0,0 +1,109 @@
+import pytest
+import ccp
+from numpy.testing import assert_allclose
+from ccp.property_table import PropertyTable, get_table, table_key, _tables
+from ccp.state import State
+
+
+@pytest.fixture
+def fluid():
+    return {"METHANE": 0.9, "ETHANE": 0.1}
+
+
+@pytest.fixture
+def table(fluid, tmp_path, monkeypatch):
+    monkeypatch.setattr(ccp.config, "TABLE_DIR", tmp_path)
+    _tables.clear()
+    with pytest.warns(UserWarning, match="Building a property table"):
+        return get_table(
+            fluid,
+            EOS="HEOS",
+            p_range=(1e5, 1e7),
+            T_range=(280, 450),
+            num_p=20,
+            num_T=20,
+            error_samples=5,
+        )
+
+
+def test_table_key():
+    key = table_key({"n2": 0.5, "methane": 0.5}, "HEOS")
+    assert key == table_key({"METHANE": 1.0, "Nitrogen": 1.0}, "HEOS")
+    assert key != table_key({"n2": 0.5, "methane": 0.5}, "PR")
+
+
+def test_table_error(table):
+    assert table.p_range == pytest.approx((1e5, 1e7))
+    assert table.T_range == pytest.approx((280, 450))
+    for prop, error in table.max_error.items():
+        assert error < 1e-3
+
+
+def test_table_state(fluid, table):
+    state = State(p=3e6, T=330, fluid=fluid, EOS="TABLE&HEOS")
+    state_heos = State(p=3e6, T=330, fluid=fluid, EOS="HEOS")
+    assert state._table_values is not None
+    for prop in ["h", "s", "rho", "z", "cp", "speed_sound"]:
+        assert_allclose(getattr(state, prop)(), getattr(state_heos, prop)(), rtol=1e-3)
+    # not tabulated properties are calculated with the source EOS
+    assert_allclose(state.viscosity(), state_heos.viscosity())
+
+    state.update(p=3e6, T=330)
+    state_ph = State(p=5e6, h=state.h(), fluid=fluid, EOS="TABLE&HEOS")
+    state_ps = State(p=5e6, s=state.s(), fluid=fluid, EOS="TABLE&HEOS")
+    assert state_ph._table_values is not None
+    assert state_ps._table_values is not None
+    assert_allclose(state_ph.h(), state.h())
+    assert_allclose(state_ps.s(), state.s())
+
+    # fallback to the source EOS outside the table
+    state_out = State(p=5e7, T=330, fluid=fluid, EOS="TABLE&HEOS")
+    state_out_heos = State(p=5e7, T=330, fluid=fluid, EOS="HEOS")
+    assert state_out._table_values is None
+    assert state_out.h() == state_out_heos.h()
+
+
+def test_table_save_load(fluid, table, tmp_path):
+    _tables.clear()
+    loaded = get_table(fluid, EOS="HEOS")
+    assert loaded is not table
+    assert loaded.max_error == table.max_error
+    assert_allclose(loaded.values, table.values)
+
+
+def test_table_grid_conflict(fluid, table, tmp_path):
+    assert get_table(fluid, EOS="HEOS", num_p=20, T_range=(280, 450)) is table
+    with pytest.raises(ValueError, match="different grid"):
+        get_table(fluid, EOS="HEOS", num_p=10)
+
+    # a saved table with a different grid is rebuilt
+    _tables.clear()
+    rebuilt = get_table(
+        fluid,
+        EOS="HEOS",
+        p_range=(1e5, 1e7),
+        T_range=(280, 450),
+        num_p=10,
+        num_T=10,
+        error_samples=2,
+    )
+    assert len(rebuilt.p) == 13
+    _tables.clear()
+    assert len(get_table(fluid, EOS="HEOS").p) == 13
+
+
+def test_table_solve_T_nan(fluid, table):
+    state = State(p=3e6, T=330, fluid=fluid, EOS="HEOS")
+    h = state.h().m
+    assert_allclose(table._solve_T(3e6, "h", h), 330, rtol=1e-4)
+
+    values = table.values.copy()
+    j = int(round((330 - table._y0) / table._dy))
+    table.values[:, :, j] = float("nan")
+    try:
+        # nodes around the value are missing, nodes far from it can be used
+        assert table._solve_T(3e6, "h", h) is None
+        h_high = State(p=3e6, T=420, fluid=fluid, EOS="HEOS").h().m
+        assert_allclose(table._solve_T(3e6, "h", h_high), 420, rtol=1e-4)
+    finally:
+        table.values[:] = values
@@ -1,6 +1,7 @@
 import pytest
 import pickle
 import ccp
+from concurrent.futures import ThreadPoolExecutor
 from ccp.state import *
 from numpy.testing import assert_allclose
 
@@ -11,6 +12,18 @@ def test_state_possible_name():
     assert "Fluid fake_name not available." in str(exc.value)
 
 
+def test_fluid_name_lookup():
+    from ccp.config.fluids import get_fluid_name, get_name
+
+    assert get_fluid_name("METHANE") == "Methane"
+    assert get_fluid_name("iso-butane") == "IsoButane"
+    assert get_fluid_name("H2S") == "HydrogenSulfide"
+    assert get_name("co2") == "CO2"
+    assert "n-Propane" in ccp.fluid_list
+    assert "propane" in ccp.fluid_list["n-Propane"].possible_names
+    assert len(ccp.fluid_list) == len(list(ccp.fluid_list.keys()))
+
+
 def test_state():
     with pytest.raises(TypeError) as exc:
         State(p=100000, T=300)
@@ -305,6 +318,18 @@ def test_pickle():
     assert pickle.loads(pickle.dumps(state)) == state
 
 
+@pytest.mark.parametrize("EOS", ["HEOS", "PR"])
+def test_pickle_compact(EOS):
+    state = State(p=2e6, h=500000, fluid={"Methane": 0.9, "Ethane": 0.1}, EOS=EOS)
+    pickled_state = pickle.loads(pickle.dumps(state))
+    assert pickled_state.EOS == EOS
+    assert pickled_state.mixture is state.mixture
+    assert_allclose(pickled_state.p(), state.p())
+    assert_allclose(pickled_state.h(), state.h())
+    assert_allclose(pickled_state.speed_sound(), state.speed_sound())
+    assert repr(pickled_state) == repr(state)
+
+
 def test_improved_error_message():
     with pytest.raises(ValueError) as exc:
         ccp.State(p=100000, T=20, fluid={"methane": 1 - 1e-15, "ethane": 1e-15})
@@ -371,3 +396,304 @@ def test_normalization():
 
         # no negative values
         assert suc0.fluid[k] >= 0.0
+
+
+def test_state_array():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    p = Q_([1, 2, 3], "bar")
+    T = Q_([300, 310, 320], "degK")
+    states = StateArray(p=p, T=T, fluid=fluid)
+
+    assert len(states) == 3
+    assert states.p().units == "pascal"
+    assert states.rho().units == "kilogram/meter**3"
+    assert_allclose(states.z("percent").m, 100 * states.z().m)
+    attrs = ["p", "T", "h", "s", "rho", "v", "z", "cp", "speed_sound", "viscosity"]
+    for i in range(len(states)):
+        state = State(p=p[i], T=T[i], fluid=fluid)
+        assert states[i] == state
+        for attr in attrs:
+            assert_allclose(
+                getattr(states, attr)().m[i], getattr(state, attr)().m, rtol=1e-9
+            )
+
+    states_ph = StateArray(p=states.p(), h=states.h(), fluid=fluid)
+    assert_allclose(states_ph.T().m, T.m)
+    states_ps = StateArray(p=states.p(), s=states.s(), fluid=fluid)
+    assert_allclose(states_ps.T().m, T.m, rtol=1e-6)
+
+    empty = StateArray(p=Q_([], "bar"), T=Q_([], "degK"), fluid=fluid)
+    assert len(empty) == 0
+    for attr in attrs:
+        assert getattr(empty, attr)().m.shape == (0,)
+
+
+def test_refprop_flash():
+    fluid = {"CarbonDioxide": 0.9, "Methane": 0.1}
+    p = np.array([7e6, 8e6, 9e6])
+    T = 305.0
+    cp, rho = refprop_flash(fluid, "PTV", "Cp,D", p, T)
+    assert cp.shape == (3,)
+    for i in range(3):
+        state = State(p=p[i], T=T, fluid=fluid, EOS="REFPROP")
+        assert_allclose(cp[i], state.cp().m, rtol=1e-6)
+        assert_allclose(rho[i], state.rho().m, rtol=1e-6)
+
+    s = State(p=p[0], T=T, fluid=fluid, EOS="REFPROP").s().m
+    p_calc, T_calc = refprop_flash(fluid, "DSV", "P,T", rho[0], s)
+    assert_allclose(p_calc, p[0], rtol=1e-6)
+    assert_allclose(T_calc, T, rtol=1e-6)
+
+    # elements not calculated are nan
+    (cp,) = refprop_flash(fluid, "PTV", "Cp", [-1.0, 7e6], T)
+    assert np.isnan(cp[0])
+    assert_allclose(cp[1], refprop_flash(fluid, "PTV", "Cp", 7e6, T)[0])
+
+
+def test_state_mixture():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    state_0 = State(p=100000, T=300, fluid=fluid)
+    assert state_0.mixture is ccp.Mixture(fluid)
+    assert state_0._fluid == "METHANE&ETHANE"
+    state_1 = State(p=200000, T=300, fluid=state_0.mixture)
+    assert state_1.mixture is state_0.mixture
+    assert state_1.fluid == state_0.fluid == {"METHANE": 0.5, "ETHANE": 0.5}
+
+
+def test_property_cache():
+    state = State(p=100000, T=300, fluid={"Methane": 0.5, "Ethane": 0.5})
+    State.cache_info_clear()
+    h0 = state.h()
+    assert State.cache_info() == {"hits": 0, "misses": 1}
+    assert state.h() is h0
+    assert_allclose(state.h("kJ/kg"), h0.to("kJ/kg"))
+    assert State.cache_info() == {"hits": 2, "misses": 1}
+
+    # cache is cleared when the state is updated
+    state.update(p=200000, T=350)
+    h1 = state.h()
+    assert h1 != h0
+    assert_allclose(h1.m, state.hmass())
+    assert State.cache_info()["misses"] == 2
+
+    # the counters are kept for each thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(State.cache_info).result() == {"hits": 0, "misses": 0}
+    assert State.cache_info()["misses"] == 2
+
+
+def test_props_si():
+    state = State(p=100000, T=300, fluid={"Methane": 0.5, "Ethane": 0.5})
+    p, T, h, rho = state.props_si("p", "T", "h", "rho")
+    assert isinstance(h, float)
+    assert p == state.p().m
+    assert T == state.T().m
+    assert h == state.h().m
+    assert rho == state.rho().m
+
+
+def test_properties():
+    state = State(p=100000, T=300, fluid={"Methane": 0.5, "Ethane": 0.5})
+    state_1 = State(p=100000, T=300, fluid={"Methane": 0.5, "Ethane": 0.5})
+    props = state.properties()
+    assert list(props) == [
+        "p",
+        "T",
+        "h",
+        "s",
+        "rho",
+        "z",
+        "cp",
+        "speed_sound",
+        "viscosity",
+    ]
+    for name, value in props.items():
+        assert value == getattr(state_1, name)()
+        assert value.units == getattr(state_1, name)().units
+    props = state.properties(["p", "T"], units={"p": "bar", "T": "degC"})
+    assert_allclose(props["p"].m, 1.0)
+    assert_allclose(props["T"].m, 26.85)
+
+
+def test_warm_start():
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    warm_start = ccp.config.WARM_START
+    try:
+        ccp.config.WARM_START = True
+        state_cold = State(p=5e6, T=320, fluid=fluid, EOS="HEOS")
+        state_warm = State(p=5e6, T=320, fluid=fluid, EOS="HEOS")
+        # the reference state of the p-h and p-s solvers is flashed once
+        State(p=5e6, h=state_cold.h(), fluid=fluid, EOS="HEOS")
+
+        ccp.config.WARM_START = False
+        state_cold.update(p=5.2e6, T=325)
+        State.flash_info_clear()
+        ccp.config.WARM_START = True
+        state_warm.update(p=5.2e6, T=325)
+        assert State.flash_info() == {"warm": 1, "cold": 0}
+        assert_allclose(state_warm.rho(), state_cold.rho(), rtol=1e-8)
+        assert_allclose(state_warm.h(), state_cold.h(), rtol=1e-8)
+
+        # p-h and p-s solved with warm started p-T flashes
+        h = state_cold.h() + Q_(5, "kJ/kg")
+        state_warm.update(p=5.3e6, h=h)
+        ccp.config.WARM_START = False
+        state_cold.update(p=5.3e6, h=h)
+        assert_allclose(state_warm.T(), state_cold.T(), rtol=1e-9)
+        assert_allclose(state_warm.h(), h, rtol=1e-9)
+        assert State.flash_info()["cold"] == 0
+    finally:
+        ccp.config.WARM_START = warm_start
+
+
+def test_warm_start_lazy_envelope():
+    fluid = {"Methane": 0.95, "Ethane": 0.05}
+    warm_start = ccp.config.WARM_START
+    try:
+        ccp.config.WARM_START = True
+        state = State(p=5e6, T=320, fluid=fluid, EOS="HEOS")
+        # the phase envelope is only built when a flash is warm started
+        assert state.mixture not in ccp.state._warm_start_dew_lines
+        State.flash_info_clear()
+        state.update(p=5.2e6, T=325)
+        assert state.mixture in ccp.state._warm_start_dew_lines
+        assert State.flash_info() == {"warm": 1, "cold": 0}
+    finally:
+        ccp.config.WARM_START = warm_start
+
+
+def test_warm_start_dew_line():
+    fluid = {"Methane": 0.8, "Ethane": 0.1, "Propane": 0.07, "nButane": 0.03}
+    p = 40e5
+    T_dew = State(p=p, T=300, fluid=fluid, EOS="HEOS").phase_envelope().T_dew_point(p)
+
+    warm_start = ccp.config.WARM_START
+    try:
+        ccp.config.WARM_START = True
+        state = State(p=p, T=T_dew + 15, fluid=fluid, EOS="HEOS")
+        State.flash_info_clear()
+        # crossing the dew line is not warm started
+        state.update(p=p, T=T_dew - 10)
+        assert State.flash_info() == {"warm": 0, "cold": 1}
+        state_cold = State(p=p, T=T_dew - 10, fluid=fluid, EOS="HEOS")
+        assert_allclose(state.Q(), state_cold.Q())
+        assert 0 < state.Q() < 1
+        assert_allclose(state.h(), state_cold.h(), rtol=1e-9)
+    finally:
+        ccp.config.WARM_START = warm_start
+
+
+@pytest.mark.parametrize("EOS", ["HEOS", "PR", "SRK"])
+def test_ps_update(EOS):
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=2e6, T=300, fluid=fluid, EOS=EOS)
+    disch = State(p=6e6, s=suc.s(), fluid=fluid, EOS=EOS)
+    assert_allclose(disch.p(), 6e6)
+    assert_allclose(disch.s(), suc.s(), rtol=1e-9)
+
+    # update from an existing state
+    disch.update(p=8e6, s=suc.s())
+    assert_allclose(disch.s(), suc.s(), rtol=1e-9)
+    assert disch.T() > Q_(383, "degK")
+
+
+@pytest.mark.parametrize("EOS", ["PR", "SRK"])
+def test_hs_update_cubic(EOS):
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=2e6, T=300, fluid=fluid, EOS=EOS)
+    reference = State(p=6e6, s=suc.s(), fluid=fluid, EOS=EOS)
+    disch = State(h=reference.h(), s=suc.s(), fluid=fluid, EOS=EOS)
+    assert_allclose(disch.p(), reference.p(), rtol=1e-5)
+    assert_allclose(disch.T(), reference.T(), rtol=1e-5)
+
+
+@pytest.mark.parametrize("warm_start", [True, False])
+def test_update_solver_start(warm_start):
+    # p-h and p-s updates give the same state from any previous state
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=2e6, T=300, fluid=fluid, EOS="HEOS")
+    h, s = suc.props_si("h", "s")
+
+    ws = ccp.config.WARM_START
+    try:
+        ccp.config.WARM_START = warm_start
+        results = []
+        for T in [250, 300, 450]:
+            state = State(p=3e6, T=T, fluid=fluid, EOS="HEOS")
+            state.update(p=2e6, h=h)
+            results_h = state.props_si("T", "rho")
+            state.update(p=6e6, s=s)
+            results.append(results_h + state.props_si("T", "rho"))
+        assert results[0] == results[1] == results[2]
+        assert_allclose(results[0][0], 300)
+    finally:
+        ccp.config.WARM_START = ws
+
+
+def test_scratch():
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    suc = State(p=2e6, T=300, fluid=fluid)
+    State.scratch_info_clear()
+
+    with suc.scratch() as state_0:
+        state_0.update(p=6e6, s=suc.s())
+        T0 = state_0.T()
+        # nested checkouts use distinct states
+        with suc.scratch() as state_1:
+            assert state_1 is not state_0
+        # leave the state at another condition
+        state_0.update(p=1e6, T=400)
+    assert State.scratch_info() == {"created": 2, "reused": 0}
+
+    with suc.scratch() as state_2:
+        assert state_2 is state_0
+        # the result does not depend on the previous use of the state
+        state_2.update(p=6e6, s=suc.s())
+        assert state_2.T() == T0
+    assert State.scratch_info() == {"created": 2, "reused": 1}
+
+
+def test_transport_state():
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    TRANSPORT_EOS = ccp.config.TRANSPORT_EOS
+    ccp.config.TRANSPORT_EOS = "HEOS"
+    try:
+        state_0 = State(p=2e6, T=300, fluid=fluid, EOS="PR")
+        state_1 = State(p=3e6, T=320, fluid=fluid, EOS="PR")
+        reference = State(p=3e6, T=320, fluid=fluid, EOS="HEOS")
+
+        state_0.viscosity()
+        transport_state = state_0._transport_state()
+        assert_allclose(state_1.viscosity(), reference.viscosity())
+        assert_allclose(state_1.conductivity(), reference.conductivity())
+        # companion state is reused for the same fluid
+        assert state_1._transport_state() is transport_state
+    finally:
+        ccp.config.TRANSPORT_EOS = TRANSPORT_EOS
+
+
+def test_lazy_state():
+    fluid = {"Methane": 0.9, "Ethane": 0.1}
+    state = State(p=2e6, T=300, fluid=fluid, lazy=True)
+    assert state._pending is not None
+
+    # pickling keeps the state lazy
+    state_pickled = pickle.loads(pickle.dumps(state))
+    assert state._pending is not None
+    assert state_pickled._pending is not None
+
+    eager = State(p=2e6, T=300, fluid=fluid)
+    assert_allclose(state.rho(), eager.rho())
+    assert state._pending is None
+    assert_allclose(state_pickled.properties(["h"])["h"], eager.h())
+
+    # an update replaces the pending inputs
+    state = State(p=2e6, T=300, fluid=fluid, lazy=True)
+    state.update(p=3e6, T=320)
+    assert_allclose(state.p(), 3e6)
+
+
+def test_lazy_state_error():
+    state = State(p=2e6, T=-1, fluid={"Methane": 0.9, "Ethane": 0.1}, lazy=True)
+    with pytest.raises(ValueError):
+        state.rho()
@@ -261,3 +261,22 @@ def test_unit_Q_conversion(auxiliary_function):
     results_dict = {k: v for k, v in zip(arguments.keys(), results)}
     for arg, actual in results_dict.items():
         assert_allclose(actual, arguments[arg].expected_converted_value)
+
+
+def test_check_units_args():
+    @check_units
+    def func(p, T=None, speed_units=None, **kwargs):
+        return p, T, speed_units, kwargs
+
+    p, T, speed_units, kwargs = func(1, Q_(1, "degC"), "RPM", flow_v=1, other=1)
+    assert p.units == "pascal"
+    assert_allclose(T.to("degK").m, 274.15)
+    assert speed_units == "RPM"
+    assert kwargs["flow_v"].units == "meter**3/second"
+    assert kwargs["other"] == 1
+
+    # quantities already in the base unit are passed without conversion
+    p = Q_(1, "pascal")
+    assert func(p)[0] is p
+    assert func(p=p)[0] is p
+    assert func(None)[0] is None
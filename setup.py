@@ -62,7 +62,7 @@ setup(
     },
     include_package_data=True,
     package_data={"ccp.config": ["new_units.txt"], "ccp.tests.data": ["*"]},
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=REQUIRES,
     extras_require={
         "dev": [